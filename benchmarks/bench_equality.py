@@ -0,0 +1,234 @@
+"""
+Benchmarks for the equality module, run from the benchmarks directory with;
+
+pytest
+
+Results for each run are saved as json in the .benchmarks directory.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import test_aide.equality as eh
+
+
+@functools.lru_cache(maxsize=None)
+def _nested(depth, width):
+    """Nested dict of lists structure with width**depth leaf values."""
+
+    if depth == 1:
+
+        return [float(i) for i in range(width)]
+
+    return {f"key_{i}": [_nested(depth - 1, width)] for i in range(width)}
+
+
+@functools.lru_cache(maxsize=None)
+def _records(n_rows):
+    """List of n_rows homogeneous record dicts."""
+
+    return [{"id": i, "name": f"name_{i}", "value": i / 3} for i in range(n_rows)]
+
+
+@functools.lru_cache(maxsize=None)
+def _array(n, with_nan):
+
+    array = np.random.default_rng(0).random(n)
+
+    if with_nan:
+
+        array[::10] = np.nan
+
+    return array
+
+
+@functools.lru_cache(maxsize=None)
+def _frame(n_rows, n_columns):
+
+    rng = np.random.default_rng(0)
+
+    return pd.DataFrame(
+        rng.random((n_rows, n_columns)), columns=[f"c{i}" for i in range(n_columns)]
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _text_frame(n_rows, dtype):
+    """Frame of two high cardinality text columns of dtype."""
+
+    rng = np.random.default_rng(0)
+
+    words = np.array([f"word_{i}" for i in range(n_rows // 10)], dtype=object)
+
+    return pd.DataFrame(
+        {name: words[rng.integers(0, len(words), n_rows)] for name in ["a", "b"]},
+        dtype=dtype,
+    )
+
+
+def _copy(obj):
+    """Deep copy of a nested structure, so actual and expected do not share objects."""
+
+    if isinstance(obj, dict):
+
+        return {k: _copy(v) for k, v in obj.items()}
+
+    if isinstance(obj, list):
+
+        return [_copy(v) for v in obj]
+
+    return obj
+
+
+def _make_last_leaf_different(obj):
+    """Change the last leaf value of a nested structure."""
+
+    while True:
+
+        if isinstance(obj, dict):
+
+            obj = obj[list(obj.keys())[-1]]
+
+        elif isinstance(obj[-1], (dict, list)):
+
+            obj = obj[-1]
+
+        else:
+
+            obj[-1] = -1.0
+
+            return
+
+
+def _run_failing(function, *args):
+
+    with pytest.raises(AssertionError):
+
+        function(*args)
+
+
+NESTED_SIZES = [
+    pytest.param(1, 1_000, id="depth 1 width 1000"),
+    pytest.param(1, 100_000, id="depth 1 width 100000"),
+    pytest.param(3, 10, id="depth 3 width 10"),
+    pytest.param(3, 50, id="depth 3 width 50"),
+    pytest.param(5, 10, id="depth 5 width 10"),
+]
+
+FRAME_SIZES = [
+    pytest.param(1_000, 10, id="1K rows 10 columns"),
+    pytest.param(100_000, 10, id="100K rows 10 columns"),
+    pytest.param(1_000, 500, id="1K rows 500 columns"),
+    pytest.param(10_000_000, 10, id="10M rows 10 columns", marks=pytest.mark.large),
+    pytest.param(1_000, 5_000, id="1K rows 5000 columns", marks=pytest.mark.large),
+]
+
+ARRAY_SIZES = [
+    pytest.param(1_000, id="1K"),
+    pytest.param(1_000_000, id="1M"),
+    pytest.param(100_000_000, id="100M", marks=pytest.mark.large),
+]
+
+
+@pytest.mark.parametrize("depth, width", NESTED_SIZES)
+def bench_nested_equal(benchmark, depth, width):
+
+    expected = _nested(depth, width)
+    actual = _copy(expected)
+
+    benchmark(eh.assert_equal_dispatch, expected, actual, "nested")
+
+
+@pytest.mark.parametrize("depth, width", NESTED_SIZES)
+def bench_nested_not_equal(benchmark, depth, width):
+
+    expected = _nested(depth, width)
+    actual = _copy(expected)
+    _make_last_leaf_different(actual)
+
+    benchmark(_run_failing, eh.assert_equal_dispatch, expected, actual, "nested")
+
+
+@pytest.mark.parametrize("n_rows", [1_000, 100_000])
+def bench_records_equal(benchmark, n_rows):
+
+    expected = _records(n_rows)
+    actual = _copy(expected)
+
+    benchmark(eh.assert_equal_dispatch, expected, actual, "records")
+
+
+@pytest.mark.parametrize("with_nan", [False, True], ids=["no nan", "nan"])
+@pytest.mark.parametrize("n", ARRAY_SIZES)
+def bench_array_equal(benchmark, n, with_nan):
+
+    expected = _array(n, with_nan)
+    actual = expected.copy()
+
+    benchmark(eh.assert_equal_dispatch, expected, actual, "array")
+
+
+@pytest.mark.parametrize("with_nan", [False, True], ids=["no nan", "nan"])
+@pytest.mark.parametrize("n", ARRAY_SIZES)
+def bench_array_not_equal(benchmark, n, with_nan):
+
+    expected = _array(n, with_nan)
+    actual = expected.copy()
+    actual[-1] = -1.0
+
+    benchmark(_run_failing, eh.assert_equal_dispatch, expected, actual, "array")
+
+
+@pytest.mark.parametrize("n_rows, n_columns", FRAME_SIZES)
+def bench_frame_equal(benchmark, n_rows, n_columns):
+
+    expected = _frame(n_rows, n_columns)
+    actual = expected.copy()
+
+    benchmark(eh.assert_equal_dispatch, expected, actual, "frame")
+
+
+@pytest.mark.parametrize("n_rows, n_columns", FRAME_SIZES)
+def bench_frame_equal_with_kwargs(benchmark, n_rows, n_columns):
+
+    expected = _frame(n_rows, n_columns)
+    actual = expected.copy()
+
+    benchmark(eh.assert_frame_equal_msg, actual, expected, "frame", check_exact=True)
+
+
+@pytest.mark.parametrize("n_rows, n_columns", FRAME_SIZES)
+def bench_frame_not_equal(benchmark, n_rows, n_columns):
+
+    expected = _frame(n_rows, n_columns)
+    actual = expected.copy()
+    actual.iloc[-1, -1] = -1.0
+
+    benchmark(_run_failing, eh.assert_equal_dispatch, expected, actual, "frame")
+
+
+@pytest.mark.parametrize("dtype", ["object", "category", "string[pyarrow]"])
+@pytest.mark.parametrize("n_rows", [1_000, 1_000_000])
+def bench_text_frame_equal(benchmark, n_rows, dtype):
+
+    if dtype == "string[pyarrow]":
+
+        pytest.importorskip("pyarrow")
+
+    expected = _text_frame(n_rows, dtype)
+    actual = expected.copy()
+
+    benchmark(eh.assert_equal_dispatch, expected, actual, "frame")
+
+
+@pytest.mark.parametrize("n_pairs", [1_000, 10_000])
+def bench_frame_pairs_equal(benchmark, n_pairs):
+
+    frame = _frame(n_pairs, 3)
+
+    pairs = [(frame.iloc[[i]].copy(), frame.iloc[[i]].copy()) for i in range(n_pairs)]
+
+    benchmark(eh.assert_frame_pairs_equal_msg, pairs, "pairs")
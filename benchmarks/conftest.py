@@ -0,0 +1,26 @@
+import pytest
+
+
+def pytest_addoption(parser):
+
+    parser.addoption(
+        "--run-large",
+        action="store_true",
+        default=False,
+        help="run benchmarks marked as large",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+
+    if config.getoption("--run-large"):
+
+        return
+
+    skip_large = pytest.mark.skip(reason="large benchmark, use --run-large to run")
+
+    for item in items:
+
+        if "large" in item.keywords:
+
+            item.add_marker(skip_large)
@@ -31,11 +31,11 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     packages=setuptools.find_packages(),
     install_requires=list_reqs(),
-    python_requires=">=3.6",
+    python_requires=">=3.7",
+    entry_points={"pytest11": ["test_aide = test_aide.plugin"]},
     classifiers=[
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Operating System :: OS Independent",
@@ -1,14 +1,57 @@
+import importlib
+import importlib.util
+
 from ._version import __version__
 
-from . import classes
-from . import functions
+# submodules are only imported when first accessed as attributes of the package, so
+# that importing test_aide does not import pandas, numpy or pytest_mock up front
+_submodules = [
+    "classes",
+    "functions",
+    "equality",
+    "frames",
+    "metrics",
+    "pandas",
+    "files",
+    "sql",
+]
+
+# third party libraries that must be installed for each submodule to be available
+_submodule_requirements = {
+    "frames": ["pandas", "numpy"],
+    "pandas": ["pandas", "numpy"],
+    "files": ["pandas", "numpy"],
+}
+
+
+def _submodule_available(name):
+    """Check if the libraries required by a submodule are installed, without importing them."""
+
+    return all(
+        importlib.util.find_spec(library) is not None
+        for library in _submodule_requirements.get(name, [])
+    )
+
+
+def __getattr__(name):
+
+    if name in _submodules and _submodule_available(name):
+
+        try:
+
+            return importlib.import_module(f".{name}", __name__)
+
+        except ImportError as err:
+
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from err
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-try:
-    from . import equality
-except ImportError:
-    pass
+def __dir__():
 
-try:
-    from . import pandas
-except ImportError:
-    pass
+    return sorted(
+        set(globals()) | set(name for name in _submodules if _submodule_available(name))
+    )
@@ -0,0 +1,117 @@
+"""
+Command line interface for test-aide, run with python -m test_aide.
+
+Currently there is a single command, compare, that compares every file in two
+directories (e.g. the output of a pipeline against a reference run) with
+files.compare_directories, printing the result for each file as it finishes and a
+summary at the end. The exit status is 0 if all files are equal, 1 if there are any
+differences and 2 for invalid arguments.
+
+"""
+
+import argparse
+import sys
+
+
+def main(argv=None):
+    """Run the command line interface with the given arguments (sys.argv[1:] if None),
+    returning the exit status.
+    """
+
+    parser = _parser()
+
+    args = parser.parse_args(argv)
+
+    return args.command(parser, args)
+
+
+def _parser():
+
+    parser = argparse.ArgumentParser(
+        prog="python -m test_aide", description="test-aide command line interface"
+    )
+
+    subparsers = parser.add_subparsers(required=True, metavar="command")
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="compare the files in two directories",
+        description="Compare the files in two directories, matched by relative path. Parquet, "
+        "CSV, JSON lines and .npy files with different content are read and compared with "
+        "test-aide, other files are compared by content only.",
+    )
+
+    compare_parser.add_argument("actual_dir", help="directory of files to check")
+
+    compare_parser.add_argument(
+        "expected_dir", help="directory of reference files to compare against"
+    )
+
+    compare_parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="number of processes to compare files in (default: number of CPUs)",
+    )
+
+    compare_parser.add_argument(
+        "--quiet",
+        action="store_true",
+        default=False,
+        help="only print files that are not equal and the summary",
+    )
+
+    compare_parser.set_defaults(command=_compare)
+
+    return parser
+
+
+def _compare(parser, args):
+    """Run the compare command, returning the exit status."""
+
+    try:
+
+        from test_aide import files
+
+    except ImportError as err:
+
+        parser.error(str(err))
+
+    try:
+
+        results = files.compare_directories(
+            args.actual_dir, args.expected_dir, processes=args.processes
+        )
+
+        counts = dict.fromkeys(files._FILE_STATUSES, 0)
+
+        for path, status, message in results:
+
+            counts[status] += 1
+
+            if args.quiet and status in ("identical", "equal"):
+
+                continue
+
+            print(f"{status:<9}  {path}", flush=True)
+
+            if message is not None:
+
+                for line in message.split("\n"):
+
+                    print(f"           {line}", flush=True)
+
+    except ValueError as err:
+
+        parser.error(str(err))
+
+    summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+
+    print(f"compared {sum(counts.values())} files: {summary}", flush=True)
+
+    return 0 if counts["identical"] + counts["equal"] == sum(counts.values()) else 1
+
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -1,12 +1,17 @@
 """
 This module contains helper functions that deal with classes and the methods and
 attributes of objects.
+
+The package is loaded early by pytest as a plugin, PYTEST_DONT_REWRITE stops pytest
+rewriting the asserts in this module so the assert messages are not changed.
 """
 
 import inspect
+from test_aide import metrics
 from test_aide.equality import assert_equal_dispatch
 
 
+@metrics.recorded("classes.check_is_class")
 def check_is_class(class_to_check):
     """Raises type error if class_to_check is not a class.
 
@@ -24,6 +29,7 @@ def check_is_class(class_to_check):
         raise TypeError(f"{class_to_check} is not a valid class")
 
 
+@metrics.recorded("classes.assert_inheritance")
 def assert_inheritance(obj, cls):
     """Asserts whether an object inherits from a particular class.
 
@@ -46,6 +52,7 @@ def assert_inheritance(obj, cls):
     ), f"Incorrect inheritance - passed obj of class {obj.__class__.__name__} is not an instance of {cls}"
 
 
+@metrics.recorded("classes.test_object_method")
 def test_object_method(obj, expected_method, msg):
     """Test that a particular object has a given method and the (method) attribute is callable.
 
@@ -77,6 +84,7 @@ def test_object_method(obj, expected_method, msg):
     ), f"{expected_method} on obj is not callable"
 
 
+@metrics.recorded("classes.test_object_attributes")
 def test_object_attributes(obj, expected_attributes, msg):
     """Check a particular object has given attributes.
 
@@ -3,31 +3,156 @@ This module contains helper functions that simplify asserting equality for types
 where it is not possible to simply assert a == b (e.g. pandas.DataFrame) or
 nested data structures containing these types.
 
-Note, if pandas or numpy is not available when the module is imported then the
+Note, if pandas, numpy or scipy is not available when the module is imported then the
 functionality of the assert_equal_dispatch will change - so as not to try and
 check types from the libraries that are not available.
 
+None of pandas, numpy or scipy is imported when this module is imported. Their availability
+is checked without importing them and they are only imported when first used. Until
+a library has been imported by some other code no objects of its types can exist, so
+assert_equal_dispatch does not import a library just to check types against it.
+
+The comparisons of whole DataFrames (e.g. assert_frame_rows_equal_msg or
+assert_frame_profile_msg) are in the frames module. They are also available from this
+module, and the frames module is only imported when one of them is first accessed.
+
+The package is loaded early by pytest as a plugin, PYTEST_DONT_REWRITE stops pytest
+rewriting the asserts in this module so the assert messages are not changed.
+
 """
 
-try:
+import bisect
+import difflib
+import importlib
+import importlib.util
+import itertools
+import math
+import operator
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from test_aide import metrics
+
+
+class _LazyModule:
+    """Placeholder for an optional library that imports the library on first attribute
+    access and then replaces itself with the library in this module's globals.
+    """
+
+    def __init__(self, name, alias):
+
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attribute):
+
+        module = importlib.import_module(self._name)
+
+        globals()[self._alias] = module
+
+        return getattr(module, attribute)
+
+
+has_pandas = importlib.util.find_spec("pandas") is not None
+
+has_numpy = importlib.util.find_spec("numpy") is not None
+
+has_scipy = has_numpy and importlib.util.find_spec("scipy") is not None
+
+if has_pandas:
+
+    pd = _LazyModule("pandas", "pd")
+
+if has_numpy:
+
+    np = _LazyModule("numpy", "np")
+
+if has_scipy:
+
+    sp = _LazyModule("scipy.sparse", "sp")
+
+
+# functions of the frames module that are also available from this module
+_FRAMES_FUNCTIONS = (
+    "assert_frame_pairs_equal_msg",
+    "assert_frame_equal_on_keys_msg",
+    "assert_frame_equal_by_column_msg",
+    "assert_frame_rows_equal_msg",
+    "frame_profile",
+    "assert_frame_profile_msg",
+)
+
+
+def __getattr__(name):
+
+    if name in _FRAMES_FUNCTIONS:
+
+        frames = importlib.import_module("test_aide.frames")
+
+        globals()[name] = getattr(frames, name)
+
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    import pandas as pd
 
-    has_pandas = True
+def __dir__():
 
-except ModuleNotFoundError:
+    return sorted(set(globals()) | set(_FRAMES_FUNCTIONS))
 
-    has_pandas = False
 
-try:
+def _pandas_loaded():
+    """Check if pandas is installed and has already been imported."""
 
-    import numpy as np
+    return has_pandas and "pandas" in sys.modules
 
-    has_numpy = True
 
-except ModuleNotFoundError:
+def _numpy_loaded():
+    """Check if numpy is installed and has already been imported."""
 
-    has_numpy = False
+    return has_numpy and "numpy" in sys.modules
+
+
+def _scipy_loaded():
+    """Check if scipy is installed and scipy.sparse has already been imported."""
+
+    return has_scipy and "scipy.sparse" in sys.modules
+
+
+# numpy dtype kinds (bool, int, unsigned int, float, complex) where equal bytes
+# means equal values
+_BUFFER_COMPARE_DTYPE_KINDS = "biufc"
+
+# max number of bytes compared at once when comparing array buffers
+_BUFFER_COMPARE_CHUNK_BYTES = 1 << 20
+
+# minimum number of items in a list or dict before checking if it is pure JSON-like
+# data where only the values that are not == need to be compared, see _json_like
+_JSON_FAST_PATH_MIN_LENGTH = 64
+
+# minimum number of records in a list of dicts before comparing the values column by
+# column, see _records_unequal_cells
+_RECORDS_FAST_PATH_MIN_LENGTH = 64
+
+# exact types allowed in the values of JSON-like data, dicts must also have str keys
+_JSON_TYPES = frozenset([dict, list, str, int, float, bool, type(None)])
+
+# number of bytes either side of the first difference shown by assert_bytes_equal_msg
+_BYTES_CONTEXT = 16
+
+# strings longer than this are reported by assert_str_equal_msg, with a window around the
+# first difference, rather than in full
+_LONG_STRING_LENGTH = 1000
+
+# max number of differing lines (on both sides) that assert_str_equal_msg will run a line
+# diff on, after removing lines common to the start and end of both strings
+_STRING_DIFF_MAX_LINES = 1000
+
+
+# per thread stack of the comparison budgets currently active
+_budget_state = threading.local()
 
 
 def assert_equal_dispatch(expected, actual, msg):
@@ -44,6 +169,8 @@ def assert_equal_dispatch(expected, actual, msg):
     - pd.Index
     - np.NaN
     - np.ndarray
+    - bytes, bytearray and memoryview
+    - scipy sparse matrices and arrays
 
     If the inputs are not of the above types then in the case of the following types;
     - list
@@ -72,332 +199,1920 @@ def assert_equal_dispatch(expected, actual, msg):
         A message to be used in the assert, passed onto the specific assert equality function
         that is called.
 
+    Notes
+    -----
+    Each call is counted against any budgets set with the comparison_budget context manager
+    and, if enabled, recorded in the metrics module.
+
     """
 
+    budgets = getattr(_budget_state, "active", None)
+
+    if budgets:
+
+        _charge_budgets(budgets, expected, actual, msg)
+
     if not type(actual) == type(expected):
 
         raise TypeError(
             f"expected ({type(expected)}) and actual ({type(actual)}) type mismatch"
         )
 
-    if has_pandas and type(expected) is pd.DataFrame:
+    kind = _handler_kind(expected)
+
+    handler = globals()[_HANDLERS[kind]]
+
+    if metrics._enabled:
+
+        metrics._enter()
+
+        start = time.perf_counter()
+
+        try:
+
+            handler(actual, expected, msg)
+
+        finally:
+
+            metrics._record_handler(
+                kind,
+                msg,
+                time.perf_counter() - start,
+                _data_nbytes(expected) + _data_nbytes(actual),
+            )
+
+    else:
+
+        handler(actual, expected, msg)
+
+
+# name of the function assert_equal_dispatch calls for each kind of object, the
+# functions are looked up by name at call time
+_HANDLERS = {
+    "frame": "assert_frame_equal_msg",
+    "series": "assert_series_equal_msg",
+    "index": "assert_index_equal_msg",
+    "nan": "assert_np_nan_eqal_msg",
+    "array": "assert_array_equal_msg",
+    "list": "assert_list_tuple_equal_msg",
+    "dict": "assert_dict_equal_msg",
+    "bytes": "assert_bytes_equal_msg",
+    "sparse": "assert_sparse_equal_msg",
+    "scalar": "assert_equal_msg",
+}
+
 
-        assert_frame_equal_msg(actual, expected, msg)
+def _handler_kind(expected):
+    """Return the kind of object expected is, used to pick the handler in
+    assert_equal_dispatch. See _HANDLERS for the possible return values.
+    """
+
+    pandas_loaded = _pandas_loaded()
+
+    if pandas_loaded and type(expected) is pd.DataFrame:
+
+        return "frame"
 
-    elif has_pandas and type(expected) is pd.Series:
+    elif pandas_loaded and type(expected) is pd.Series:
 
-        assert_series_equal_msg(actual, expected, msg)
+        return "series"
 
-    elif has_pandas and isinstance(expected, pd.Index):
+    elif pandas_loaded and isinstance(expected, pd.Index):
 
-        assert_index_equal_msg(actual, expected, msg)
+        return "index"
 
-    elif has_numpy and isinstance(expected, float) and np.isnan(expected):
+    elif has_numpy and isinstance(expected, float) and math.isnan(expected):
 
-        assert_np_nan_eqal_msg(actual, expected, msg)
+        return "nan"
 
-    elif has_numpy and type(expected) is np.ndarray:
+    elif _numpy_loaded() and isinstance(expected, np.ndarray):
 
-        assert_array_equal_msg(actual, expected, msg)
+        return "array"
 
     elif type(expected) in [list, tuple]:
 
-        assert_list_tuple_equal_msg(actual, expected, msg)
+        return "list"
 
     elif isinstance(expected, dict):
 
-        assert_dict_equal_msg(actual, expected, msg)
+        return "dict"
+
+    elif type(expected) in [bytes, bytearray, memoryview]:
+
+        return "bytes"
+
+    elif _scipy_loaded() and sp.issparse(expected):
+
+        return "sparse"
 
     else:
 
-        assert_equal_msg(actual, expected, msg)
+        return "scalar"
 
 
-def assert_equal_msg(actual, expected, msg_tag):
-    """Compares actual and expected objects and simply asserts equality (==). Adds msg_tag, actual and expected
-    values to AssertionException message.
+def compare(expected, actual, msg=""):
+    """Compare expected and actual in the same way as assert_equal_dispatch but return the
+    outcome rather than raising an exception if they are not equal.
+
+    This is intended for checking many objects in a loop, where constructing exceptions
+    (and their messages) for each failure would dominate the cost. Lists, tuples, dicts,
+    scalars and np.NaN values are compared without raising any exceptions. For pandas and
+    numpy objects the same assert function as assert_equal_dispatch is used, so exceptions
+    are only raised internally if those objects are not equal.
+
+    Budgets set with comparison_budget apply, and are still enforced by raising an error.
 
     Parameters
     ----------
-    actual : object
+    expected : object
         The expected object.
 
-    expected : object
+    actual : object
         The actual object.
 
-    msg_tag : string
-        A tag for the AssertionException message. Use this to identify mismatching arguments in test output.
+    msg : string, default = ""
+        Tag for the root of the path to the first difference, e.g. "output" gives paths
+        like "output key a index 2".
+
+    Returns
+    -------
+    ComparisonResult
+        Result that is truthy if expected and actual are equal. If they are not equal the
+        result also has the path to the first difference and the reason for it.
+
+    Examples
+    --------
+    >>> import test_aide as ta
+    >>>
+    >>> result = ta.equality.compare({"a": [1, 2]}, {"a": [1, 3]}, "output")
+    >>> result.equal, result.path
+    (False, 'output key a index 1')
 
     """
 
-    error_msg = f"{msg_tag} -\n  Expected: {expected}\n  Actual: {actual}"
+    difference = _compare_dispatch(expected, actual, msg)
 
-    assert actual == expected, error_msg
+    return _EQUAL_RESULT if difference is None else difference
 
 
-def assert_np_nan_eqal_msg(actual, expected, msg):
-    """Function to test that both values are np.NaN.
+def is_equal(expected, actual):
+    """Check if expected and actual are equal in the same way as assert_equal_dispatch,
+    returning a bool rather than raising an exception if they are not equal.
+
+    See compare for details.
 
     Parameters
     ----------
-    actual : object
-        The expected object. Must be an numeric type for np.isnan to run.
-
     expected : object
-        The actual object. Must be an numeric type for np.isnan to run.
+        The expected object.
 
-    msg : string
-        A tag for the AssertionException message.
+    actual : object
+        The actual object.
+
+    Returns
+    -------
+    bool
+        True if expected and actual are equal.
 
     """
 
-    assert np.isnan(actual) and np.isnan(
-        expected
-    ), f"Both values are not equal to np.NaN -\n  Expected: {expected}\n  Actual: {actual}"
+    return _compare_dispatch(expected, actual, "") is None
 
 
-def assert_list_tuple_equal_msg(actual, expected, msg_tag):
-    """Compares two actual and expected list or tuple objects and asserts equality between the two.
-    Error output will identify location of mismatch in items.
+class ComparisonResult:
+    """Outcome of a comparison made with compare.
 
-    Checks actual and expected are the same type, then equal length then loops through pariwise eleemnts
-    and calls assert_equal_dispatch function.
+    The reason is only formatted when it is first accessed, so results for unequal
+    objects stay cheap to create.
 
-    Parameters
+    Attributes
     ----------
-    actual : list or tuple
-        The actual list or tuple to compare.
+    equal : bool
+        True if the objects compared are equal, results are also truthy if equal.
 
-    expected : list or tuple
-        The expected list or tuple to compare to actual.
+    path : str or None
+        Location of the first difference, in the same format as the msg tags of
+        assert_equal_dispatch e.g. "output key a index 2", None if equal.
 
-    msg_tag : string
-        A tag for the AssertionException message.
+    reason : str or None
+        Description of the first difference, None if equal.
 
     """
 
-    if not type(expected) in [list, tuple]:
+    __slots__ = ("equal", "path", "_reason")
 
-        raise TypeError(
-            f"expected should be of type list or tuple, but got {type(expected)}"
-        )
+    def __init__(self, equal, path=None, reason=None):
 
-    if not type(actual) in [list, tuple]:
+        self.equal = equal
+        self.path = path
+        self._reason = reason
 
-        raise TypeError(
-            f"actual should be of type list or tuple, but got {type(actual)}"
-        )
+    @property
+    def reason(self):
 
-    if not type(actual) == type(expected):
+        if callable(self._reason):
 
-        raise TypeError(
-            f"expect ({type(expected)}) and actual ({type(actual)}) type mismatch"
-        )
+            self._reason = self._reason()
 
-    assert len(expected) == len(
-        actual
-    ), f"Unequal lengths -\n  Expected: {len(expected)}\n  Actual: {len(actual)}"
+        return self._reason
 
-    for i, (e, a) in enumerate(zip(expected, actual)):
+    def __bool__(self):
 
-        assert_equal_dispatch(e, a, f"{msg_tag} index {i}")
+        return self.equal
 
+    def __repr__(self):
 
-def assert_dict_equal_msg(actual, expected, msg_tag):
-    """Compares two actual and expected dict objects and asserts equality. Error output
-    will identify (first) location of mismatch values.
+        if self.equal:
 
-    Checks actual and expected are both dicts, then same number of keys then loops through pariwise
-    values from actual and expected and calls assert_equal_dispatch function on these pairs..
+            return "ComparisonResult(equal=True)"
 
-    Parameters
-    ----------
-    actual : dict
-        The actual dict to compare.
+        return (
+            f"ComparisonResult(equal=False, path={self.path!r}, reason={self.reason!r})"
+        )
 
-    expected : dict
-        The expected dict to compare to actual.
 
-    msg_tag : string
-        A tag for the AssertionException message.
+_EQUAL_RESULT = ComparisonResult(True)
 
-    """
 
-    if not isinstance(expected, dict):
+def _child_path(path, step):
+    """Path to an element of a container, in the same format as the msg tags used by assert_equal_dispatch."""
 
-        raise TypeError(f"expected should be of type dict, but got {type(expected)}")
+    return f"{path} {step}" if path else step
 
-    if not isinstance(actual, dict):
 
-        raise TypeError(f"actual should be of type dict, but got {type(actual)}")
+def _compare_dispatch(expected, actual, path):
+    """Non-raising counterpart of assert_equal_dispatch, returns None if expected and
+    actual are equal or a ComparisonResult for the first difference found.
+    """
 
-    assert len(expected.keys()) == len(
-        actual.keys()
-    ), f"Unequal number of keys -\n  Expected: {len(expected.keys())}\n  Actual: {len(actual.keys())}"
+    budgets = getattr(_budget_state, "active", None)
 
-    keys_diff_e_a = set(expected.keys()) - set(actual.keys())
+    if budgets:
 
-    keys_diff_a_e = set(actual.keys()) - set(expected.keys())
+        _charge_budgets(budgets, expected, actual, path)
 
-    assert (
-        keys_diff_e_a == set()
-    ), f"Keys in expected not in actual: {keys_diff_e_a}\nKeys in actual not in expected: {keys_diff_a_e}"
+    if not type(actual) == type(expected):
 
-    for k in actual.keys():
+        return ComparisonResult(
+            False,
+            path,
+            lambda: f"expected ({type(expected)}) and actual ({type(actual)}) type mismatch",
+        )
 
-        assert_equal_dispatch(expected[k], actual[k], f"{msg_tag} key {k}")
+    kind = _handler_kind(expected)
 
+    comparer = _COMPARERS.get(kind, _compare_by_assert)
 
-def assert_frame_equal_msg(
-    actual, expected, msg_tag, print_actual_and_expected=False, **kwargs
-):
-    """Compares actual and expected pandas.DataFrames and asserts equality.
+    if metrics._enabled:
 
-    Calls pd.testing.assert_frame_equal but presents msg_tag, and optionally actual and expected
-    DataFrames, in addition to any other exception info.
+        metrics._enter()
 
-    Parameters
-    ----------
-    actual : pandas DataFrame
-        The expected dataframe.
+        start = time.perf_counter()
 
-    expected : pandas DataFrame
-        The actual dataframe.
+        try:
 
-    msg_tag : string
-        A tag for the assert error message.
+            return comparer(expected, actual, path, kind)
 
-    **kwargs:
-        Keyword args passed to pd.testing.assert_frame_equal.
+        finally:
 
-    """
+            metrics._record_handler(
+                kind,
+                path,
+                time.perf_counter() - start,
+                _data_nbytes(expected) + _data_nbytes(actual),
+            )
 
-    try:
+    return comparer(expected, actual, path, kind)
 
-        pd.testing.assert_frame_equal(expected, actual, **kwargs)
 
-    except Exception as e:
+def _compare_scalar(expected, actual, path, kind):
 
-        if print_actual_and_expected:
+    if actual == expected:
 
-            error_msg = f"""{msg_tag}\nexpected:\n{expected}\nactual:\n{actual}"""
+        return None
 
-        else:
+    if (
+        type(actual) is str
+        and type(expected) is str
+        and max(len(actual), len(expected)) > _LONG_STRING_LENGTH
+    ):
 
-            error_msg = msg_tag
+        return ComparisonResult(
+            False,
+            path,
+            lambda: _str_difference(actual, expected, context=50, max_diff_lines=50),
+        )
 
-        raise AssertionError(error_msg) from e
+    return ComparisonResult(
+        False, path, lambda: f"Expected: {expected}\n  Actual: {actual}"
+    )
 
 
-def assert_series_equal_msg(
-    actual, expected, msg_tag, print_actual_and_expected=False, **kwargs
-):
-    """Compares actual and expected pandas.Series and asserts equality.
-    Calls pd.testing.assert_series_equal but presents msg_tag, and optionally actual and expected
-    Series, in addition to any other exception info.
+def _compare_nan(expected, actual, path, kind):
 
-    Parameters
-    ----------
-    actual : pandas Series
-        The actual Series.
+    if math.isnan(actual):
 
-    expected : pandas Series
-        The expected Series.
+        return None
 
-    msg_tag : string
-        A tag for the assert error message.
+    return ComparisonResult(
+        False,
+        path,
+        lambda: f"Both values are not equal to np.NaN -\n  Expected: {expected}\n  Actual: {actual}",
+    )
 
-    print_actual_and_expected : Boolean
-        print the actual and expected dataFrame along with error message tag
 
-    **kwargs:
-        Keyword args passed to pd.testing.assert_series_equal.
+def _compare_list_tuple(expected, actual, path, kind):
 
-    """
+    if len(expected) != len(actual):
 
-    try:
+        return ComparisonResult(
+            False,
+            path,
+            f"Unequal lengths -\n  Expected: {len(expected)}\n  Actual: {len(actual)}",
+        )
 
-        pd.testing.assert_series_equal(expected, actual, **kwargs)
+    if len(expected) >= _RECORDS_FAST_PATH_MIN_LENGTH:
 
-    except Exception as e:
+        cells = _records_unequal_cells(expected, actual, path)
 
-        if print_actual_and_expected:
+        if cells is not None:
 
-            error_msg = f"""{msg_tag}\nexpected:\n{expected}\nactual:\n{actual}"""
+            for i, k in cells:
 
-        else:
+                difference = _compare_dispatch(
+                    expected[i][k],
+                    actual[i][k],
+                    _child_path(path, f"index {i} key {k}"),
+                )
 
-            error_msg = msg_tag
+                if difference is not None:
 
-        raise AssertionError(error_msg) from e
+                    return difference
 
+            return None
 
-def assert_index_equal_msg(
-    actual, expected, msg_tag, print_actual_and_expected=False, **kwargs
-):
-    """Compares actual and expected pandas.Index objects and asserts equality.
-    Calls pd.testing.assert_index_equal but presents msg_tag, and optionally actual and expected
-    Series, in addition to any other exception info.
+    positions = range(len(expected))
 
-    Parameters
-    ----------
-    actual : pd.Index
-        The actual index.
+    if len(expected) >= _JSON_FAST_PATH_MIN_LENGTH and _json_like(
+        expected, actual, path
+    ):
 
-    expected : pd.Index
-        The expected index.
+        positions = _unequal_positions(expected, actual)
 
-    msg_tag : string
-        A tag for the assert error message.
+    for i in positions:
 
-    print_actual_and_expected : Boolean
-        print the actual and expected valuess along with error message tag
+        difference = _compare_dispatch(
+            expected[i], actual[i], _child_path(path, f"index {i}")
+        )
 
-    **kwargs:
-        Keyword args passed to pd.testing.assert_index_equal.
+        if difference is not None:
 
-    """
+            return difference
 
-    try:
+    return None
 
-        pd.testing.assert_index_equal(expected, actual, **kwargs)
 
-    except Exception as e:
+def _compare_dict(expected, actual, path, kind):
 
-        if print_actual_and_expected:
+    if len(expected) != len(actual):
 
-            error_msg = f"""{msg_tag}\nexpected:\n{expected}\nactual:\n{actual}"""
+        return ComparisonResult(
+            False,
+            path,
+            f"Unequal number of keys -\n  Expected: {len(expected)}\n  Actual: {len(actual)}",
+        )
 
-        else:
+    if expected.keys() != actual.keys():
 
-            error_msg = msg_tag
+        return ComparisonResult(
+            False,
+            path,
+            lambda: f"Keys in expected not in actual: {set(expected.keys()) - set(actual.keys())}\n"
+            f"Keys in actual not in expected: {set(actual.keys()) - set(expected.keys())}",
+        )
 
-        raise AssertionError(error_msg) from e
+    keys = actual.keys()
 
+    if len(expected) >= _JSON_FAST_PATH_MIN_LENGTH and _json_like(
+        expected, actual, path
+    ):
 
-def assert_array_equal_msg(
-    actual, expected, msg_tag, print_actual_and_expected=False, **kwargs
-):
-    """Compares actual and expected np.arrays and asserts equality.
-    Calls np.testing.assert_array_equal but presents msg_tag, and optionally actual and expected
-    arrays, in addition to any other exception info.
+        keys = _unequal_positions(expected, actual)
 
-    Parameters
-    ----------
-    actual : numpy array
-        The actual array.
+    for k in keys:
 
-    expected : numpy array
-        The expected array.
+        difference = _compare_dispatch(
+            expected[k], actual[k], _child_path(path, f"key {k}")
+        )
 
-    msg_tag : string
-        A tag for the assert error message.
+        if difference is not None:
+
+            return difference
+
+    return None
+
+
+def _compare_by_assert(expected, actual, path, kind):
+    """Compare using the assert function assert_equal_dispatch would call for kind,
+    turning an AssertionError into a ComparisonResult.
+    """
+
+    try:
+
+        globals()[_HANDLERS[kind]](actual, expected, path)
+
+    except AssertionError as err:
+
+        cause = err if err.__cause__ is None else err.__cause__
+
+        return ComparisonResult(False, path, lambda: str(cause))
+
+    return None
+
+
+# non-raising comparers used by compare for each kind of object, kinds not included
+# are compared with _compare_by_assert
+_COMPARERS = {
+    "nan": _compare_nan,
+    "list": _compare_list_tuple,
+    "dict": _compare_dict,
+    "scalar": _compare_scalar,
+}
+
+
+def _json_like(expected, actual, location):
+    """Check if expected and actual are JSON-like data, i.e. made up of only dicts with
+    str keys, lists, str, int, float, bool and None, with identical types at every
+    position (so that e.g. 1 and 1.0 are reported as a type mismatch, as in
+    assert_equal_dispatch) and the same lengths and keys.
+
+    Only the containers are walked in python, the types of the values in each container
+    are checked in bulk. If this returns True the only items of expected and actual that
+    can differ are those where the values are not ==, see _unequal_positions.
+
+    The number of values checked is charged to any active comparison budgets, as if each
+    had been compared with assert_equal_dispatch.
+
+    Parameters
+    ----------
+    expected : list or dict
+        The expected object.
+
+    actual : list or dict
+        The actual object.
+
+    location : string
+        Location to give in the error if a comparison budget is exceeded.
+
+    """
+
+    if not (type(expected) is type(actual) and type(expected) in [list, dict]):
+
+        return False
+
+    budgets = getattr(_budget_state, "active", None)
+
+    # key tuples already checked to be all str
+    str_keys = set()
+
+    # positions of the lists and dicts within containers, by the types of the values in
+    # the container, records often have the same types so are only checked once
+    container_positions = {}
+
+    stack = [(expected, actual)]
+
+    while stack:
+
+        e, a = stack.pop()
+
+        if type(e) is dict:
+
+            keys = tuple(e)
+
+            if keys == tuple(a):
+
+                a_values = a.values()
+
+            elif e.keys() == a.keys():
+
+                a_values = tuple(map(a.__getitem__, keys))
+
+            else:
+
+                return False
+
+            if keys not in str_keys:
+
+                if any(type(k) is not str for k in keys):
+
+                    return False
+
+                str_keys.add(keys)
+
+            e_values = e.values()
+
+        else:
+
+            if len(e) != len(a):
+
+                return False
+
+            e_values = e
+            a_values = a
+
+        types = tuple(map(type, e_values))
+
+        if types != tuple(map(type, a_values)):
+
+            return False
+
+        positions = container_positions.get(types)
+
+        if positions is None:
+
+            if not set(types) <= _JSON_TYPES:
+
+                return False
+
+            positions = container_positions[types] = [
+                i for i, value_type in enumerate(types) if value_type in [list, dict]
+            ]
+
+        if budgets:
+
+            for budget in budgets:
+
+                budget.charge(0, location, n_nodes=len(types))
+
+        if positions:
+
+            # dict values are views that cannot be indexed
+            e_values = tuple(e_values)
+            a_values = tuple(a_values)
+
+            stack.extend([(e_values[i], a_values[i]) for i in positions])
+
+    return True
+
+
+def _unequal_positions(expected, actual):
+    """Indexes (for lists) or keys (for dicts) where the values of expected and actual are
+    not ==, expected and actual must have the same length or keys.
+    """
+
+    if type(expected) is dict:
+
+        return itertools.compress(
+            actual.keys(),
+            map(operator.ne, map(expected.__getitem__, actual), actual.values()),
+        )
+
+    return itertools.compress(range(len(expected)), map(operator.ne, expected, actual))
+
+
+def _records_unequal_cells(expected, actual, location):
+    """If expected and actual are lists of records, i.e. dicts that all have the same keys,
+    with only scalar values return the (index, key) of the values that are not equal,
+    otherwise return None.
+
+    The values are extracted column by column and the types and values of each column
+    compared in bulk. The cells returned are those with different types or where actual
+    == expected is not True (excluding NaN in both), in the order they would be compared
+    in by assert_list_tuple_equal_msg, so that passing them to assert_equal_dispatch raises
+    the same error as comparing the records one by one. None is also returned if comparing
+    any of the values raises an exception.
+
+    The number of values compared is charged to any active comparison budgets, as if each
+    had been compared with assert_equal_dispatch.
+
+    Parameters
+    ----------
+    expected : list or tuple
+        The expected object.
+
+    actual : list or tuple
+        The actual object, of the same length as expected.
+
+    location : string
+        Location to give in the error if a comparison budget is exceeded.
+
+    """
+
+    if not expected or set(map(type, expected)) != {dict}:
+
+        return None
+
+    if set(map(type, actual)) != {dict}:
+
+        return None
+
+    keys = expected[0].keys()
+
+    if not (
+        all(map(keys.__eq__, map(dict.keys, expected)))
+        and all(map(keys.__eq__, map(dict.keys, actual)))
+    ):
+
+        return None
+
+    budgets = getattr(_budget_state, "active", None)
+
+    n_records = len(expected)
+
+    # keys of the unequal values in each record
+    unequal = {}
+
+    for k in keys:
+
+        get_value = operator.itemgetter(k)
+
+        e_column = list(map(get_value, expected))
+        a_column = list(map(get_value, actual))
+
+        e_types = list(map(type, e_column))
+        a_types = list(map(type, a_column))
+
+        if not all(map(_scalar_type, set(e_types) | set(a_types))):
+
+            return None
+
+        if budgets:
+
+            for budget in budgets:
+
+                budget.charge(0, location, n_nodes=n_records)
+
+        try:
+
+            different = map(
+                operator.or_,
+                map(operator.is_not, e_types, a_types),
+                map(operator.not_, map(operator.eq, a_column, e_column)),
+            )
+
+            for i in itertools.compress(range(n_records), different):
+
+                e_value = e_column[i]
+
+                if (
+                    has_numpy
+                    and e_types[i] is a_types[i]
+                    and isinstance(e_value, float)
+                    and math.isnan(e_value)
+                    and math.isnan(a_column[i])
+                ):
+
+                    continue
+
+                unequal.setdefault(i, set()).add(k)
+
+        except Exception:
+
+            return None
+
+    return [(i, k) for i in sorted(unequal) for k in actual[i] if k in unequal[i]]
+
+
+def _scalar_type(value_type):
+    """Check if values of value_type are compared with == by assert_equal_dispatch, rather
+    than being containers or pandas / numpy objects with their own handler.
+    """
+
+    if value_type in [list, tuple] or issubclass(value_type, dict):
+
+        return False
+
+    if _numpy_loaded() and issubclass(value_type, np.ndarray):
+
+        return False
+
+    if _pandas_loaded() and issubclass(value_type, (pd.DataFrame, pd.Series, pd.Index)):
+
+        return False
+
+    return True
+
+
+@contextmanager
+def comparison_budget(max_nodes=None, max_bytes=None, max_seconds=None):
+    """Limit the work done by assert_equal_dispatch calls made within the context.
+
+    Every call to assert_equal_dispatch (including the recursive calls made for the
+    elements of lists, tuples and dicts) counts as one node visited. The size of the data
+    held by pandas and numpy objects is added to the bytes materialised before they are
+    compared and the wall-clock time is checked at each node. If any limit is exceeded a
+    RuntimeError is raised giving the location of the comparison and how far it got.
+
+    Budgets can be nested, in which case every active budget is charged.
+
+    Parameters
+    ----------
+    max_nodes : int or None, default = None
+        Maximum number of nodes to visit, or None for no limit.
+
+    max_bytes : int or None, default = None
+        Maximum number of bytes of pandas and numpy data to compare, or None for no limit.
+
+    max_seconds : int, float or None, default = None
+        Maximum wall-clock time in seconds, or None for no limit. Note, this is only checked
+        between nodes so a single large comparison cannot be interrupted, use max_bytes to
+        guard against these.
+
+    Examples
+    --------
+    >>> import test_aide as ta
+    >>>
+    >>> with ta.equality.comparison_budget(max_nodes=10000, max_seconds=60):
+    ...     ta.equality.assert_equal_dispatch([1, 2, 3], [1, 2, 3], "values")
+
+    """
+
+    for name, value in [("max_nodes", max_nodes), ("max_bytes", max_bytes)]:
+
+        if value is not None:
+
+            if not type(value) is int:
+
+                raise TypeError(
+                    f"{name} should be an int or None but got {type(value)}"
+                )
+
+            if value < 0:
+
+                raise ValueError(f"{name} should be greater than or equal to 0")
+
+    if max_seconds is not None:
+
+        if not type(max_seconds) in [int, float]:
+
+            raise TypeError(
+                f"max_seconds should be an int, float or None but got {type(max_seconds)}"
+            )
+
+        if max_seconds < 0:
+
+            raise ValueError("max_seconds should be greater than or equal to 0")
+
+    budget = _ComparisonBudget(max_nodes, max_bytes, max_seconds)
+
+    budgets = getattr(_budget_state, "active", None)
+
+    if budgets is None:
+
+        budgets = _budget_state.active = []
+
+    budgets.append(budget)
+
+    try:
+
+        yield budget
+
+    finally:
+
+        budgets.remove(budget)
+
+
+class _ComparisonBudget:
+    """Running totals for a single comparison_budget context."""
+
+    def __init__(self, max_nodes, max_bytes, max_seconds):
+
+        self.max_nodes = max_nodes
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+
+        self.nodes = 0
+        self.bytes = 0
+        self.start = time.perf_counter()
+
+    def charge(self, n_bytes, location, n_nodes=1):
+        """Add n_nodes and n_bytes to the totals and raise a RuntimeError if a limit is exceeded."""
+
+        self.nodes += n_nodes
+        self.bytes += n_bytes
+
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+
+            self._exceeded(f"max_nodes={self.max_nodes}", location)
+
+        if self.max_bytes is not None and self.bytes > self.max_bytes:
+
+            self._exceeded(f"max_bytes={self.max_bytes}", location)
+
+        if (
+            self.max_seconds is not None
+            and time.perf_counter() - self.start > self.max_seconds
+        ):
+
+            self._exceeded(f"max_seconds={self.max_seconds}", location)
+
+    def _exceeded(self, limit, location):
+
+        raise RuntimeError(
+            f"comparison budget exceeded ({limit}) at {location} -\n"
+            f"  Nodes visited: {self.nodes}\n"
+            f"  Bytes materialised: {self.bytes}\n"
+            f"  Seconds elapsed: {time.perf_counter() - self.start:.3f}"
+        )
+
+
+def _charge_budgets(budgets, expected, actual, location):
+    """Charge one node and the data size of expected and actual to each active budget."""
+
+    n_bytes = _data_nbytes(expected) + _data_nbytes(actual)
+
+    for budget in budgets:
+
+        budget.charge(n_bytes, location)
+
+
+def _data_nbytes(obj):
+    """Number of bytes of data held by a pandas or numpy object, 0 for other objects."""
+
+    if _numpy_loaded() and isinstance(obj, np.ndarray):
+
+        return obj.nbytes
+
+    if _pandas_loaded():
+
+        if isinstance(obj, pd.DataFrame):
+
+            return int(obj.memory_usage(index=True, deep=False).sum())
+
+        if isinstance(obj, pd.Series):
+
+            return int(obj.memory_usage(index=True, deep=False))
+
+        if isinstance(obj, pd.Index):
+
+            return int(obj.memory_usage(deep=False))
+
+    return 0
+
+
+def assert_equal_msg(actual, expected, msg_tag):
+    """Compares actual and expected objects and simply asserts equality (==). Adds msg_tag, actual and expected
+    values to AssertionException message.
+
+    Parameters
+    ----------
+    actual : object
+        The expected object.
+
+    expected : object
+        The actual object.
+
+    msg_tag : string
+        A tag for the AssertionException message. Use this to identify mismatching arguments in test output.
+
+    """
+
+    if (
+        type(actual) is str
+        and type(expected) is str
+        and max(len(actual), len(expected)) > _LONG_STRING_LENGTH
+    ):
+
+        assert_str_equal_msg(actual, expected, msg_tag)
+
+        return
+
+    assert (
+        actual == expected
+    ), f"{msg_tag} -\n  Expected: {expected}\n  Actual: {actual}"
+
+
+def assert_str_equal_msg(actual, expected, msg_tag, context=50, max_diff_lines=50):
+    """Compares actual and expected strings and asserts equality, with an AssertionException
+    message of bounded size however long the strings are.
+
+    Rather than including both strings in full, the message gives the position of the
+    first differing character and a window of characters either side of it. Optionally a
+    line diff is added, of only the lines that are not common to the start and end of
+    both strings. The line diff is a patience diff, aligning the lines that occur once in
+    both strings, so it takes O(n log n) time rather than the quadratic time of difflib,
+    and lines between aligned lines that have no lines in common that occur once are
+    shown as changed rather than diffed further. If numpy is not installed difflib is
+    used instead. The line diff is only run if at most 1000 lines differ, to bound its
+    cost.
+
+    assert_equal_msg uses this function if either string is longer than 1000 characters.
+
+    Parameters
+    ----------
+    actual : str
+        The actual string.
+
+    expected : str
+        The expected string.
+
+    msg_tag : string
+        A tag for the AssertionException message.
+
+    context : int, default = 50
+        Number of characters either side of the first difference to show.
+
+    max_diff_lines : int, default = 50
+        Maximum number of lines of line diff to show, 0 to not show a line diff.
+
+    """
+
+    if not type(expected) is str:
+
+        raise TypeError(f"expected should be of type str, but got {type(expected)}")
+
+    if not type(actual) is str:
+
+        raise TypeError(f"actual should be of type str, but got {type(actual)}")
+
+    for name, value in [("context", context), ("max_diff_lines", max_diff_lines)]:
+
+        if not type(value) is int:
+
+            raise TypeError(f"{name} should be an int but got {type(value)}")
+
+        if value < 0:
+
+            raise ValueError(f"{name} should be greater than or equal to 0")
+
+    if actual == expected:
+
+        return
+
+    raise AssertionError(
+        f"{msg_tag} -\n  {_str_difference(actual, expected, context, max_diff_lines)}"
+    )
+
+
+def _str_difference(actual, expected, context, max_diff_lines):
+    """Description of where two unequal strings differ, see assert_str_equal_msg."""
+
+    offset = _first_difference_offset(expected, actual)
+
+    line = expected.count("\n", 0, offset) + 1
+    column = offset - (expected.rfind("\n", 0, offset) + 1) + 1
+
+    start = max(offset - context, 0)
+    stop = offset + context + 1
+
+    description = (
+        f"First difference at character {offset} (line {line}, column {column})\n"
+        f"  Expected length: {len(expected)}\n"
+        f"  Actual length: {len(actual)}\n"
+        f"  Expected [{start}:{min(stop, len(expected))}]: {expected[start:stop]!r}\n"
+        f"  Actual [{start}:{min(stop, len(actual))}]: {actual[start:stop]!r}"
+    )
+
+    if max_diff_lines:
+
+        description += _line_diff(
+            expected.splitlines(), actual.splitlines(), 2 * context, max_diff_lines
+        )
+
+    return description
+
+
+def _line_diff(expected_lines, actual_lines, max_line_length, max_diff_lines):
+    """Line diff of the lines that are not common to the start and end of expected_lines
+    and actual_lines, with line numbers, to append to _str_difference.
+    """
+
+    n_start = _first_difference_offset(expected_lines, actual_lines)
+
+    if n_start is None:
+
+        # only line endings differ, which is shown by the window of characters
+        return ""
+
+    n_end = _first_difference_offset(expected_lines[::-1], actual_lines[::-1])
+
+    n_end = min(n_end, len(expected_lines) - n_start, len(actual_lines) - n_start)
+
+    expected_middle = expected_lines[n_start : len(expected_lines) - n_end]
+    actual_middle = actual_lines[n_start : len(actual_lines) - n_end]
+
+    if len(expected_middle) + len(actual_middle) > _STRING_DIFF_MAX_LINES:
+
+        return (
+            f"\n  Line diff not shown, lines {n_start + 1} to {n_start + len(expected_middle)} of "
+            f"expected and {n_start + 1} to {n_start + len(actual_middle)} of actual differ"
+        )
+
+    diff = []
+
+    for e_start, e_stop, a_start, a_stop in _line_diff_blocks(
+        expected_middle, actual_middle
+    ):
+
+        for i in range(e_start, e_stop):
+
+            diff.append(
+                f"  - {n_start + i + 1}: {_truncate(expected_middle[i], max_line_length)}"
+            )
+
+        for i in range(a_start, a_stop):
+
+            diff.append(
+                f"  + {n_start + i + 1}: {_truncate(actual_middle[i], max_line_length)}"
+            )
+
+    shown = diff[:max_diff_lines]
+
+    if len(diff) > len(shown):
+
+        shown.append(f"  ... and {len(diff) - len(shown)} more lines")
+
+    return "\n  Line diff:\n" + "\n".join(shown)
+
+
+def _line_diff_blocks(expected_lines, actual_lines):
+    """(expected_start, expected_stop, actual_start, actual_stop) for each block of lines
+    that differ, from the patience diff in _row_diff_blocks if numpy is installed and
+    otherwise from difflib.
+    """
+
+    if not has_numpy:
+
+        matcher = difflib.SequenceMatcher(None, expected_lines, actual_lines, False)
+
+        return [
+            (e_start, e_stop, a_start, a_stop)
+            for tag, e_start, e_stop, a_start, a_stop in matcher.get_opcodes()
+            if tag != "equal"
+        ]
+
+    # lines are diffed as ints, the same line has the same int in both
+    codes = {}
+
+    expected_codes = np.array([codes.setdefault(x, len(codes)) for x in expected_lines])
+    actual_codes = np.array([codes.setdefault(x, len(codes)) for x in actual_lines])
+
+    return _row_diff_blocks(expected_codes, actual_codes)
+
+
+def _truncate(value, width):
+
+    return value if len(value) <= width else value[: width - 3] + "..."
+
+
+def assert_np_nan_eqal_msg(actual, expected, msg):
+    """Function to test that both values are np.NaN.
+
+    Parameters
+    ----------
+    actual : object
+        The expected object. Must be an numeric type for np.isnan to run.
+
+    expected : object
+        The actual object. Must be an numeric type for np.isnan to run.
+
+    msg : string
+        A tag for the AssertionException message.
+
+    """
+
+    assert np.isnan(actual) and np.isnan(
+        expected
+    ), f"Both values are not equal to np.NaN -\n  Expected: {expected}\n  Actual: {actual}"
+
+
+def assert_bytes_equal_msg(actual, expected, msg_tag):
+    """Compares actual and expected bytes, bytearray or memoryview objects and asserts
+    equality.
+
+    Rather than including both objects in full, the AssertionException message gives
+    the offset of the first differing byte and a hex window of the bytes around it, so the
+    message size does not depend on the size of the objects. The buffers are compared
+    without copying (unless a memoryview is not contiguous) and the first difference is
+    found by comparing progressively smaller slices.
+
+    Parameters
+    ----------
+    actual : bytes, bytearray or memoryview
+        The actual object.
+
+    expected : bytes, bytearray or memoryview
+        The expected object.
+
+    msg_tag : string
+        A tag for the AssertionException message.
+
+    """
+
+    if not type(expected) in [bytes, bytearray, memoryview]:
+
+        raise TypeError(
+            f"expected should be of type bytes, bytearray or memoryview, but got {type(expected)}"
+        )
+
+    if not type(actual) == type(expected):
+
+        raise TypeError(
+            f"expected ({type(expected)}) and actual ({type(actual)}) type mismatch"
+        )
+
+    if actual == expected:
+
+        return
+
+    expected_bytes = _byte_view(expected)
+    actual_bytes = _byte_view(actual)
+
+    offset = _first_difference_offset(expected_bytes, actual_bytes)
+
+    if offset is None:
+
+        # only possible for memoryviews, equal bytes but different formats, shapes or values
+        # that are not equal to themselves (e.g. NaN)
+        raise AssertionError(
+            f"{msg_tag} -\n  Equal bytes but unequal memoryviews\n"
+            f"  Expected format, shape: {expected.format}, {expected.shape}\n"
+            f"  Actual format, shape: {actual.format}, {actual.shape}"
+        )
+
+    start = max(offset - _BYTES_CONTEXT, 0)
+    stop = offset + _BYTES_CONTEXT + 1
+
+    raise AssertionError(
+        f"{msg_tag} -\n  First difference at byte {offset}\n"
+        f"  Expected length: {len(expected_bytes)}\n"
+        f"  Actual length: {len(actual_bytes)}\n"
+        f"  Expected [{start}:{min(stop, len(expected_bytes))}]: {_hex(expected_bytes[start:stop])}\n"
+        f"  Actual [{start}:{min(stop, len(actual_bytes))}]: {_hex(actual_bytes[start:stop])}"
+    )
+
+
+def _byte_view(obj):
+    """memoryview of the bytes in a bytes, bytearray or memoryview object."""
+
+    view = memoryview(obj)
+
+    if not view.c_contiguous:
+
+        view = memoryview(view.tobytes())
+
+    return view.cast("B") if view.format != "B" or view.ndim != 1 else view
+
+
+def _first_difference_offset(view_1, view_2):
+    """Offset of the first differing item in two memoryviews of bytes, strings or lists,
+    or the length of the shorter if one is a prefix of the other, None if they are equal.
+
+    Slices are compared with == (i.e. memcmp), halving the slice containing the first
+    difference each time, so the cost is linear in the size of the views.
+    """
+
+    length = min(len(view_1), len(view_2))
+
+    start = 0
+    stop = length
+
+    if view_1[:length] == view_2[:length]:
+
+        return None if len(view_1) == len(view_2) else length
+
+    while stop - start > 1:
+
+        middle = (start + stop) // 2
+
+        if view_1[start:middle] == view_2[start:middle]:
+
+            start = middle
+
+        else:
+
+            stop = middle
+
+    return start
+
+
+def _hex(view):
+    """Bytes in a memoryview as space separated hex pairs."""
+
+    return " ".join(f"{byte:02x}" for byte in view)
+
+
+def assert_sparse_equal_msg(actual, expected, msg_tag):
+    """Compares actual and expected scipy sparse matrices (or arrays) and asserts equality,
+    without converting either to a dense array.
+
+    Both are converted to canonical CSR format (sorted indices, no duplicate entries and
+    no explicitly stored zeros) and then the shapes, indptr, indices and data are compared
+    directly, so the time and memory used is proportional to the number of stored values.
+    NaN values in the same positions are considered equal. Note, as with
+    assert_array_equal_msg, dtypes are not compared.
+
+    If the matrices are not equal the AssertionException message gives the number of
+    unequal values and the row, column and values of the first of them.
+
+    Parameters
+    ----------
+    actual : scipy.sparse matrix or array
+        The actual object.
+
+    expected : scipy.sparse matrix or array
+        The expected object.
+
+    msg_tag : string
+        A tag for the AssertionException message.
+
+    """
+
+    if not sp.issparse(expected):
+
+        raise TypeError(
+            f"expected should be a scipy sparse matrix or array, but got {type(expected)}"
+        )
+
+    if not type(actual) == type(expected):
+
+        raise TypeError(
+            f"expected ({type(expected)}) and actual ({type(actual)}) type mismatch"
+        )
+
+    assert (
+        actual.shape == expected.shape
+    ), f"{msg_tag} - unequal shapes\n  Expected: {expected.shape}\n  Actual: {actual.shape}"
+
+    expected_csr = _canonical_csr(expected)
+    actual_csr = _canonical_csr(actual)
+
+    if (
+        np.array_equal(expected_csr.indptr, actual_csr.indptr)
+        and np.array_equal(expected_csr.indices, actual_csr.indices)
+        and _values_equal_nan(expected_csr.data, actual_csr.data).all()
+    ):
+
+        return
+
+    # positions (as row * n_columns + column) of the stored values, in row major order
+    n_columns = expected.shape[1]
+
+    expected_keys = _csr_keys(expected_csr, n_columns)
+    actual_keys = _csr_keys(actual_csr, n_columns)
+
+    keys = np.union1d(expected_keys, actual_keys)
+
+    expected_values = _csr_values_at(expected_keys, expected_csr.data, keys)
+    actual_values = _csr_values_at(actual_keys, actual_csr.data, keys)
+
+    unequal = np.flatnonzero(~_values_equal_nan(expected_values, actual_values))
+
+    first = unequal[0]
+
+    row, column = divmod(int(keys[first]), n_columns)
+
+    raise AssertionError(
+        f"{msg_tag} - {len(unequal)} unequal values, first at ({row}, {column})\n"
+        f"  Expected: {expected_values[first]}\n"
+        f"  Actual: {actual_values[first]}"
+    )
+
+
+def _canonical_csr(matrix):
+    """Copy of a sparse matrix in CSR format with sorted indices, no duplicates and no
+    explicitly stored zeros.
+    """
+
+    csr = matrix.tocsr(copy=True)
+
+    csr.sum_duplicates()
+    csr.eliminate_zeros()
+
+    return csr
+
+
+def _csr_keys(csr, n_columns):
+    """Position of each stored value of a canonical CSR matrix as row * n_columns + column."""
+
+    rows = np.repeat(np.arange(csr.shape[0], dtype=np.int64), np.diff(csr.indptr))
+
+    return rows * n_columns + csr.indices
+
+
+def _csr_values_at(csr_keys, data, keys):
+    """Values of a canonical CSR matrix at the positions in keys, which must include all
+    of csr_keys, with zeros for positions where no value is stored.
+    """
+
+    if len(csr_keys) == 0:
+
+        return np.zeros(len(keys), dtype=data.dtype)
+
+    positions = np.searchsorted(csr_keys, keys).clip(max=len(csr_keys) - 1)
+
+    return np.where(csr_keys[positions] == keys, data[positions], 0)
+
+
+def _values_equal_nan(values_1, values_2):
+    """Elementwise equality of two numpy arrays, with NaN equal to NaN for float and
+    complex arrays.
+    """
+
+    equal = values_1 == values_2
+
+    if values_1.dtype.kind in "fc" and values_2.dtype.kind in "fc":
+
+        equal |= np.isnan(values_1) & np.isnan(values_2)
+
+    return np.asarray(equal, dtype=bool)
+
+
+def assert_list_tuple_equal_msg(actual, expected, msg_tag):
+    """Compares two actual and expected list or tuple objects and asserts equality between the two.
+    Error output will identify location of mismatch in items.
+
+    Checks actual and expected are the same type, then equal length then loops through pariwise eleemnts
+    and calls assert_equal_dispatch function.
+
+    Parameters
+    ----------
+    actual : list or tuple
+        The actual list or tuple to compare.
+
+    expected : list or tuple
+        The expected list or tuple to compare to actual.
+
+    msg_tag : string
+        A tag for the AssertionException message.
+
+    """
+
+    if not type(expected) in [list, tuple]:
+
+        raise TypeError(
+            f"expected should be of type list or tuple, but got {type(expected)}"
+        )
+
+    if not type(actual) in [list, tuple]:
+
+        raise TypeError(
+            f"actual should be of type list or tuple, but got {type(actual)}"
+        )
+
+    if not type(actual) == type(expected):
+
+        raise TypeError(
+            f"expect ({type(expected)}) and actual ({type(actual)}) type mismatch"
+        )
+
+    assert len(expected) == len(
+        actual
+    ), f"Unequal lengths -\n  Expected: {len(expected)}\n  Actual: {len(actual)}"
+
+    if len(expected) >= _RECORDS_FAST_PATH_MIN_LENGTH:
+
+        cells = _records_unequal_cells(expected, actual, msg_tag)
+
+        if cells is not None:
+
+            for i, k in cells:
+
+                assert_equal_dispatch(
+                    expected[i][k], actual[i][k], f"{msg_tag} index {i} key {k}"
+                )
+
+            return
+
+    positions = range(len(expected))
+
+    if len(expected) >= _JSON_FAST_PATH_MIN_LENGTH and _json_like(
+        expected, actual, msg_tag
+    ):
+
+        positions = _unequal_positions(expected, actual)
+
+    for i in positions:
+
+        assert_equal_dispatch(expected[i], actual[i], f"{msg_tag} index {i}")
+
+
+def assert_dict_equal_msg(actual, expected, msg_tag):
+    """Compares two actual and expected dict objects and asserts equality. Error output
+    will identify (first) location of mismatch values.
+
+    Checks actual and expected are both dicts, then same number of keys then loops through pariwise
+    values from actual and expected and calls assert_equal_dispatch function on these pairs..
+
+    Parameters
+    ----------
+    actual : dict
+        The actual dict to compare.
+
+    expected : dict
+        The expected dict to compare to actual.
+
+    msg_tag : string
+        A tag for the AssertionException message.
+
+    """
+
+    if not isinstance(expected, dict):
+
+        raise TypeError(f"expected should be of type dict, but got {type(expected)}")
+
+    if not isinstance(actual, dict):
+
+        raise TypeError(f"actual should be of type dict, but got {type(actual)}")
+
+    assert len(expected.keys()) == len(
+        actual.keys()
+    ), f"Unequal number of keys -\n  Expected: {len(expected.keys())}\n  Actual: {len(actual.keys())}"
+
+    keys_diff_e_a = set(expected.keys()) - set(actual.keys())
+
+    keys_diff_a_e = set(actual.keys()) - set(expected.keys())
+
+    assert (
+        keys_diff_e_a == set()
+    ), f"Keys in expected not in actual: {keys_diff_e_a}\nKeys in actual not in expected: {keys_diff_a_e}"
+
+    keys = actual.keys()
+
+    if len(expected) >= _JSON_FAST_PATH_MIN_LENGTH and _json_like(
+        expected, actual, msg_tag
+    ):
+
+        keys = _unequal_positions(expected, actual)
+
+    for k in keys:
+
+        assert_equal_dispatch(expected[k], actual[k], f"{msg_tag} key {k}")
+
+
+def assert_frame_equal_msg(
+    actual, expected, msg_tag, print_actual_and_expected=False, **kwargs
+):
+    """Compares actual and expected pandas.DataFrames and asserts equality.
+
+    Calls pd.testing.assert_frame_equal but presents msg_tag, and optionally actual and expected
+    DataFrames, in addition to any other exception info.
+
+    Parameters
+    ----------
+    actual : pandas DataFrame
+        The expected dataframe.
+
+    expected : pandas DataFrame
+        The actual dataframe.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    **kwargs:
+        Keyword args passed to pd.testing.assert_frame_equal.
+
+    Notes
+    -----
+    If no kwargs are passed and both DataFrames have identical labels and the same numeric
+    numpy dtypes then the column buffers are compared byte-wise first, pd.testing.assert_frame_equal
+    is only called if this does not show the DataFrames to be equal. Categorical columns
+    are included by comparing their categories and then their integer codes, and
+    string[pyarrow] columns by comparing their Arrow arrays.
+
+    If no kwargs are passed and object columns of expected hold nested values, e.g. lists,
+    dicts or arrays, then the other columns are compared with pd.testing.assert_frame_equal
+    and the values in these columns as in assert_array_equal_msg, the error gives the row
+    and column of the first value that differs.
+
+    """
+
+    if not kwargs and _frame_buffers_equal(expected, actual):
+
+        return
+
+    nested = [] if kwargs else _nested_object_columns(expected, actual)
+
+    try:
+
+        if nested:
+
+            others = [i for i in range(expected.shape[1]) if i not in nested]
+
+            pd.testing.assert_frame_equal(
+                expected.iloc[:, others], actual.iloc[:, others]
+            )
+
+            for i in nested:
+
+                column = expected.columns[i]
+
+                if not _assert_object_values_equal(
+                    expected.iloc[:, i].to_numpy(),
+                    actual.iloc[:, i].to_numpy(),
+                    lambda j: f"{msg_tag} row {expected.index[j]} column {column}",
+                    any_missing_equal=True,
+                ):
+
+                    pd.testing.assert_series_equal(
+                        expected.iloc[:, i], actual.iloc[:, i]
+                    )
+
+        else:
+
+            pd.testing.assert_frame_equal(expected, actual, **kwargs)
+
+    except Exception as e:
+
+        if print_actual_and_expected:
+
+            error_msg = f"""{msg_tag}\nexpected:\n{expected}\nactual:\n{actual}"""
+
+        else:
+
+            error_msg = msg_tag
+
+        raise AssertionError(error_msg) from e
+
+
+def _row_diff_blocks(expected, actual):
+    """Align two sequences of (row) hashes with a patience diff.
+
+    Parameters
+    ----------
+    expected : np.ndarray
+        Hashes of the expected rows.
+
+    actual : np.ndarray
+        Hashes of the actual rows.
+
+    Returns
+    -------
+    list
+        (expected_start, expected_stop, actual_start, actual_stop) for each block of rows
+        that are not matched, in order. Blocks empty on one side are deletions from
+        expected or insertions into actual, others are modifications.
+
+    """
+
+    blocks = []
+
+    # ranges still to diff, the next range to diff is last so blocks are found in order
+    ranges = [(0, len(expected), 0, len(actual))]
+
+    while ranges:
+
+        expected_start, expected_stop, actual_start, actual_stop = ranges.pop()
+
+        prefix = _common_prefix_length(
+            expected[expected_start:expected_stop], actual[actual_start:actual_stop]
+        )
+
+        expected_start += prefix
+        actual_start += prefix
+
+        suffix = _common_prefix_length(
+            expected[expected_start:expected_stop][::-1],
+            actual[actual_start:actual_stop][::-1],
+        )
+
+        expected_stop -= suffix
+        actual_stop -= suffix
+
+        block = (expected_start, expected_stop, actual_start, actual_stop)
+
+        if expected_start == expected_stop or actual_start == actual_stop:
+
+            if expected_start != expected_stop or actual_start != actual_stop:
+
+                blocks.append(block)
+
+            continue
+
+        expected_anchors, actual_anchors = _unique_anchors(
+            expected[expected_start:expected_stop], actual[actual_start:actual_stop]
+        )
+
+        if not len(expected_anchors):
+
+            blocks.append(block)
+
+            continue
+
+        # gaps before, between and after the anchors
+        expected_bounds = np.concatenate(
+            [[-1], expected_anchors, [expected_stop - expected_start]]
+        )
+        actual_bounds = np.concatenate(
+            [[-1], actual_anchors, [actual_stop - actual_start]]
+        )
+
+        gaps = np.flatnonzero(
+            (np.diff(expected_bounds) > 1) | (np.diff(actual_bounds) > 1)
+        ).tolist()
+
+        for i in reversed(gaps):
+
+            ranges.append(
+                (
+                    expected_start + int(expected_bounds[i]) + 1,
+                    expected_start + int(expected_bounds[i + 1]),
+                    actual_start + int(actual_bounds[i]) + 1,
+                    actual_start + int(actual_bounds[i + 1]),
+                )
+            )
+
+    return blocks
+
+
+def _common_prefix_length(values_1, values_2):
+    """Number of values at the start of two arrays that are equal."""
+
+    n = min(len(values_1), len(values_2))
+
+    different = np.flatnonzero(values_1[:n] != values_2[:n])
+
+    return int(different[0]) if len(different) else n
+
+
+def _unique_anchors(expected, actual):
+    """Positions of the values that occur exactly once in both expected and actual, keeping
+    only the longest sequence of them that is in the same order in both.
+    """
+
+    expected_values, expected_positions, expected_counts = np.unique(
+        expected, return_index=True, return_counts=True
+    )
+    actual_values, actual_positions, actual_counts = np.unique(
+        actual, return_index=True, return_counts=True
+    )
+
+    expected_unique = expected_counts == 1
+    actual_unique = actual_counts == 1
+
+    _, expected_matches, actual_matches = np.intersect1d(
+        expected_values[expected_unique],
+        actual_values[actual_unique],
+        assume_unique=True,
+        return_indices=True,
+    )
+
+    expected_anchors = expected_positions[expected_unique][expected_matches]
+    actual_anchors = actual_positions[actual_unique][actual_matches]
+
+    order = np.argsort(expected_anchors)
+
+    expected_anchors = expected_anchors[order]
+    actual_anchors = actual_anchors[order]
+
+    if not np.all(np.diff(actual_anchors) > 0):
+
+        keep = _longest_increasing_subsequence(actual_anchors.tolist())
+
+        expected_anchors = expected_anchors[keep]
+        actual_anchors = actual_anchors[keep]
+
+    return expected_anchors, actual_anchors
+
+
+def _longest_increasing_subsequence(values):
+    """Positions of a longest strictly increasing subsequence of values."""
+
+    # position of the smallest last value of the increasing subsequences of each length
+    tails = []
+    tail_values = []
+    previous = [-1] * len(values)
+
+    for i, value in enumerate(values):
+
+        length = bisect.bisect_left(tail_values, value)
+
+        if length:
+
+            previous[i] = tails[length - 1]
+
+        if length == len(tails):
+
+            tails.append(i)
+            tail_values.append(value)
+
+        else:
+
+            tails[length] = i
+            tail_values[length] = value
+
+    positions = []
+
+    i = tails[-1] if tails else -1
+
+    while i != -1:
+
+        positions.append(i)
+        i = previous[i]
+
+    return positions[::-1]
+
+
+def assert_series_equal_msg(
+    actual, expected, msg_tag, print_actual_and_expected=False, **kwargs
+):
+    """Compares actual and expected pandas.Series and asserts equality.
+    Calls pd.testing.assert_series_equal but presents msg_tag, and optionally actual and expected
+    Series, in addition to any other exception info.
+
+    Parameters
+    ----------
+    actual : pandas Series
+        The actual Series.
+
+    expected : pandas Series
+        The expected Series.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    print_actual_and_expected : Boolean
+        print the actual and expected dataFrame along with error message tag
+
+    **kwargs:
+        Keyword args passed to pd.testing.assert_series_equal.
+
+    Notes
+    -----
+    If no kwargs are passed and both Series have identical index labels, names and the same
+    numeric numpy, categorical or string[pyarrow] dtype then their values are compared as
+    the columns in assert_frame_equal_msg are, pd.testing.assert_series_equal is only called
+    if this does not show the Series to be equal.
+
+    If no kwargs are passed and both Series are of object dtype and expected holds nested
+    values, e.g. lists, dicts or arrays, then the values are compared as in
+    assert_array_equal_msg, the error gives the index label of the first value that differs.
+
+    """
+
+    if not kwargs and _series_buffers_equal(expected, actual):
+
+        return
+
+    nested = (
+        not kwargs
+        and expected.dtype == object
+        and actual.dtype == object
+        and _nested_values(expected.to_numpy())
+    )
+
+    try:
+
+        if nested:
+
+            pd.testing.assert_series_equal(expected.iloc[:0], actual.iloc[:0])
+            pd.testing.assert_index_equal(expected.index, actual.index)
+
+        if not (
+            nested
+            and _assert_object_values_equal(
+                expected.to_numpy(),
+                actual.to_numpy(),
+                lambda i: f"{msg_tag} index {expected.index[i]}",
+                any_missing_equal=True,
+            )
+        ):
+
+            pd.testing.assert_series_equal(expected, actual, **kwargs)
+
+    except Exception as e:
+
+        if print_actual_and_expected:
+
+            error_msg = f"""{msg_tag}\nexpected:\n{expected}\nactual:\n{actual}"""
+
+        else:
+
+            error_msg = msg_tag
+
+        raise AssertionError(error_msg) from e
+
+
+def assert_index_equal_msg(
+    actual, expected, msg_tag, print_actual_and_expected=False, **kwargs
+):
+    """Compares actual and expected pandas.Index objects and asserts equality.
+    Calls pd.testing.assert_index_equal but presents msg_tag, and optionally actual and expected
+    Series, in addition to any other exception info.
+
+    Parameters
+    ----------
+    actual : pd.Index
+        The actual index.
+
+    expected : pd.Index
+        The expected index.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    print_actual_and_expected : Boolean
+        print the actual and expected valuess along with error message tag
+
+    **kwargs:
+        Keyword args passed to pd.testing.assert_index_equal.
+
+    """
+
+    # indexes that can be shown to be equal from their structure alone (same
+    # underlying data or the same range) skip the element-wise comparison
+    if (
+        isinstance(expected, pd.Index)
+        and type(expected) is type(actual)
+        and _index_values_trivially_equal(expected, actual)
+        and expected.names == actual.names
+    ):
+
+        return
+
+    try:
+
+        pd.testing.assert_index_equal(expected, actual, **kwargs)
+
+    except Exception as e:
+
+        if print_actual_and_expected:
+
+            error_msg = f"""{msg_tag}\nexpected:\n{expected}\nactual:\n{actual}"""
+
+        else:
+
+            error_msg = msg_tag
+
+        raise AssertionError(error_msg) from e
+
+
+def _index_values_trivially_equal(index_1, index_2):
+    """Check if two pd.Index objects hold the same values using only their structure.
+
+    Indexes that are views onto the same underlying data, or that are both
+    pd.RangeIndex objects describing the same range, are known to be equal without
+    comparing them element by element. Note, index names are not considered.
+
+    Parameters
+    ----------
+    index_1 : pd.Index
+        First index to compare.
+
+    index_2 : pd.Index
+        Second index to compare.
+
+    Returns
+    -------
+    bool
+        True if the indexes are known to hold the same values, False if an element-wise
+        comparison is still required to tell.
+
+    """
+
+    if index_1.is_(index_2):
+
+        return True
+
+    if type(index_1) is pd.RangeIndex and type(index_2) is pd.RangeIndex:
+
+        return range(index_1.start, index_1.stop, index_1.step) == range(
+            index_2.start, index_2.stop, index_2.step
+        )
+
+    return False
+
+
+def assert_array_equal_msg(
+    actual, expected, msg_tag, print_actual_and_expected=False, **kwargs
+):
+    """Compares actual and expected np.arrays and asserts equality.
+    Calls np.testing.assert_array_equal but presents msg_tag, and optionally actual and expected
+    arrays, in addition to any other exception info.
+
+    Parameters
+    ----------
+    actual : numpy array
+        The actual array.
+
+    expected : numpy array
+        The expected array.
+
+    msg_tag : string
+        A tag for the assert error message.
 
     print_actual_and_expected : Boolean
         print the actual and expected arrays along with error message tag
 
     **kwargs:
         Keyword args passed to np.testing.assert_array_equal.
+
+    Notes
+    -----
+    If no kwargs are passed and both arrays are C-contiguous numeric arrays with the same
+    dtype and shape then their raw buffers are compared byte-wise first, np.testing.assert_array_equal
+    is only called if the buffers differ.
+
+    If no kwargs are passed structured (including record) arrays and masked arrays are not
+    passed to np.testing.assert_array_equal. Structured arrays are compared field by field
+    and the error gives the (first) field and index that differ. For masked arrays the masks
+    must be equal and values are only compared where they are not masked.
+
+    If no kwargs are passed and both arrays are of object dtype and hold nested values,
+    e.g. lists, dicts or arrays, then the scalar values are compared in bulk and each of
+    the nested values with assert_equal_dispatch, the error gives the index of the first
+    value that differs.
+
     """
     # If actual or expected is a scalar, numpy will check whether each entry in
     # the other array is equal to the scalar. Therefore need to check type.
@@ -414,9 +2129,45 @@ def assert_array_equal_msg(
             f"actual should be of type numpy ndarray, but got {type(actual)}"
         )
 
+    if not kwargs and _array_buffers_equal(expected, actual):
+
+        return
+
+    if not kwargs and (
+        expected.dtype.names is not None
+        or isinstance(expected, np.ma.MaskedArray)
+        or isinstance(actual, np.ma.MaskedArray)
+    ):
+
+        difference = _structured_masked_difference(expected, actual)
+
+        if difference is not None:
+
+            if print_actual_and_expected:
+
+                difference += f"\nexpected:\n{expected}\nactual:\n{actual}"
+
+            raise AssertionError(f"{msg_tag} - {difference}")
+
+        return
+
+    nested = (
+        not kwargs
+        and expected.dtype == object
+        and actual.dtype == object
+        and expected.shape == actual.shape
+    )
+
     try:
 
-        np.testing.assert_array_equal(expected, actual, **kwargs)
+        if not (
+            nested
+            and _assert_object_values_equal(
+                expected, actual, _array_location(msg_tag, expected.shape)
+            )
+        ):
+
+            np.testing.assert_array_equal(expected, actual, **kwargs)
 
     except Exception as e:
 
@@ -429,3 +2180,563 @@ def assert_array_equal_msg(
             error_msg = msg_tag
 
         raise AssertionError(error_msg) from e
+
+
+def _structured_masked_difference(expected, actual):
+    """Description of the first difference between two structured and / or masked arrays,
+    None if they are equal. See assert_array_equal_msg.
+    """
+
+    if expected.shape != actual.shape:
+
+        return f"unequal shapes\n  Expected: {expected.shape}\n  Actual: {actual.shape}"
+
+    masked = isinstance(expected, np.ma.MaskedArray) or isinstance(
+        actual, np.ma.MaskedArray
+    )
+
+    expected_mask = np.ma.getmaskarray(expected) if masked else None
+    actual_mask = np.ma.getmaskarray(actual) if masked else None
+
+    for field, equal, values in _field_equality(
+        np.asarray(expected),
+        np.asarray(actual),
+        expected_mask,
+        actual_mask,
+        expected.shape,
+        "",
+    ):
+
+        if equal is None:
+
+            return f"unequal fields{field} -\n  Expected: {values[0]}\n  Actual: {values[1]}"
+
+        if equal.all():
+
+            continue
+
+        index = tuple(int(i) for i in np.argwhere(~equal)[0])
+
+        expected_values, actual_values, expected_field_mask, actual_field_mask = values
+
+        return (
+            f"{int((~equal).sum())} of {equal.size} elements unequal{field}, first at index {index}\n"
+            f"  Expected: {_masked_value(expected_values, expected_field_mask, index)}\n"
+            f"  Actual: {_masked_value(actual_values, actual_field_mask, index)}"
+        )
+
+    return None
+
+
+def _field_equality(expected, actual, expected_mask, actual_mask, shape, field):
+    """Yield the field description, element equality (reduced to shape) and the values and
+    masks compared for each (nested) field of two arrays, or for the arrays themselves if
+    they are not structured. If the field names differ the equality is None and the names
+    are yielded in place of the values.
+    """
+
+    if expected.dtype.names is not None or actual.dtype.names is not None:
+
+        if expected.dtype.names != actual.dtype.names:
+
+            yield field, None, (expected.dtype.names, actual.dtype.names)
+
+            return
+
+        for name in expected.dtype.names:
+
+            yield from _field_equality(
+                expected[name],
+                actual[name],
+                None if expected_mask is None else expected_mask[name],
+                None if actual_mask is None else actual_mask[name],
+                shape,
+                f"{field}.{name}" if field else f" in field {name}",
+            )
+
+        return
+
+    equal = _values_equal_nan(expected, actual)
+
+    if expected_mask is not None:
+
+        # equal if masked in both, unequal if masked in only one
+        equal = (expected_mask == actual_mask) & (equal | expected_mask)
+
+    if equal.ndim > len(shape):
+
+        # sub-array fields, elements are only equal if all values in the sub-array are
+        equal = equal.reshape(shape + (-1,)).all(axis=-1)
+
+    yield field, equal, (expected, actual, expected_mask, actual_mask)
+
+
+def _masked_value(values, mask, index):
+    """Value at index, or "masked" if it is masked."""
+
+    if mask is not None and mask[index].any():
+
+        return (
+            "masked"
+            if mask[index].all()
+            else np.ma.array(values[index], mask=mask[index])
+        )
+
+    return values[index]
+
+
+def _assert_object_values_equal(expected, actual, location, any_missing_equal=False):
+    """Compare object arrays of the same shape that hold nested values, e.g. lists, dicts
+    or arrays, and raise an error for the first position (in C order) that differs.
+
+    The scalar values, i.e. those that assert_equal_dispatch would compare with ==, are
+    split out and compared in bulk. Only the nested values, and any scalar values that
+    are not equal, are passed on to assert_equal_dispatch and assert_equal_msg
+    respectively. Missing values (None, NaN, pd.NA, NaT) are equal if they are of the
+    same type or, if any_missing_equal is True, always as in pd.testing.
+
+    Parameters
+    ----------
+    expected : numpy ndarray
+        Expected values, of object dtype.
+
+    actual : numpy ndarray
+        Actual values, of object dtype and the same shape as expected.
+
+    location : callable
+        Called with the flat position of a value to give the msg for comparing it.
+
+    any_missing_equal : bool, default = False
+        Treat all missing values as equal, whatever their type.
+
+    Returns
+    -------
+    bool
+        False, without comparing anything, if neither array holds nested values or the
+        scalar values cannot be compared in bulk. Otherwise True, if all values are equal.
+
+    """
+
+    expected_flat = expected.ravel()
+    actual_flat = actual.ravel()
+
+    expected_values = expected_flat.tolist()
+    actual_values = actual_flat.tolist()
+
+    expected_types = list(map(type, expected_values))
+    actual_types = list(map(type, actual_values))
+
+    scalar_types = {
+        value_type: _scalar_type(value_type)
+        for value_type in set(expected_types) | set(actual_types)
+    }
+
+    if all(scalar_types.values()):
+
+        return False
+
+    is_scalar = np.fromiter(
+        map(
+            operator.and_,
+            map(scalar_types.__getitem__, expected_types),
+            map(scalar_types.__getitem__, actual_types),
+        ),
+        dtype=bool,
+        count=len(expected_values),
+    )
+
+    scalar_positions = np.flatnonzero(is_scalar)
+
+    try:
+
+        scalars_equal = _object_scalars_equal(
+            expected_flat[scalar_positions],
+            actual_flat[scalar_positions],
+            any_missing_equal,
+        )
+
+    except Exception:
+
+        return False
+
+    budgets = getattr(_budget_state, "active", None)
+
+    if budgets:
+
+        for budget in budgets:
+
+            budget.charge(0, location(0), n_nodes=len(scalar_positions))
+
+    positions = np.union1d(scalar_positions[~scalars_equal], np.flatnonzero(~is_scalar))
+
+    for i in positions.tolist():
+
+        if is_scalar[i]:
+
+            assert_equal_msg(actual_values[i], expected_values[i], location(i))
+
+        else:
+
+            assert_equal_dispatch(expected_values[i], actual_values[i], location(i))
+
+    return True
+
+
+def _object_scalars_equal(expected, actual, any_missing_equal=False):
+    """Elementwise equality of 1d object arrays of scalar values, with missing values
+    equal if they are of the same type, or always if any_missing_equal is True.
+    """
+
+    if _pandas_loaded():
+
+        expected_missing = pd.isna(expected)
+        actual_missing = pd.isna(actual)
+
+    else:
+
+        expected_missing = np.fromiter(map(_is_float_nan, expected), dtype=bool)
+        actual_missing = np.fromiter(map(_is_float_nan, actual), dtype=bool)
+
+    compared = ~(expected_missing | actual_missing)
+    both_missing = expected_missing & actual_missing
+
+    equal = np.zeros(len(expected), dtype=bool)
+
+    equal[compared] = expected[compared] == actual[compared]
+
+    if any_missing_equal:
+
+        equal[both_missing] = True
+
+        return equal
+
+    equal[both_missing] = list(
+        map(
+            operator.is_,
+            map(type, expected[both_missing]),
+            map(type, actual[both_missing]),
+        )
+    )
+
+    return equal
+
+
+def _is_float_nan(value):
+
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _nested_values(values):
+    """Check if a numpy object array holds any nested values, i.e. values that are not
+    compared with == by assert_equal_dispatch.
+    """
+
+    return not all(map(_scalar_type, set(map(type, values.ravel().tolist()))))
+
+
+def _nested_object_columns(expected, actual):
+    """Positions of the columns that are of object dtype in both DataFrames and hold nested
+    values in expected, if the DataFrames have the same columns.
+    """
+
+    if not (
+        isinstance(actual, pd.DataFrame)
+        and expected.shape[1] == actual.shape[1]
+        and expected.columns.equals(actual.columns)
+    ):
+
+        return []
+
+    return [
+        i
+        for i, (expected_dtype, actual_dtype) in enumerate(
+            zip(expected.dtypes, actual.dtypes)
+        )
+        if expected_dtype == object
+        and actual_dtype == object
+        and _nested_values(expected.iloc[:, i].to_numpy())
+    ]
+
+
+def _array_location(msg_tag, shape):
+    """Function giving the msg for the value at a flat position in an array of shape."""
+
+    if len(shape) == 1:
+
+        return lambda i: f"{msg_tag} index {i}"
+
+    return lambda i: f"{msg_tag} index {tuple(map(int, np.unravel_index(i, shape)))}"
+
+
+def _array_buffers_equal(array_1, array_2):
+    """Check if two numpy arrays are equal by comparing their raw buffers byte-wise.
+
+    Only C-contiguous np.ndarrays with the same numeric dtype and shape are considered,
+    for these arrays identical bytes mean identical values (including any NaNs in the
+    same positions). The buffers are viewed as unsigned integer words and compared in
+    fixed size chunks so no full size boolean array is created and the comparison stops
+    at the first chunk that differs.
+
+    Parameters
+    ----------
+    array_1 : object
+        First array to compare.
+
+    array_2 : object
+        Second array to compare.
+
+    Returns
+    -------
+    bool
+        True if the arrays are known to be equal, False if they differ or are not eligible
+        for the byte-wise comparison.
+
+    """
+
+    if not (type(array_1) is np.ndarray and type(array_2) is np.ndarray):
+
+        return False
+
+    if (
+        array_1.dtype != array_2.dtype
+        or array_1.dtype.kind not in _BUFFER_COMPARE_DTYPE_KINDS
+        or array_1.shape != array_2.shape
+        or not array_1.flags.c_contiguous
+        or not array_2.flags.c_contiguous
+    ):
+
+        return False
+
+    if array_1.nbytes == 0 or array_1.ctypes.data == array_2.ctypes.data:
+
+        return True
+
+    word_size = next(size for size in (8, 4, 2, 1) if array_1.nbytes % size == 0)
+    word_dtype = np.dtype(f"u{word_size}")
+
+    words_1 = np.frombuffer(memoryview(array_1).cast("B"), dtype=word_dtype)
+    words_2 = np.frombuffer(memoryview(array_2).cast("B"), dtype=word_dtype)
+
+    chunk_size = _BUFFER_COMPARE_CHUNK_BYTES // word_size
+
+    for start in range(0, words_1.shape[0], chunk_size):
+
+        if not np.array_equal(
+            words_1[start : start + chunk_size], words_2[start : start + chunk_size]
+        ):
+
+            return False
+
+    return True
+
+
+def _frame_buffers_equal(frame_1, frame_2):
+    """Check if two pd.DataFrames are equal by comparing the raw buffers of their columns.
+
+    The DataFrames must be the same type, have identical index and column labels and
+    have the same dtypes, which must be numeric numpy, categorical or string[pyarrow], for
+    every column. Each pair of columns is then compared with _column_buffers_equal.
+
+    Parameters
+    ----------
+    frame_1 : object
+        First DataFrame to compare.
+
+    frame_2 : object
+        Second DataFrame to compare.
+
+    Returns
+    -------
+    bool
+        True if the DataFrames are known to be equal, False if they differ or are not
+        eligible for the byte-wise comparison.
+
+    """
+
+    if not (isinstance(frame_1, pd.DataFrame) and type(frame_1) is type(frame_2)):
+
+        return False
+
+    if frame_1.shape != frame_2.shape or getattr(frame_1, "flags", None) != getattr(
+        frame_2, "flags", None
+    ):
+
+        return False
+
+    if not (
+        _index_labels_identical(frame_1.index, frame_2.index)
+        and _index_labels_identical(frame_1.columns, frame_2.columns)
+    ):
+
+        return False
+
+    dtypes_1 = list(frame_1.dtypes)
+
+    if dtypes_1 != list(frame_2.dtypes) or not all(
+        map(_buffer_comparable_dtype, dtypes_1)
+    ):
+
+        return False
+
+    for (_, column_1), (_, column_2) in zip(frame_1.items(), frame_2.items()):
+
+        if not _column_buffers_equal(column_1, column_2):
+
+            return False
+
+    return True
+
+
+def _series_buffers_equal(series_1, series_2):
+    """Check if two pd.Series are equal by comparing the raw buffers of their values.
+
+    The Series must be the same type, have identical index labels and names and the
+    same dtype, which must be one that _column_buffers_equal can compare.
+
+    Parameters
+    ----------
+    series_1 : object
+        First Series to compare.
+
+    series_2 : object
+        Second Series to compare.
+
+    Returns
+    -------
+    bool
+        True if the Series are known to be equal, False if they differ or are not
+        eligible for the byte-wise comparison.
+
+    """
+
+    if not (isinstance(series_1, pd.Series) and type(series_1) is type(series_2)):
+
+        return False
+
+    if (
+        series_1.shape != series_2.shape
+        or getattr(series_1, "flags", None) != getattr(series_2, "flags", None)
+        or [series_1.name] != [series_2.name]
+        or series_1.dtype != series_2.dtype
+        or not _buffer_comparable_dtype(series_1.dtype)
+    ):
+
+        return False
+
+    if not _index_labels_identical(series_1.index, series_2.index):
+
+        return False
+
+    return _column_buffers_equal(series_1, series_2)
+
+
+def _buffer_comparable_dtype(dtype):
+    """Check if values of dtype can be compared by _column_buffers_equal; numeric numpy
+    dtypes, categoricals and Arrow backed strings.
+    """
+
+    if isinstance(dtype, np.dtype):
+
+        return dtype.kind in _BUFFER_COMPARE_DTYPE_KINDS
+
+    return isinstance(dtype, pd.CategoricalDtype) or _arrow_string_dtype(dtype)
+
+
+def _arrow_string_dtype(dtype):
+    """Check if dtype is the string[pyarrow] dtype."""
+
+    return (
+        isinstance(dtype, getattr(pd, "StringDtype", ()))
+        and getattr(dtype, "storage", None) == "pyarrow"
+    )
+
+
+def _column_buffers_equal(column_1, column_2):
+    """Check if the values of two pd.Series of the same (_buffer_comparable_dtype) dtype
+    are equal without decoding them to python objects.
+
+    Numeric numpy values are compared with _array_buffers_equal. For categoricals the
+    categories must be identical (same inferred type, values and order) and then the
+    integer codes are compared with _array_buffers_equal.
+    Arrow backed strings are compared with pyarrow, which treats nulls in the same
+    positions as equal.
+
+    Parameters
+    ----------
+    column_1 : pd.Series
+        First Series of values to compare.
+
+    column_2 : pd.Series
+        Second Series of values to compare, of the same dtype as column_1.
+
+    Returns
+    -------
+    bool
+        True if the values are known to be equal, False if they differ or are not
+        eligible for the comparison.
+
+    """
+
+    dtype = column_1.dtype
+
+    if isinstance(dtype, np.dtype):
+
+        return _array_buffers_equal(column_1.to_numpy(), column_2.to_numpy())
+
+    values_1 = column_1.array
+    values_2 = column_2.array
+
+    if isinstance(dtype, pd.CategoricalDtype):
+
+        # equal unordered dtypes can have categories in different orders, in which
+        # case the codes of equal values differ, and categories that are equal by ==
+        # can have different types e.g. 1 and 1.0, so the categories must be identical
+        return _index_labels_identical(
+            values_1.categories, values_2.categories
+        ) and _array_buffers_equal(
+            np.ascontiguousarray(values_1.codes), np.ascontiguousarray(values_2.codes)
+        )
+
+    if _arrow_string_dtype(dtype):
+
+        return values_1.__arrow_array__().equals(values_2.__arrow_array__())
+
+    return False
+
+
+def _index_labels_identical(index_1, index_2):
+    """Check if two (non multi) pd.Index objects have the same type, dtype, names, freq
+    and values, i.e. they would pass pd.testing.assert_index_equal with any options.
+
+    Index.equals alone is not enough for object and categorical indexes, it treats 1 and
+    1.0 as equal and ignores the order of categories. Object indexes must also have the
+    same inferred_type and categorical indexes identical categories in the same order.
+    """
+
+    if isinstance(index_1, pd.MultiIndex) or type(index_1) is not type(index_2):
+
+        return False
+
+    if (
+        index_1.dtype != index_2.dtype
+        or index_1.names != index_2.names
+        or getattr(index_1, "freq", None) != getattr(index_2, "freq", None)
+    ):
+
+        return False
+
+    if _index_values_trivially_equal(index_1, index_2):
+
+        return True
+
+    if isinstance(index_1.dtype, pd.CategoricalDtype):
+
+        if not _index_labels_identical(index_1.categories, index_2.categories):
+
+            return False
+
+    elif index_1.dtype == object and index_1.inferred_type != index_2.inferred_type:
+
+        return False
+
+    return index_1.equals(index_2)
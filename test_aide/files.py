@@ -0,0 +1,1158 @@
+"""
+This module contains helper functions to compare tabular data stored in files, e.g.
+Parquet, CSV or JSON lines, that may be too large to load into memory at once.
+
+The files are read in batches of rows and compared without ever holding the whole of
+either file in memory. Differences are reported in the same way as the DataFrame
+comparisons in the equality module.
+
+Note, if either pandas or numpy libraries are not installed then this module will
+not be available when the package is loaded. Reading Parquet files also requires pyarrow.
+
+"""
+
+import hashlib
+import json
+import os
+import pickle  # nosec B403
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+
+try:
+
+    import pandas as pd
+
+except ModuleNotFoundError as err:
+
+    raise ImportError(
+        "pandas must be installed to use functionality in files module"
+    ) from err
+
+try:
+
+    import numpy as np
+
+except ModuleNotFoundError as err:
+
+    raise ImportError(
+        "numpy must be installed to use functionality in files module"
+    ) from err
+
+from test_aide import metrics
+from test_aide.equality import assert_equal_dispatch, _frame_buffers_equal
+from test_aide.frames import (
+    _column_rules,
+    _differences_on_keys,
+    _keys_list,
+    _values_equal,
+)
+
+# file format for each (lower case) file extension
+_FILE_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+# extensions of compressed files that pandas decompresses when reading CSV or JSON lines
+_COMPRESSION_EXTENSIONS = (".gz", ".bz2", ".zip", ".xz", ".zst")
+
+# statuses of the files compared by compare_directories, files are only counted as
+# differences if their status is not identical or equal
+_FILE_STATUSES = ("identical", "equal", "different", "missing", "extra", "error")
+
+# size of the blocks files are read in to hash their content
+_HASH_BLOCK_BYTES = 1 << 20
+
+# formats where the dtypes of columns are inferred from each batch of rows, so can differ
+# between batches and files
+_TEXT_FORMATS = ("csv", "jsonl")
+
+# hash value of missing values in int and float columns, see _numeric_hash_values
+_MISSING_HASH_VALUE = np.float64(np.nan).view(np.int64)
+
+
+def assert_large_files_equal_msg(
+    actual_path,
+    expected_path,
+    msg_tag,
+    keys=None,
+    batch_rows=100_000,
+    n_partitions=64,
+    temp_dir=None,
+    check_exact=False,
+    rtol=1e-5,
+    atol=1e-8,
+    column_rules=None,
+    max_rows_shown=10,
+):
+    """Compares the rows of two (Parquet, CSV or JSON lines) files, in any order, and asserts
+    equality without loading either file into memory.
+
+    Each file is read in batches of batch_rows rows. The rows of each batch are hashed,
+    on the key columns if keys are given or otherwise on all their values, and spilled to
+    one of n_partitions files in a temporary directory according to their hash. Rows with
+    the same keys (or values) therefore end up in the same partition of both files and
+    the files are compared one partition at a time, so peak memory is roughly one batch
+    or one pair of partitions rather than both files.
+
+    If keys are given the rows of each partition are aligned on them and compared as in
+    frames.assert_frame_equal_on_keys_msg. Otherwise the files must contain the same
+    rows the same number of times. The hashes only choose the partition of each row, the
+    rows of each pair of partitions are counted by their values, which are compared
+    exactly, so rows with the same hash but different values are still different.
+
+    For CSV and JSON lines files the dtypes of columns are inferred from each batch, so
+    numeric columns are compared as floats if their dtypes differ between the files.
+
+    Parameters
+    ----------
+    actual_path : str or os.PathLike
+        Path to the file of actual rows.
+
+    expected_path : str or os.PathLike
+        Path to the file of expected rows.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    keys : str, list of str or None, default = None
+        Column(s) that uniquely identify the expected rows, to align the rows on.
+
+    batch_rows : int, default = 100_000
+        Number of rows to read from a file at once.
+
+    n_partitions : int, default = 64
+        Number of partitions to spill the rows of each file to, the size of each partition
+        is roughly the size of the file divided by n_partitions.
+
+    temp_dir : str, os.PathLike or None, default = None
+        Directory to create the (temporary) directory of spilled partitions in, if None the
+        default temporary directory is used.
+
+    check_exact : bool, default = False
+        Passed to frames.assert_frame_equal_on_keys_msg if keys are given.
+
+    rtol : float, default = 1e-5
+        Passed to frames.assert_frame_equal_on_keys_msg if keys are given.
+
+    atol : float, default = 1e-8
+        Passed to frames.assert_frame_equal_on_keys_msg if keys are given.
+
+    column_rules : dict or None, default = None
+        Passed to frames.assert_frame_equal_on_keys_msg if keys are given.
+
+    max_rows_shown : int, default = 10
+        Maximum number of keys, changed values or rows to show for each difference in the
+        assert error message.
+
+    Raises
+    ------
+    AssertionError
+        If the files do not have the same columns or rows. With keys, the message gives the
+        differences found in each partition that differs, as in
+        frames.assert_frame_equal_on_keys_msg. Without keys, the message gives the number
+        of rows missing from actual and not in expected with examples of each.
+
+    """
+
+    with metrics.record("files.assert_large_files_equal_msg"):
+
+        for name, path in [
+            ("actual_path", actual_path),
+            ("expected_path", expected_path),
+        ]:
+
+            if not isinstance(path, (str, os.PathLike)):
+
+                raise TypeError(
+                    f"{name} should be a str or os.PathLike but got {type(path)}"
+                )
+
+        if keys is not None:
+
+            keys = _keys_list(keys)
+
+        for name, value in [("batch_rows", batch_rows), ("n_partitions", n_partitions)]:
+
+            if not (type(value) is int and value > 0):
+
+                raise ValueError(f"{name} should be a positive int")
+
+        text_format = any(
+            _file_format(path) in _TEXT_FORMATS for path in [actual_path, expected_path]
+        )
+
+        with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+
+            expected_schema = _spill_partitions(
+                expected_path,
+                keys,
+                n_partitions,
+                batch_rows,
+                os.path.join(directory, "expected"),
+            )
+
+            actual_schema = _spill_partitions(
+                actual_path,
+                keys,
+                n_partitions,
+                batch_rows,
+                os.path.join(directory, "actual"),
+            )
+
+            if list(expected_schema.columns) != list(actual_schema.columns):
+
+                raise AssertionError(
+                    f"{msg_tag} - columns -\n  Expected: {list(expected_schema.columns)}\n  Actual: {list(actual_schema.columns)}"
+                )
+
+            if keys is None:
+
+                differences = _unordered_rows_differences(
+                    directory,
+                    n_partitions,
+                    expected_schema,
+                    actual_schema,
+                    max_rows_shown,
+                )
+
+                header = "rows not equal"
+
+            else:
+
+                missing_keys = [
+                    key for key in keys if key not in expected_schema.columns
+                ]
+
+                if missing_keys:
+
+                    raise ValueError(f"keys {missing_keys} not in expected columns")
+
+                columns = [
+                    column for column in expected_schema.columns if column not in keys
+                ]
+
+                rules = _column_rules(column_rules, columns, check_exact, rtol, atol)
+
+                differences = _keyed_partition_differences(
+                    directory,
+                    n_partitions,
+                    expected_schema,
+                    actual_schema,
+                    keys,
+                    columns,
+                    rules,
+                    text_format,
+                    max_rows_shown,
+                )
+
+                header = f"not equal on keys {keys}"
+
+        if differences:
+
+            details = "".join(f"\n  {difference}" for difference in differences)
+
+            raise AssertionError(f"{msg_tag} - {header}{details}")
+
+
+def assert_files_equal_msg(
+    actual_path,
+    expected_path,
+    msg_tag,
+    batch_rows=100_000,
+    parallel=True,
+    check_exact=False,
+    rtol=1e-5,
+    atol=1e-8,
+):
+    """Compares the rows of two (CSV, JSON lines or Parquet) files in order and asserts
+    equality, reading the files in batches and stopping at the first row that differs.
+
+    Both files are read batch_rows rows at a time in lockstep, so memory is bounded by a
+    few batches rather than the size of the files. If parallel is True the next batch of
+    each file is read in a background thread while the current batches are compared.
+
+    Int and bool columns are compared exactly and float columns with np.isclose. The
+    dtypes of CSV and JSON lines columns are inferred from each batch and can change
+    between batches, e.g. an int column with missing values in one batch only, so columns
+    whose dtypes differ between a pair of batches are compared by value, e.g. 1 and 1.0
+    are equal but 2**53 + 1 and 2.0**53 are not. Each pair of batches is first compared
+    by the raw buffers of their columns and only compared value by value if that finds a
+    difference.
+
+    Rows are compared by position, use assert_large_files_equal_msg to compare rows in
+    any order.
+
+    Parameters
+    ----------
+    actual_path : str or os.PathLike
+        Path to the file of actual rows.
+
+    expected_path : str or os.PathLike
+        Path to the file of expected rows.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    batch_rows : int, default = 100_000
+        Number of rows to read from each file at once.
+
+    parallel : bool, default = True
+        Read the next batch of each file in a background thread while comparing the
+        current batches.
+
+    check_exact : bool, default = False
+        Compare float values exactly, otherwise with np.isclose.
+
+    rtol : float, default = 1e-5
+        Relative tolerance for np.isclose.
+
+    atol : float, default = 1e-8
+        Absolute tolerance for np.isclose.
+
+    Raises
+    ------
+    AssertionError
+        If the files do not have the same columns, the same number of rows or the same
+        values. The message gives the (0 based, excluding any header) number of the first
+        row that differs and the values that differ in it.
+
+    """
+
+    with metrics.record("files.assert_files_equal_msg"):
+
+        for name, path in [
+            ("actual_path", actual_path),
+            ("expected_path", expected_path),
+        ]:
+
+            if not isinstance(path, (str, os.PathLike)):
+
+                raise TypeError(
+                    f"{name} should be a str or os.PathLike but got {type(path)}"
+                )
+
+        if not (type(batch_rows) is int and batch_rows > 0):
+
+            raise ValueError("batch_rows should be a positive int")
+
+        if not type(parallel) is bool:
+
+            raise TypeError(f"parallel should be a bool but got {type(parallel)}")
+
+        actual_batches = _read_batches(actual_path, batch_rows)
+        expected_batches = _read_batches(expected_path, batch_rows)
+
+        try:
+
+            with (
+                ThreadPoolExecutor(max_workers=2) if parallel else nullcontext()
+            ) as executor:
+
+                _assert_batches_equal(
+                    _read_ahead(actual_batches, executor),
+                    _read_ahead(expected_batches, executor),
+                    msg_tag,
+                    check_exact,
+                    rtol,
+                    atol,
+                )
+
+        finally:
+
+            actual_batches.close()
+            expected_batches.close()
+
+
+def _read_ahead(batches, executor):
+    """Generator of the items of batches, reading the next item in executor (if not None)
+    while the current item is being used.
+    """
+
+    if executor is None:
+
+        yield from batches
+
+        return
+
+    future = executor.submit(next, batches, None)
+
+    while True:
+
+        batch = future.result()
+
+        if batch is None:
+
+            return
+
+        future = executor.submit(next, batches, None)
+
+        yield batch
+
+
+def _assert_batches_equal(
+    actual_batches, expected_batches, msg_tag, check_exact, rtol, atol
+):
+    """Compare batches of rows read from two files in order, raising an AssertionError at
+    the first row that differs.
+
+    The batches of the two files do not need to be the same size (e.g. Parquet row groups),
+    rows left over from the longer of each pair of batches are compared with the next
+    batch from the other file.
+    """
+
+    actual = expected = None
+    row = 0
+    columns = None
+
+    while True:
+
+        if actual is None or len(actual) == 0:
+
+            actual = next(actual_batches, None)
+
+        if expected is None or len(expected) == 0:
+
+            expected = next(expected_batches, None)
+
+        if actual is None or expected is None:
+
+            break
+
+        if columns is None:
+
+            columns = list(expected.columns)
+
+            if list(actual.columns) != columns:
+
+                raise AssertionError(
+                    f"{msg_tag} - columns -\n  Expected: {columns}\n  Actual: {list(actual.columns)}"
+                )
+
+        n_rows = min(len(actual), len(expected))
+
+        _assert_rows_equal(
+            actual.iloc[:n_rows],
+            expected.iloc[:n_rows],
+            row,
+            msg_tag,
+            check_exact,
+            rtol,
+            atol,
+        )
+
+        actual = actual.iloc[n_rows:]
+        expected = expected.iloc[n_rows:]
+        row += n_rows
+
+    for description, rows in [
+        ("missing from actual", expected),
+        ("not in expected", actual),
+    ]:
+
+        if rows is not None and len(rows) > 0:
+
+            raise AssertionError(
+                f"{msg_tag} - not equal at row {row}, row {description} -\n  {rows.iloc[0].to_dict()}"
+            )
+
+
+def _assert_rows_equal(actual, expected, row, msg_tag, check_exact, rtol, atol):
+    """Compare rows of the same length from two files, where row is the number of the first
+    row, raising an AssertionError if they are not equal.
+    """
+
+    columns = list(expected.columns)
+    index = pd.RangeIndex(row, row + len(actual))
+
+    actual = _relabelled_batch(actual, index)
+    expected = _relabelled_batch(expected, index)
+
+    if _frame_buffers_equal(actual, expected):
+
+        return
+
+    first_row = None
+    differences = {}
+
+    for i, column in enumerate(columns):
+
+        expected_values, actual_values = _comparable_columns(
+            expected.iloc[:, i], actual.iloc[:, i]
+        )
+
+        changed = np.flatnonzero(
+            ~_values_equal(actual_values, expected_values, check_exact, rtol, atol)
+        )
+
+        if len(changed) == 0:
+
+            continue
+
+        if first_row is None or changed[0] < first_row:
+
+            first_row = changed[0]
+            differences = {}
+
+        if changed[0] == first_row:
+
+            differences[column] = (
+                expected_values.iloc[first_row],
+                actual_values.iloc[first_row],
+            )
+
+    if first_row is not None:
+
+        details = "".join(
+            f"\n  column {column} -\n    Expected: {expected_value}\n    Actual: {actual_value}"
+            for column, (expected_value, actual_value) in differences.items()
+        )
+
+        raise AssertionError(f"{msg_tag} - not equal at row {row + first_row}{details}")
+
+
+def _relabelled_batch(batch, index):
+    """batch with columns labelled by position and the given index, without copying its
+    values.
+    """
+
+    batch = batch.copy(deep=False)
+    batch.columns = pd.RangeIndex(batch.shape[1])
+    batch.index = index
+
+    return batch
+
+
+def _comparable_columns(expected, actual):
+    """A pair of columns from two batches with dtypes that _values_equal can compare.
+
+    Columns with the same dtype are unchanged, so that int and bool values are compared
+    exactly and float values with a tolerance. If the dtypes differ, e.g. an int column
+    with missing values in one batch only, float columns of different precisions are
+    compared as float64 and other columns as objects, so that int values are compared
+    exactly by ==.
+    """
+
+    if expected.dtype == actual.dtype:
+
+        return expected, actual
+
+    if all(
+        isinstance(values.dtype, np.dtype) and values.dtype.kind == "f"
+        for values in [expected, actual]
+    ):
+
+        return expected.astype("float64"), actual.astype("float64")
+
+    return expected.astype(object), actual.astype(object)
+
+
+def _file_format(path):
+    """Format of a file (parquet, csv or jsonl) from its extension, ignoring any compression
+    extension for text formats.
+    """
+
+    name = os.fspath(path).lower()
+
+    for extension in _COMPRESSION_EXTENSIONS:
+
+        if name.endswith(extension):
+
+            name = name[: -len(extension)]
+
+            break
+
+    file_format = _FILE_FORMATS.get(os.path.splitext(name)[1])
+
+    if file_format is None:
+
+        raise ValueError(
+            f"unsupported file type for {path}, expected one of {sorted(_FILE_FORMATS)}"
+        )
+
+    if file_format == "parquet" and name != os.fspath(path).lower():
+
+        raise ValueError(f"compressed Parquet files are not supported, got {path}")
+
+    return file_format
+
+
+def _read_batches(path, batch_rows):
+    """Generator of pd.DataFrames of up to batch_rows rows read from a Parquet, CSV or
+    JSON lines file.
+    """
+
+    file_format = _file_format(path)
+
+    if file_format == "parquet":
+
+        try:
+
+            import pyarrow.parquet as pq
+
+        except ModuleNotFoundError as err:
+
+            raise ImportError(
+                "pyarrow must be installed to read Parquet files"
+            ) from err
+
+        parquet_file = pq.ParquetFile(path)
+
+        for batch in parquet_file.iter_batches(batch_size=batch_rows):
+
+            yield batch.to_pandas()
+
+        return
+
+    if file_format == "csv":
+
+        reader = pd.read_csv(path, chunksize=batch_rows)
+
+    else:
+
+        reader = pd.read_json(path, lines=True, chunksize=batch_rows)
+
+    try:
+
+        yield from reader
+
+    finally:
+
+        reader.close()
+
+
+def _hashable(frame):
+    """frame with columns labelled by position and int and float columns replaced by
+    _numeric_hash_values, so that equal values read as ints from some batches and floats
+    from others hash the same.
+    """
+
+    return pd.DataFrame(
+        {
+            i: (
+                _numeric_hash_values(column)
+                if pd.api.types.is_integer_dtype(column.dtype)
+                or pd.api.types.is_float_dtype(column.dtype)
+                else column
+            )
+            for i, (_, column) in enumerate(frame.items())
+        },
+        index=frame.index,
+    )
+
+
+def _numeric_hash_values(column):
+    """Values of an int or float pd.Series as an int64 np.ndarray to hash, the same for
+    equal int and float values.
+
+    Ints, and floats with whole values, are kept as their value (wrapping round outside
+    the range of int64) and other floats are the bits of their float64 value, so unequal
+    values can have the same hash value but are never cast to float64, which would lose
+    the precision of ints larger than 2**53. All missing values have the same hash value.
+    """
+
+    missing = column.isna().to_numpy()
+
+    if pd.api.types.is_integer_dtype(column.dtype):
+
+        values = column.to_numpy(dtype="int64", na_value=0)
+
+    else:
+
+        floats = column.to_numpy(dtype="float64", na_value=np.nan)
+
+        with np.errstate(invalid="ignore"):
+
+            whole = np.isfinite(floats) & (floats == np.floor(floats))
+
+        whole &= np.abs(floats, where=whole, out=np.zeros_like(floats)) < 2.0**63
+
+        values = floats.view("int64").copy()
+        values[whole] = floats[whole].astype("int64")
+
+    values[missing] = _MISSING_HASH_VALUE
+
+    return values
+
+
+def _row_hashes(frame, keys):
+    """Hash of the values in the key columns (all columns if keys is None) of each row.
+
+    Object columns holding unhashable values, e.g. the lists and dicts of nested JSON,
+    are hashed by a json serialisation (with sorted keys) of their values.
+    """
+
+    if keys is not None:
+
+        frame = frame[keys]
+
+    columns = list(frame.columns)
+    frame = _hashable(frame)
+
+    try:
+
+        return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+    except TypeError:
+
+        pass
+
+    for i, column in enumerate(columns):
+
+        if frame[i].dtype != object:
+
+            continue
+
+        frame[i] = frame[i].map(_serialised)
+
+        try:
+
+            pd.util.hash_pandas_object(frame[i], index=False)
+
+        except TypeError as err:
+
+            raise ValueError(f"values in column {column} cannot be hashed") from err
+
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def _serialised(value):
+    """value as json (with sorted keys) if it is a list or dict, otherwise unchanged."""
+
+    if isinstance(value, (list, dict)):
+
+        return json.dumps(value, sort_keys=True, default=str)
+
+    return value
+
+
+def _spill_partitions(path, keys, n_partitions, batch_rows, directory):
+    """Read a file in batches and append the rows of each batch to one of n_partitions
+    files in directory, by the hash of their keys (or values).
+
+    Returns
+    -------
+    pd.DataFrame
+        Empty DataFrame with the columns and dtypes of the first batch read.
+
+    """
+
+    os.mkdir(directory)
+
+    schema = None
+
+    partition_files = [
+        open(os.path.join(directory, str(i)), "wb") for i in range(n_partitions)
+    ]
+
+    try:
+
+        for batch in _read_batches(path, batch_rows):
+
+            if schema is None:
+
+                schema = batch.iloc[:0]
+
+                if keys is not None:
+
+                    missing_keys = [key for key in keys if key not in batch.columns]
+
+                    if missing_keys:
+
+                        raise ValueError(
+                            f"keys {missing_keys} not in columns of {path}"
+                        )
+
+            partitions = _row_hashes(batch, keys) % n_partitions
+
+            for i, rows in batch.groupby(partitions, sort=False):
+
+                pickle.dump(rows, partition_files[i], protocol=pickle.HIGHEST_PROTOCOL)
+
+    finally:
+
+        for partition_file in partition_files:
+
+            partition_file.close()
+
+    return pd.DataFrame() if schema is None else schema
+
+
+def _load_partition(directory, i, schema):
+    """Read back the rows spilled to a partition, as a single pd.DataFrame."""
+
+    parts = []
+
+    with open(os.path.join(directory, str(i)), "rb") as partition_file:
+
+        while True:
+
+            try:
+
+                part = pickle.load(partition_file)  # nosec B301
+
+            except EOFError:
+
+                break
+
+            parts.append(part)
+
+    return pd.concat(parts, ignore_index=True) if parts else schema
+
+
+def _normalise_dtypes(actual, expected):
+    """Convert numeric columns whose dtypes differ between actual and expected to float64."""
+
+    for column in expected.columns:
+
+        if (
+            column not in actual.columns
+            or actual[column].dtype == expected[column].dtype
+        ):
+
+            continue
+
+        if all(
+            pd.api.types.is_numeric_dtype(frame[column].dtype)
+            and not pd.api.types.is_bool_dtype(frame[column].dtype)
+            for frame in [actual, expected]
+        ):
+
+            actual[column] = actual[column].to_numpy(dtype="float64", na_value=np.nan)
+            expected[column] = expected[column].to_numpy(
+                dtype="float64", na_value=np.nan
+            )
+
+
+def _keyed_partition_differences(
+    directory,
+    n_partitions,
+    expected_schema,
+    actual_schema,
+    keys,
+    columns,
+    rules,
+    text_format,
+    max_rows_shown,
+):
+    """Descriptions of the differences in each pair of partitions, aligned on keys."""
+
+    differences = []
+
+    for i in range(n_partitions):
+
+        expected = _load_partition(
+            os.path.join(directory, "expected"), i, expected_schema
+        )
+        actual = _load_partition(os.path.join(directory, "actual"), i, actual_schema)
+
+        if text_format:
+
+            _normalise_dtypes(actual, expected)
+
+        partition_differences = _differences_on_keys(
+            actual, expected, keys, columns, rules, max_rows_shown
+        )
+
+        if partition_differences:
+
+            details = "".join(
+                f"\n    {line}"
+                for difference in partition_differences
+                for line in difference.split("\n")
+            )
+
+            differences.append(f"partition {i} -{details}")
+
+    return differences
+
+
+def _unordered_rows_differences(
+    directory, n_partitions, expected_schema, actual_schema, max_rows_shown
+):
+    """Descriptions of the rows that are not in both files the same number of times,
+    comparing the files partition by partition.
+    """
+
+    n_missing = n_extra = 0
+    missing_rows = []
+    extra_rows = []
+
+    for i in range(n_partitions):
+
+        expected = _load_partition(
+            os.path.join(directory, "expected"), i, expected_schema
+        )
+        actual = _load_partition(os.path.join(directory, "actual"), i, actual_schema)
+
+        expected_codes, actual_codes = _row_codes(expected, actual)
+
+        # number of times each row is in expected, less the number in actual
+        n_codes = max(expected_codes.max(initial=-1), actual_codes.max(initial=-1)) + 1
+
+        surplus = np.bincount(expected_codes, minlength=n_codes) - np.bincount(
+            actual_codes, minlength=n_codes
+        )
+
+        n_missing += int(surplus[surplus > 0].sum())
+        n_extra += int(-surplus[surplus < 0].sum())
+
+        for rows, surplus_rows, shown in [
+            (expected, surplus[expected_codes] > 0, missing_rows),
+            (actual, surplus[actual_codes] < 0, extra_rows),
+        ]:
+
+            if len(shown) < max_rows_shown:
+
+                examples = rows[surplus_rows]
+
+                shown.extend(
+                    examples.iloc[: max_rows_shown - len(shown)].to_dict("records")
+                )
+
+    differences = []
+
+    for description, n_rows, shown in [
+        ("rows missing from actual", n_missing, missing_rows),
+        ("rows not in expected", n_extra, extra_rows),
+    ]:
+
+        if n_rows:
+
+            details = "".join(f"\n    {row}" for row in shown)
+
+            if n_rows > len(shown):
+
+                details += f"\n    ... and {n_rows - len(shown)} more"
+
+            differences.append(f"{n_rows} {description}, e.g.{details}")
+
+    return differences
+
+
+def _row_codes(expected, actual):
+    """Codes for the rows of two pd.DataFrames with the same columns, that are the same
+    for two rows if and only if the rows have equal values in every column.
+
+    The values of each column of both DataFrames are factorised together, as in
+    _comparable_columns if the dtypes of the columns differ so that int values are
+    compared exactly with float values, and all missing values are equal. Lists and dicts
+    are compared by their json serialisation. The codes of the columns are then combined
+    into a code for each row.
+
+    Returns
+    -------
+    tuple
+        np.ndarrays of the codes for the rows of expected and of actual.
+
+    """
+
+    n_expected = len(expected)
+
+    row_codes = np.zeros(n_expected + len(actual), dtype="int64")
+
+    for i, column in enumerate(expected.columns):
+
+        values = pd.concat(
+            _comparable_columns(expected.iloc[:, i], actual.iloc[:, i]),
+            ignore_index=True,
+        )
+
+        if values.dtype == object:
+
+            values = values.map(_serialised)
+
+        try:
+
+            # missing values all have the code -1
+            codes, uniques = pd.factorize(values)
+
+        except TypeError as err:
+
+            raise ValueError(f"values in column {column} cannot be compared") from err
+
+        row_codes, _ = pd.factorize(row_codes * (len(uniques) + 1) + codes + 1)
+
+    return row_codes[:n_expected], row_codes[n_expected:]
+
+
+def compare_directories(actual_dir, expected_dir, processes=None):
+    """Compares every file in two directories, matched by their path relative to the
+    directory, e.g. the partitioned output of two runs of a pipeline.
+
+    Files with the same content (by size and sha256 hash) are not read. Otherwise
+    Parquet, CSV and JSON lines files are read into pd.DataFrames and .npy files into
+    np.arrays and compared with equality.assert_equal_dispatch. Other files are only
+    compared by their content.
+
+    Files are compared in a pool of processes and the results are yielded as each
+    comparison finishes, so they can be reported while the others are running.
+
+    Parameters
+    ----------
+    actual_dir : str or os.PathLike
+        Directory of actual files.
+
+    expected_dir : str or os.PathLike
+        Directory of expected files.
+
+    processes : int or None, default = None
+        Number of processes to compare files in, if None the number of CPUs is used. If 1
+        the files are compared in the current process.
+
+    Yields
+    ------
+    tuple
+        Tuple of (relative path, status, message) for each file, where status is one of;
+        - identical: the files have the same content
+        - equal: the files have different content but the data in them is equal
+        - different: the data in the files is not equal, message gives the differences
+        - missing: the file is in expected_dir but not actual_dir
+        - extra: the file is in actual_dir but not expected_dir
+        - error: the files could not be read, message gives the error
+
+    """
+
+    for name, directory in [("actual_dir", actual_dir), ("expected_dir", expected_dir)]:
+
+        if not os.path.isdir(directory):
+
+            raise ValueError(f"{name} should be a directory but got {directory}")
+
+    if processes is not None and not (type(processes) is int and processes > 0):
+
+        raise ValueError("processes should be a positive int or None")
+
+    actual_files = _relative_paths(actual_dir)
+    expected_files = _relative_paths(expected_dir)
+
+    for path in sorted(expected_files - actual_files):
+
+        yield path, "missing", None
+
+    for path in sorted(actual_files - expected_files):
+
+        yield path, "extra", None
+
+    paths = sorted(expected_files & actual_files)
+
+    pairs = [
+        (path, os.path.join(actual_dir, path), os.path.join(expected_dir, path))
+        for path in paths
+    ]
+
+    if processes == 1 or len(pairs) <= 1:
+
+        for pair in pairs:
+
+            yield _compare_file(*pair)
+
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+
+        futures = [executor.submit(_compare_file, *pair) for pair in pairs]
+
+        for future in as_completed(futures):
+
+            yield future.result()
+
+
+def _relative_paths(directory):
+    """Set of the paths of all files under directory, relative to it and with / separators."""
+
+    return {
+        os.path.relpath(os.path.join(root, name), directory).replace(os.sep, "/")
+        for root, _, names in os.walk(directory)
+        for name in names
+    }
+
+
+def _compare_file(path, actual_path, expected_path):
+    """Compare a pair of files for compare_directories, returning (path, status, message)."""
+
+    try:
+
+        if _same_content(actual_path, expected_path):
+
+            return path, "identical", None
+
+        if path.lower().endswith(".npy"):
+
+            actual = np.load(actual_path, allow_pickle=False)
+            expected = np.load(expected_path, allow_pickle=False)
+
+        else:
+
+            try:
+
+                file_format = _file_format(path)
+
+            except ValueError:
+
+                return path, "different", "content differs"
+
+            actual = _read_file(actual_path, file_format)
+            expected = _read_file(expected_path, file_format)
+
+    except Exception as err:
+
+        return path, "error", f"{type(err).__name__}: {err}"
+
+    try:
+
+        assert_equal_dispatch(expected, actual, path)
+
+    except AssertionError as err:
+
+        message = str(err)
+
+        if err.__cause__ is not None:
+
+            message += f"\n{err.__cause__}"
+
+        return path, "different", message
+
+    return path, "equal", None
+
+
+def _same_content(path_1, path_2):
+    """Check if two files have the same content, by their size then sha256 hash."""
+
+    if os.path.getsize(path_1) != os.path.getsize(path_2):
+
+        return False
+
+    return _file_hash(path_1) == _file_hash(path_2)
+
+
+def _file_hash(path):
+    """sha256 hex digest of the content of a file, read in blocks."""
+
+    file_hash = hashlib.sha256()
+
+    with open(path, "rb") as f:
+
+        for block in iter(lambda: f.read(_HASH_BLOCK_BYTES), b""):
+
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+
+def _read_file(path, file_format):
+    """Read the whole of a Parquet, CSV or JSON lines file into a pd.DataFrame."""
+
+    if file_format == "parquet":
+
+        return pd.read_parquet(path)
+
+    if file_format == "csv":
+
+        return pd.read_csv(path)
+
+    return pd.read_json(path, lines=True)
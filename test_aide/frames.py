@@ -0,0 +1,1811 @@
+"""
+This module contains helper functions to compare pandas DataFrames as a whole, rather
+than value by value; many pairs of DataFrames at once, rows aligned on key columns or by
+a diff of their hashes, columns each with their own rule and DataFrames against a
+statistical profile.
+
+The functions are also available from the equality module, where they were first added.
+
+Note, if either pandas or numpy libraries are not installed then this module will
+not be available when the package is loaded.
+
+"""
+
+import math
+
+try:
+
+    import pandas as pd
+
+except ModuleNotFoundError as err:
+
+    raise ImportError(
+        "pandas must be installed to use functionality in frames module"
+    ) from err
+
+try:
+
+    import numpy as np
+
+except ModuleNotFoundError as err:
+
+    raise ImportError(
+        "numpy must be installed to use functionality in frames module"
+    ) from err
+
+from test_aide.equality import _row_diff_blocks
+
+# keys allowed in the per column rules of assert_frame_equal_by_column_msg and
+# assert_frame_equal_on_keys_msg
+_COLUMN_RULE_KEYS = ("exact", "rtol", "atol", "tolerance", "ignore")
+
+# statistics in the column profiles of frame_profile
+_PROFILE_STATISTICS = (
+    "nulls",
+    "min",
+    "max",
+    "mean",
+    "std",
+    "skew",
+    "kurtosis",
+    "quantiles",
+    "histogram",
+    "frequencies",
+)
+
+# key in the frequencies of a frame_profile for the count of all other values
+_OTHER_CATEGORIES = "<other>"
+
+
+def assert_frame_pairs_equal_msg(
+    pairs, msg_tag, check_exact=False, rtol=1e-5, atol=1e-8, max_pairs_shown=10
+):
+    """Compares many pairs of actual and expected pandas.DataFrames with the same columns in
+    one vectorised pass and asserts they are all equal.
+
+    This is much faster than calling equality.assert_frame_equal_msg on each pair when
+    there are many small DataFrames, e.g. the outputs of a transformer called row by row.
+    The column values of each DataFrame are taken once, without creating a pd.Series for
+    each column, and each side is concatenated (column by column) along with a key giving
+    the pair each row came from. The concatenated columns are compared in bulk and the keys of
+    the unequal rows identify the pairs that are not equal.
+
+    Pairs are not equal if they have a different number of rows, different index dtypes or
+    values, if the actual DataFrame has different columns or dtypes to the expected
+    DataFrames or if any values differ. Missing values in the same position are considered
+    equal. Note, index types with the same dtype, e.g. pd.RangeIndex and an integer
+    pd.Index, are not distinguished.
+
+    Parameters
+    ----------
+    pairs : list or tuple
+        Pairs of (actual, expected) pd.DataFrames. All the expected DataFrames must have the
+        same columns and dtypes.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    check_exact : bool, default = False
+        Whether to compare float and complex values exactly, if False values are compared with
+        np.isclose using rtol and atol (the same defaults as pd.testing.assert_frame_equal).
+
+    rtol : float, default = 1e-5
+        Relative tolerance used if check_exact is False.
+
+    atol : float, default = 1e-8
+        Absolute tolerance used if check_exact is False.
+
+    max_pairs_shown : int, default = 10
+        Maximum number of unequal pairs to describe in the assert error message.
+
+    Raises
+    ------
+    AssertionError
+        If any of the pairs are not equal, the message gives the number of unequal pairs
+        and, for the first max_pairs_shown of them, their position in pairs and what differs.
+
+    """
+
+    if not type(pairs) in [list, tuple]:
+
+        raise TypeError(f"pairs should be a list or tuple but got {type(pairs)}")
+
+    if len(pairs) == 0:
+
+        raise ValueError("pairs should contain at least one pair")
+
+    for i, pair in enumerate(pairs):
+
+        if (
+            not type(pair) in [list, tuple]
+            or len(pair) != 2
+            or not all(isinstance(frame, pd.DataFrame) for frame in pair)
+        ):
+
+            raise TypeError(
+                f"each item in pairs should be a (actual, expected) pair of pd.DataFrames but got {type(pair)} at index {i}"
+            )
+
+    reference_columns = pairs[0][1].columns
+    reference_labels = reference_columns.tolist()
+    reference_dtypes = [values.dtype for values in _column_arrays(pairs[0][1])]
+
+    # reasons each pair is not equal, by position in pairs
+    differences = {}
+
+    # per column lists of values from each side, for the pairs with matching shapes
+    actual_values = [[] for _ in reference_columns]
+    expected_values = [[] for _ in reference_columns]
+    actual_indexes = []
+    expected_indexes = []
+    pair_numbers = []
+    pair_lengths = []
+
+    for i, (actual, expected) in enumerate(pairs):
+
+        expected_arrays = _column_arrays(expected)
+
+        if not _columns_match(
+            expected, reference_columns, reference_labels
+        ) or not _dtypes_identical(
+            [values.dtype for values in expected_arrays], reference_dtypes
+        ):
+
+            raise ValueError(
+                f"expected DataFrames should all have the same columns and dtypes, but pair {i} differs from pair 0"
+            )
+
+        if not _columns_match(actual, reference_columns, reference_labels):
+
+            differences[i] = [
+                f"columns -\n    Expected: {list(reference_columns)}\n    Actual: {list(actual.columns)}"
+            ]
+
+            continue
+
+        actual_arrays = _column_arrays(actual)
+
+        actual_dtypes = [values.dtype for values in actual_arrays]
+
+        if not _dtypes_identical(actual_dtypes, reference_dtypes):
+
+            differences[i] = [
+                f"dtypes -\n    Expected: {reference_dtypes}\n    Actual: {actual_dtypes}"
+            ]
+
+            continue
+
+        n_rows = len(expected)
+
+        if len(actual) != n_rows:
+
+            differences[i] = [
+                f"number of rows -\n    Expected: {n_rows}\n    Actual: {len(actual)}"
+            ]
+
+            continue
+
+        if actual.index.dtype != expected.index.dtype:
+
+            differences[i] = [
+                f"index dtype -\n    Expected: {expected.index.dtype}\n    Actual: {actual.index.dtype}"
+            ]
+
+            continue
+
+        for j, (actual_array, expected_array) in enumerate(
+            zip(actual_arrays, expected_arrays)
+        ):
+
+            actual_values[j].append(actual_array)
+            expected_values[j].append(expected_array)
+
+        actual_indexes.append(actual.index.to_numpy())
+        expected_indexes.append(expected.index.to_numpy())
+        pair_numbers.append(i)
+        pair_lengths.append(n_rows)
+
+    if pair_numbers:
+
+        row_pairs = np.repeat(np.array(pair_numbers), pair_lengths)
+
+        labels = ["index"] + [f"column {column}" for column in reference_columns]
+
+        for label, actual_parts, expected_parts in zip(
+            labels,
+            [actual_indexes] + actual_values,
+            [expected_indexes] + expected_values,
+        ):
+
+            equal = _values_equal(
+                _concat_values(actual_parts),
+                _concat_values(expected_parts),
+                check_exact,
+                rtol,
+                atol,
+            )
+
+            for i in np.unique(row_pairs[~equal]).tolist():
+
+                differences.setdefault(i, []).append(label)
+
+    if differences:
+
+        shown = sorted(differences)[:max_pairs_shown]
+
+        details = "".join(f"\n  pair {i}: {', '.join(differences[i])}" for i in shown)
+
+        if len(differences) > len(shown):
+
+            details += f"\n  ... and {len(differences) - len(shown)} more"
+
+        raise AssertionError(
+            f"{msg_tag} - {len(differences)} of {len(pairs)} pairs not equal{details}"
+        )
+
+
+def assert_frame_equal_on_keys_msg(
+    actual,
+    expected,
+    msg_tag,
+    keys,
+    check_exact=False,
+    rtol=1e-5,
+    atol=1e-8,
+    max_rows_shown=10,
+    column_rules=None,
+):
+    """Compares actual and expected pandas.DataFrames after aligning their rows on key
+    columns and asserts equality.
+
+    Rows are matched by the values in the key columns rather than by position, so the
+    DataFrames can be in different orders and the index is not compared. The rows of
+    actual are looked up in a hash table of the keys of expected (Index.get_indexer) and
+    the values of the matched rows are then compared column by column in bulk, so the
+    comparison is linear in the number of rows and nothing is sorted.
+
+    Missing values in the same position are considered equal.
+
+    Parameters
+    ----------
+    actual : pandas DataFrame
+        The actual DataFrame.
+
+    expected : pandas DataFrame
+        The expected DataFrame, the keys must uniquely identify its rows.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    keys : str or list of str
+        Column(s), in both DataFrames, to align the rows on.
+
+    check_exact : bool, default = False
+        Whether to compare float and complex values exactly, if False values are compared with
+        np.isclose using rtol and atol (the same defaults as pd.testing.assert_frame_equal).
+
+    rtol : float, default = 1e-5
+        Relative tolerance used if check_exact is False.
+
+    atol : float, default = 1e-8
+        Absolute tolerance used if check_exact is False.
+
+    max_rows_shown : int, default = 10
+        Maximum number of keys or changed values to show for each difference in the
+        assert error message.
+
+    column_rules : dict or None, default = None
+        Rules for comparing particular (non key) columns, overriding check_exact, rtol
+        and atol, see assert_frame_equal_by_column_msg.
+
+    Raises
+    ------
+    AssertionError
+        If the DataFrames are not equal, the message lists the keys of rows missing from
+        actual, rows in actual but not in expected and duplicated keys in actual, any
+        columns that are missing, extra or have different dtypes and, for each other
+        column, the number of matched rows with changed values and the first few of them.
+
+    """
+
+    if not isinstance(expected, pd.DataFrame):
+
+        raise TypeError(
+            f"expected should be of type pd.DataFrame, but got {type(expected)}"
+        )
+
+    if not isinstance(actual, pd.DataFrame):
+
+        raise TypeError(
+            f"actual should be of type pd.DataFrame, but got {type(actual)}"
+        )
+
+    keys = _keys_list(keys)
+
+    for name, frame in [("expected", expected), ("actual", actual)]:
+
+        if not frame.columns.is_unique:
+
+            raise ValueError(f"{name} should have unique column names")
+
+        missing_keys = [key for key in keys if key not in frame.columns]
+
+        if missing_keys:
+
+            raise ValueError(f"keys {missing_keys} not in {name} columns")
+
+    columns = [column for column in expected.columns if column not in keys]
+
+    rules = _column_rules(column_rules, columns, check_exact, rtol, atol)
+
+    differences = _differences_on_keys(
+        actual, expected, keys, columns, rules, max_rows_shown
+    )
+
+    if differences:
+
+        details = "".join(f"\n  {difference}" for difference in differences)
+
+        raise AssertionError(f"{msg_tag} - not equal on keys {list(keys)}{details}")
+
+
+def _keys_list(keys):
+    """keys as a list, checking it is a column name (str) or non empty list of them."""
+
+    if type(keys) is str:
+
+        keys = [keys]
+
+    if not type(keys) in [list, tuple] or not all(type(key) is str for key in keys):
+
+        raise TypeError(f"keys should be a str or list of str but got {keys}")
+
+    if len(keys) == 0:
+
+        raise ValueError("keys should contain at least one column")
+
+    return list(keys)
+
+
+def _differences_on_keys(actual, expected, keys, columns, rules, max_rows_shown):
+    """Descriptions of the differences between two DataFrames after aligning their rows
+    on keys, see assert_frame_equal_on_keys_msg. columns are the (non key) columns of
+    expected to compare with rules from _column_rules.
+    """
+
+    expected_keys = _key_index(expected, keys)
+    actual_keys = _key_index(actual, keys)
+
+    if not expected_keys.is_unique:
+
+        raise ValueError(
+            f"keys should uniquely identify the rows of expected but got duplicates {_shown(expected_keys[expected_keys.duplicated()], max_rows_shown)}"
+        )
+
+    # position in expected of the row with the same keys as each row of actual
+    expected_positions = expected_keys.get_indexer(actual_keys)
+
+    matched = expected_positions >= 0
+
+    actual_positions = np.flatnonzero(matched)
+    expected_positions = expected_positions[matched]
+
+    differences = []
+
+    missing_rows = np.ones(expected.shape[0], dtype=bool)
+    missing_rows[expected_positions] = False
+
+    if missing_rows.any():
+
+        differences.append(
+            f"{missing_rows.sum()} rows missing from actual, keys: {_shown(expected_keys[missing_rows], max_rows_shown)}"
+        )
+
+    if not matched.all():
+
+        differences.append(
+            f"{(~matched).sum()} rows not in expected, keys: {_shown(actual_keys[~matched], max_rows_shown)}"
+        )
+
+    if not actual_keys.is_unique:
+
+        duplicated = actual_keys[actual_keys.duplicated()].unique()
+
+        differences.append(
+            f"{len(duplicated)} duplicated keys in actual, keys: {_shown(duplicated, max_rows_shown)}"
+        )
+
+    differences.extend(
+        _column_differences(
+            actual,
+            expected,
+            columns,
+            rules,
+            actual_positions,
+            expected_positions,
+            lambda i: actual_keys[actual_positions[i]],
+            "matched rows",
+            max_rows_shown,
+            ignored=keys,
+        )
+    )
+
+    return differences
+
+
+def assert_frame_equal_by_column_msg(
+    actual,
+    expected,
+    msg_tag,
+    column_rules,
+    check_exact=False,
+    rtol=1e-5,
+    atol=1e-8,
+    max_rows_shown=10,
+):
+    """Compares actual and expected pandas.DataFrames, with different rules for comparing
+    each column, and asserts equality.
+
+    This replaces splitting DataFrames up and calling equality.assert_frame_equal_msg with
+    different kwargs for each group of columns. The index, column labels and dtypes are checked once
+    and the values of each column are then compared in bulk according to its rule.
+
+    Missing values in the same position are considered equal.
+
+    Parameters
+    ----------
+    actual : pandas DataFrame
+        The actual DataFrame.
+
+    expected : pandas DataFrame
+        The expected DataFrame.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    column_rules : dict or None
+        Rules for comparing particular columns of expected, as a dict of column name to a
+        dict with any of the following keys;
+        - exact: bool, whether to compare float and complex values exactly
+        - rtol: float, relative tolerance for float and complex values
+        - atol: float, absolute tolerance for float and complex values
+        - tolerance: pd.Timedelta (or anything pd.Timedelta accepts), maximum absolute
+          difference between datetime or timedelta values
+        - ignore: bool, whether to skip comparing the column altogether
+        Values not given in a rule, and columns without a rule, take check_exact, rtol
+        and atol.
+
+    check_exact : bool, default = False
+        Whether to compare float and complex values exactly, if False values are compared with
+        np.isclose using rtol and atol (the same defaults as pd.testing.assert_frame_equal).
+
+    rtol : float, default = 1e-5
+        Relative tolerance used if check_exact is False.
+
+    atol : float, default = 1e-8
+        Absolute tolerance used if check_exact is False.
+
+    max_rows_shown : int, default = 10
+        Maximum number of changed values to show for each column in the assert error message.
+
+    Raises
+    ------
+    AssertionError
+        If the DataFrames are not equal, the message gives any differences in the number of
+        rows, index or columns, columns with different dtypes and, for each other column,
+        the number of rows with changed values and the first few of them.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import test_aide as ta
+    >>>
+    >>> expected = pd.DataFrame({"id": [1, 2], "p": [0.25, 0.75]})
+    >>> actual = pd.DataFrame({"id": [1, 2], "p": [0.2501, 0.7499]})
+    >>>
+    >>> ta.frames.assert_frame_equal_by_column_msg(
+    ...     actual, expected, "output", {"id": {"exact": True}, "p": {"atol": 1e-3}}
+    ... )
+
+    """
+
+    if not isinstance(expected, pd.DataFrame):
+
+        raise TypeError(
+            f"expected should be of type pd.DataFrame, but got {type(expected)}"
+        )
+
+    if not isinstance(actual, pd.DataFrame):
+
+        raise TypeError(
+            f"actual should be of type pd.DataFrame, but got {type(actual)}"
+        )
+
+    for name, frame in [("expected", expected), ("actual", actual)]:
+
+        if not frame.columns.is_unique:
+
+            raise ValueError(f"{name} should have unique column names")
+
+    columns = list(expected.columns)
+
+    rules = _column_rules(column_rules, columns, check_exact, rtol, atol)
+
+    if expected.shape[0] != actual.shape[0]:
+
+        raise AssertionError(
+            f"{msg_tag} - not equal\n  number of rows -\n    Expected: {expected.shape[0]}\n    Actual: {actual.shape[0]}"
+        )
+
+    differences = []
+
+    if not expected.index.equals(actual.index):
+
+        expected_labels = pd.Series(expected.index.to_numpy(), copy=False)
+        actual_labels = pd.Series(actual.index.to_numpy(), copy=False)
+
+        changed = np.flatnonzero(
+            ~_values_equal(actual_labels, expected_labels, True, rtol, atol)
+        )
+
+        differences.append(
+            f"index: {len(changed)} of {expected.shape[0]} labels changed"
+            + _changed_details(
+                changed,
+                expected_labels,
+                actual_labels,
+                lambda i: f"position {i}",
+                max_rows_shown,
+            )
+        )
+
+    differences.extend(
+        _column_differences(
+            actual,
+            expected,
+            columns,
+            rules,
+            None,
+            None,
+            expected.index.__getitem__,
+            "rows",
+            max_rows_shown,
+        )
+    )
+
+    if differences:
+
+        details = "".join(f"\n  {difference}" for difference in differences)
+
+        raise AssertionError(f"{msg_tag} - not equal{details}")
+
+
+def _column_rules(column_rules, columns, check_exact, rtol, atol):
+    """Check column_rules and return the full rule (a dict with all of _COLUMN_RULE_KEYS)
+    for each of columns, filling in values not given from check_exact, rtol and atol.
+    """
+
+    if column_rules is None:
+
+        column_rules = {}
+
+    if not isinstance(column_rules, dict):
+
+        raise TypeError(
+            f"column_rules should be a dict or None but got {type(column_rules)}"
+        )
+
+    unknown_columns = [column for column in column_rules if column not in columns]
+
+    if unknown_columns:
+
+        raise ValueError(
+            f"column_rules given for columns {unknown_columns} that are not compared"
+        )
+
+    default_rule = {
+        "exact": check_exact,
+        "rtol": rtol,
+        "atol": atol,
+        "tolerance": None,
+        "ignore": False,
+    }
+
+    rules = {}
+
+    for column in columns:
+
+        rule = column_rules.get(column, {})
+
+        if not isinstance(rule, dict):
+
+            raise TypeError(
+                f"rule for column {column} should be a dict but got {type(rule)}"
+            )
+
+        unknown_keys = [key for key in rule if key not in _COLUMN_RULE_KEYS]
+
+        if unknown_keys:
+
+            raise ValueError(
+                f"unexpected keys {unknown_keys} in rule for column {column}, rules can contain {list(_COLUMN_RULE_KEYS)}"
+            )
+
+        rule = {**default_rule, **rule}
+
+        if rule["tolerance"] is not None:
+
+            rule["tolerance"] = pd.Timedelta(rule["tolerance"])
+
+        rules[column] = rule
+
+    return rules
+
+
+def _column_differences(
+    actual,
+    expected,
+    columns,
+    rules,
+    actual_positions,
+    expected_positions,
+    row_label,
+    rows,
+    max_rows_shown,
+    ignored=(),
+):
+    """Descriptions of the differences between the columns of two DataFrames, after taking
+    the rows at actual_positions and expected_positions (all rows if None).
+
+    Parameters
+    ----------
+    actual : pd.DataFrame
+        The actual DataFrame.
+
+    expected : pd.DataFrame
+        The expected DataFrame.
+
+    columns : list
+        Columns of expected to compare.
+
+    rules : dict
+        Full rule for each of columns, from _column_rules.
+
+    actual_positions : np.ndarray or None
+        Positions of the rows of actual to compare.
+
+    expected_positions : np.ndarray or None
+        Positions of the rows of expected to compare.
+
+    row_label : callable
+        Called with the position of a compared row to give its label in the descriptions.
+
+    rows : str
+        Description of the compared rows, e.g. "rows".
+
+    max_rows_shown : int
+        Maximum number of changed values to describe for each column.
+
+    ignored : list, default = ()
+        Columns of actual not to report as extra columns, e.g. key columns.
+
+    """
+
+    compared = [column for column in columns if not rules[column]["ignore"]]
+
+    missing_columns = [column for column in compared if column not in actual.columns]
+    extra_columns = [
+        column
+        for column in actual.columns
+        if column not in ignored and column not in columns
+    ]
+
+    differences = []
+
+    if missing_columns:
+
+        differences.append(f"columns missing from actual: {missing_columns}")
+
+    if extra_columns:
+
+        differences.append(f"columns not in expected: {extra_columns}")
+
+    for column in compared:
+
+        if column in missing_columns:
+
+            continue
+
+        expected_column = expected[column]
+        actual_column = actual[column]
+
+        if not _dtypes_identical([expected_column.dtype], [actual_column.dtype]):
+
+            differences.append(
+                f"column {column} dtype -\n    Expected: {expected_column.dtype}\n    Actual: {actual_column.dtype}"
+            )
+
+            continue
+
+        rule = rules[column]
+
+        if rule["tolerance"] is not None and not (
+            pd.api.types.is_datetime64_any_dtype(expected_column.dtype)
+            or pd.api.types.is_timedelta64_dtype(expected_column.dtype)
+        ):
+
+            raise ValueError(
+                f"tolerance in rule for column {column} can only be used with datetime or timedelta columns, but the column has dtype {expected_column.dtype}"
+            )
+
+        expected_values = _take_values(expected_column, expected_positions)
+        actual_values = _take_values(actual_column, actual_positions)
+
+        changed = np.flatnonzero(
+            ~_rule_values_equal(actual_values, expected_values, rule)
+        )
+
+        if len(changed):
+
+            differences.append(
+                f"column {column}: {len(changed)} of {len(expected_values)} {rows} changed"
+                + _changed_details(
+                    changed, expected_values, actual_values, row_label, max_rows_shown
+                )
+            )
+
+    return differences
+
+
+def _rule_values_equal(actual, expected, rule):
+    """Elementwise equality of two pd.Series of the same length and dtype according to
+    a rule from _column_rules, as a numpy bool array.
+    """
+
+    if rule["tolerance"] is None:
+
+        return _values_equal(
+            actual, expected, rule["exact"], rule["rtol"], rule["atol"]
+        )
+
+    both_missing = (actual.isna() & expected.isna()).to_numpy(dtype=bool)
+
+    within_tolerance = ((actual - expected).abs() <= rule["tolerance"]).to_numpy(
+        dtype=bool, na_value=False
+    )
+
+    return within_tolerance | both_missing
+
+
+def _changed_details(changed, expected_values, actual_values, row_label, max_shown):
+    """Lines describing the first max_shown changed values."""
+
+    details = "".join(
+        f"\n    {row_label(i)}: expected {expected_values.iloc[i]}, actual {actual_values.iloc[i]}"
+        for i in changed[:max_shown].tolist()
+    )
+
+    if len(changed) > max_shown:
+
+        details += f"\n    ... and {len(changed) - max_shown} more"
+
+    return details
+
+
+def assert_frame_rows_equal_msg(actual, expected, msg_tag, max_ranges_shown=10):
+    """Compares the rows of actual and expected pandas.DataFrames in order and asserts
+    equality, reporting differences as ranges of inserted, deleted and modified rows.
+
+    When rows are inserted into or deleted from a DataFrame a positional comparison, e.g.
+    equality.assert_frame_equal_msg, finds every later row different. Instead each row is hashed
+    (pd.util.hash_pandas_object) and the two sequences of row hashes are aligned with a
+    diff, so only the rows that were actually inserted, deleted or modified are reported.
+
+    The diff is a patience diff; rows common to the start and end of both DataFrames are
+    trimmed, rows whose hash is unique in both DataFrames are matched up (keeping the
+    longest run of matches that are in the same order in both) and the gaps between the
+    matched rows are diffed in the same way. All but the last step are vectorised so the
+    comparison is close to linear in the number of rows.
+
+    Rows are compared exactly by their values, the index is not compared but the index
+    labels of the rows that differ are shown. Missing values in the same position are
+    considered equal, as are -0.0 and 0.0. The hashes only align the rows, the rows
+    matched by the diff are then compared by value, so rows with the same hash but
+    different values are reported as modified and modified rows that are equal by value
+    are not reported.
+
+    Parameters
+    ----------
+    actual : pandas DataFrame
+        The actual DataFrame.
+
+    expected : pandas DataFrame
+        The expected DataFrame.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    max_ranges_shown : int, default = 10
+        Maximum number of ranges of differing rows to show in the assert error message.
+
+    Raises
+    ------
+    AssertionError
+        If the DataFrames do not have the same columns and dtypes or their rows are not
+        equal. For differing rows the message lists the ranges of rows (positions and
+        index labels) deleted from expected, inserted into actual or modified, with the
+        columns that differ if the same number of rows were modified on both sides.
+
+    """
+
+    if not isinstance(expected, pd.DataFrame):
+
+        raise TypeError(
+            f"expected should be of type pd.DataFrame, but got {type(expected)}"
+        )
+
+    if not isinstance(actual, pd.DataFrame):
+
+        raise TypeError(
+            f"actual should be of type pd.DataFrame, but got {type(actual)}"
+        )
+
+    if not expected.columns.equals(actual.columns):
+
+        raise AssertionError(
+            f"{msg_tag} - columns -\n  Expected: {list(expected.columns)}\n  Actual: {list(actual.columns)}"
+        )
+
+    expected_dtypes = list(expected.dtypes)
+    actual_dtypes = list(actual.dtypes)
+
+    if not _dtypes_identical(expected_dtypes, actual_dtypes):
+
+        raise AssertionError(
+            f"{msg_tag} - dtypes -\n  Expected: {expected_dtypes}\n  Actual: {actual_dtypes}"
+        )
+
+    try:
+
+        expected_hashes = pd.util.hash_pandas_object(
+            _canonical_floats(expected), index=False
+        ).to_numpy()
+        actual_hashes = pd.util.hash_pandas_object(
+            _canonical_floats(actual), index=False
+        ).to_numpy()
+
+    except TypeError as err:
+
+        raise TypeError(f"rows of expected and actual could not be hashed, {err}")
+
+    blocks = _checked_row_blocks(
+        actual, expected, _row_diff_blocks(expected_hashes, actual_hashes)
+    )
+
+    if blocks:
+
+        details = "".join(
+            f"\n  {_describe_row_block(actual, expected, *block)}"
+            for block in blocks[:max_ranges_shown]
+        )
+
+        if len(blocks) > max_ranges_shown:
+
+            details += f"\n  ... and {len(blocks) - max_ranges_shown} more"
+
+        raise AssertionError(
+            f"{msg_tag} - rows not equal, {len(blocks)} differences{details}"
+        )
+
+
+def _canonical_floats(frame):
+    """frame with -0.0 replaced by 0.0 and every NaN by the same NaN in its float and
+    complex columns, so that equal rows have the same hash.
+    """
+
+    if not any(
+        isinstance(dtype, np.dtype) and dtype.kind in "fc" for dtype in frame.dtypes
+    ):
+
+        return frame
+
+    columns = {}
+
+    for i, (_, column) in enumerate(frame.items()):
+
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "fc":
+
+            # -0.0 + 0 is 0.0
+            values = column.to_numpy() + 0
+            values[np.isnan(values)] = np.nan
+
+            columns[i] = values
+
+        else:
+
+            columns[i] = column
+
+    return pd.DataFrame(columns, index=frame.index)
+
+
+def _checked_row_blocks(actual, expected, blocks):
+    """Blocks of rows from _row_diff_blocks checked by the values of the rows.
+
+    Rows matched by the diff, i.e. not in any block, that are not equal by value are
+    added as modified blocks and modified blocks with the same number of rows on both
+    sides that are equal by value are removed.
+    """
+
+    expected_matched = np.ones(len(expected), dtype=bool)
+    actual_matched = np.ones(len(actual), dtype=bool)
+
+    checked = []
+
+    for expected_start, expected_stop, actual_start, actual_stop in blocks:
+
+        expected_matched[expected_start:expected_stop] = False
+        actual_matched[actual_start:actual_stop] = False
+
+        if (
+            expected_stop - expected_start == actual_stop - actual_start
+            and not _unequal_rows(
+                actual,
+                expected,
+                np.arange(actual_start, actual_stop),
+                np.arange(expected_start, expected_stop),
+            ).any()
+        ):
+
+            continue
+
+        checked.append((expected_start, expected_stop, actual_start, actual_stop))
+
+    # the matched rows are in the same order in both
+    expected_positions = np.flatnonzero(expected_matched)
+    actual_positions = np.flatnonzero(actual_matched)
+
+    unequal = np.flatnonzero(
+        _unequal_rows(actual, expected, actual_positions, expected_positions)
+    )
+
+    if not len(unequal):
+
+        return checked
+
+    for i in unequal.tolist():
+
+        expected_row = int(expected_positions[i])
+        actual_row = int(actual_positions[i])
+
+        if checked and checked[-1][1:4:2] == (expected_row, actual_row):
+
+            checked[-1] = (
+                checked[-1][0],
+                expected_row + 1,
+                checked[-1][2],
+                actual_row + 1,
+            )
+
+        else:
+
+            checked.append((expected_row, expected_row + 1, actual_row, actual_row + 1))
+
+    return sorted(checked)
+
+
+def _unequal_rows(actual, expected, actual_positions, expected_positions):
+    """bool np.ndarray of the rows of actual at actual_positions that are not equal to
+    the rows of expected at expected_positions, compared exactly with missing values
+    equal.
+    """
+
+    unequal = np.zeros(len(expected_positions), dtype=bool)
+
+    for i in range(expected.shape[1]):
+
+        unequal |= ~_values_equal(
+            _take_values(actual.iloc[:, i], actual_positions),
+            _take_values(expected.iloc[:, i], expected_positions),
+            True,
+            0,
+            0,
+        )
+
+    return unequal
+
+
+def _describe_row_block(
+    actual, expected, expected_start, expected_stop, actual_start, actual_stop
+):
+    """Description of a block of rows from _checked_row_blocks."""
+
+    if expected_start == expected_stop:
+
+        return f"inserted actual {_row_range(actual, actual_start, actual_stop)}"
+
+    if actual_start == actual_stop:
+
+        return f"deleted expected {_row_range(expected, expected_start, expected_stop)}"
+
+    description = f"modified expected {_row_range(expected, expected_start, expected_stop)} to actual {_row_range(actual, actual_start, actual_stop)}"
+
+    if expected_stop - expected_start == actual_stop - actual_start:
+
+        positions = np.arange(expected_start, expected_stop)
+
+        changed_columns = [
+            column
+            for i, column in enumerate(expected.columns)
+            if not _values_equal(
+                _take_values(
+                    actual.iloc[:, i], positions - expected_start + actual_start
+                ),
+                _take_values(expected.iloc[:, i], positions),
+                True,
+                0,
+                0,
+            ).all()
+        ]
+
+        description += f", columns {changed_columns}"
+
+    return description
+
+
+def _row_range(frame, start, stop):
+    """Positions and index labels of the rows from start to stop (exclusive)."""
+
+    if stop - start == 1:
+
+        return f"row {start} (index {frame.index[start]})"
+
+    return f"rows {start} to {stop - 1} (index {frame.index[start]} to {frame.index[stop - 1]})"
+
+
+def frame_profile(
+    frame,
+    quantiles=(0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99),
+    histogram_bins=None,
+    max_categories=100,
+):
+    """Compact profile of summary statistics of a pandas.DataFrame, to be stored in place
+    of the full DataFrame and compared against with assert_frame_profile_msg.
+
+    The profile is a dict of plain python values that can be saved with json. For each
+    column it holds the dtype and number of missing values and;
+    - numeric (not bool) columns: the min, max, mean, standard deviation, skewness,
+      (excess) kurtosis and quantiles of the non missing values and, if histogram_bins
+      is given, a histogram of them
+    - datetime and timedelta columns: nothing else
+    - other columns (bool, categorical, object, string): the number of rows with each of
+      the max_categories most common values and the number with any other value
+
+    Each statistic is computed with vectorised reductions over the column values.
+
+    Parameters
+    ----------
+    frame : pandas DataFrame
+        DataFrame to profile.
+
+    quantiles : list or tuple of float, default = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+        Quantiles to compute for numeric columns.
+
+    histogram_bins : int or None, default = None
+        Number of equal width histogram bins (between the min and max) to record for numeric
+        columns, if None histograms are not recorded.
+
+    max_categories : int, default = 100
+        Maximum number of values to record the frequency of for non numeric columns.
+
+    Returns
+    -------
+    dict
+        Profile with keys n_rows and columns, a dict of column name (as a str) to the
+        statistics for the column.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import test_aide as ta
+    >>>
+    >>> profile = ta.frames.frame_profile(pd.DataFrame({"a": [1.0, 2.0, None]}))
+    >>> profile["columns"]["a"]["nulls"], profile["columns"]["a"]["mean"]
+    (1, 1.5)
+
+    """
+
+    if not isinstance(frame, pd.DataFrame):
+
+        raise TypeError(f"frame should be of type pd.DataFrame, but got {type(frame)}")
+
+    if not type(quantiles) in [list, tuple] or not all(
+        type(q) is float and 0 <= q <= 1 for q in quantiles
+    ):
+
+        raise ValueError(
+            "quantiles should be a list or tuple of floats between 0 and 1"
+        )
+
+    if histogram_bins is not None and not (
+        type(histogram_bins) is int and histogram_bins > 0
+    ):
+
+        raise ValueError("histogram_bins should be None or a positive int")
+
+    if not (type(max_categories) is int and max_categories > 0):
+
+        raise ValueError("max_categories should be a positive int")
+
+    return {
+        "n_rows": int(frame.shape[0]),
+        "columns": {
+            str(name): _column_profile(
+                column, list(quantiles), histogram_bins, None, max_categories
+            )
+            for name, column in frame.items()
+        },
+    }
+
+
+def assert_frame_profile_msg(
+    actual,
+    expected_profile,
+    msg_tag,
+    rtol=0.05,
+    atol=1e-8,
+    frequency_atol=0.01,
+    statistics=None,
+    standard_errors=4.0,
+):
+    """Compares a pandas.DataFrame against a profile of summary statistics (from
+    frame_profile) and asserts they are statistically equivalent.
+
+    The profile of actual is computed with the same quantiles, histogram bin edges and
+    (most common) values as expected_profile. Then;
+    - the number of rows must be close, as in math.isclose with rtol and atol
+    - the statistics of numeric columns must be close, as in math.isclose with rtol and
+      atol, or differ by no more than standard_errors standard errors of the difference
+      between two samples
+    - the fraction of rows that are missing, in each histogram bin or have each value
+      must differ by no more than frequency_atol or standard_errors standard errors
+    - the columns and their dtypes must be the same
+
+    Relative tolerances alone do not work for samples of stochastic outputs as e.g. the
+    mean or skewness of a sample from a symmetric distribution is close to, but not, 0.
+    The standard errors of the mean and standard deviation are the usual approximations,
+    using the standard deviation and kurtosis of each sample, and of the skewness and
+    kurtosis are estimated from the actual values by the delta method. The min, max and quantiles are compared in probability space instead;
+    the fraction of actual values below the expected value must be within the standard
+    errors of the (binomial) fraction of the quantile, so they need no assumption about
+    the distribution. Note, the kurtosis of heavy tailed distributions (e.g. a t
+    distribution with few degrees of freedom) varies too much between samples to compare
+    and should be left out of statistics.
+
+    Parameters
+    ----------
+    actual : pandas DataFrame
+        The actual DataFrame.
+
+    expected_profile : dict
+        The expected profile, from frame_profile.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    rtol : float, default = 0.05
+        Relative tolerance for the number of rows and statistics of numeric columns.
+
+    atol : float, default = 1e-8
+        Absolute tolerance for the number of rows and statistics of numeric columns.
+
+    frequency_atol : float, default = 0.01
+        Absolute tolerance for the fraction of rows that are missing, in a histogram bin or
+        have a particular value.
+
+    statistics : list or tuple of str or None, default = None
+        Statistics to compare, any of nulls, min, max, mean, std, skew, kurtosis, quantiles,
+        histogram and frequencies. If None all statistics in expected_profile are compared.
+
+    standard_errors : float or None, default = 4.0
+        Number of standard errors statistics can differ by, if None statistics must be
+        close by rtol, atol and frequency_atol only.
+
+    Raises
+    ------
+    AssertionError
+        If actual is not equivalent to expected_profile, the message lists every statistic
+        that differs with the expected and actual values.
+
+    """
+
+    if not isinstance(actual, pd.DataFrame):
+
+        raise TypeError(
+            f"actual should be of type pd.DataFrame, but got {type(actual)}"
+        )
+
+    if not (
+        isinstance(expected_profile, dict)
+        and {"n_rows", "columns"} <= set(expected_profile)
+    ):
+
+        raise TypeError("expected_profile should be a profile dict from frame_profile")
+
+    if statistics is None:
+
+        statistics = _PROFILE_STATISTICS
+
+    unknown_statistics = [
+        statistic for statistic in statistics if statistic not in _PROFILE_STATISTICS
+    ]
+
+    if unknown_statistics:
+
+        raise ValueError(
+            f"unexpected statistics {unknown_statistics}, statistics can contain {list(_PROFILE_STATISTICS)}"
+        )
+
+    if standard_errors is not None and not (
+        type(standard_errors) in [int, float] and standard_errors >= 0
+    ):
+
+        raise ValueError("standard_errors should be None or a non negative number")
+
+    differences = []
+
+    n_rows = actual.shape[0]
+
+    if not _statistic_close(expected_profile["n_rows"], n_rows, rtol, atol):
+
+        differences.append(
+            _statistic_difference("n_rows", expected_profile["n_rows"], n_rows)
+        )
+
+    expected_columns = expected_profile["columns"]
+    actual_columns = [str(name) for name in actual.columns]
+
+    if actual_columns != list(expected_columns):
+
+        differences.append(
+            _statistic_difference("columns", list(expected_columns), actual_columns)
+        )
+
+    for name, column in zip(actual_columns, (column for _, column in actual.items())):
+
+        expected = expected_columns.get(name)
+
+        if expected is None:
+
+            continue
+
+        actual_profile = _column_profile(
+            column,
+            expected.get("quantiles", {}).keys(),
+            expected.get("histogram", {}).get("edges"),
+            expected.get("frequencies", {}).keys(),
+            None,
+        )
+
+        if actual_profile["dtype"] != expected["dtype"]:
+
+            differences.append(
+                _statistic_difference(
+                    f"column {name} dtype", expected["dtype"], actual_profile["dtype"]
+                )
+            )
+
+            continue
+
+        actual_statistics = {
+            name: value for _, name, value in _flat_statistics(actual_profile)
+        }
+
+        # sorted non missing values of numeric columns, to compare quantiles with
+        sorted_values = (
+            np.sort(column.to_numpy(dtype="float64", na_value=np.nan))[
+                : n_rows - actual_profile["nulls"]
+            ]
+            if "mean" in actual_profile
+            else None
+        )
+
+        for key, statistic, expected_value in _flat_statistics(expected):
+
+            if key not in statistics:
+
+                continue
+
+            actual_value = actual_statistics.get(statistic)
+
+            if key in ["nulls", "frequencies", "histogram"]:
+
+                close = _fraction_close(
+                    expected_value,
+                    expected_profile["n_rows"],
+                    actual_value,
+                    n_rows,
+                    frequency_atol,
+                    standard_errors,
+                )
+
+            else:
+
+                close = _statistic_close(expected_value, actual_value, rtol, atol) or (
+                    standard_errors is not None
+                    and _within_standard_errors(
+                        statistic,
+                        expected_value,
+                        actual_value,
+                        expected,
+                        expected_profile["n_rows"],
+                        actual_profile,
+                        sorted_values,
+                        standard_errors,
+                    )
+                )
+
+            if not close:
+
+                differences.append(
+                    _statistic_difference(
+                        f"column {name} {statistic}", expected_value, actual_value
+                    )
+                )
+
+    if differences:
+
+        details = "".join(f"\n  {difference}" for difference in differences)
+
+        raise AssertionError(f"{msg_tag} - profile not equal{details}")
+
+
+def _column_profile(column, quantiles, histogram_edges, categories, max_categories):
+    """Profile of a single column, see frame_profile.
+
+    For numeric columns histogram_edges can be a number of bins or the list of bin edges
+    to use. For other columns either categories, the values to count (all other values
+    are counted together), or max_categories, the number of most common values to count,
+    should be given.
+    """
+
+    dtype = column.dtype
+
+    profile = {"dtype": str(dtype), "nulls": int(column.isna().sum())}
+
+    if pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(
+        dtype
+    ):
+
+        return profile
+
+    if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+
+        values = column.to_numpy(dtype="float64", na_value=np.nan)
+        values = values[~np.isnan(values)]
+
+        profile.update(_moments(values))
+
+        # quantiles are str keys when taken from a stored profile
+        quantiles = [float(q) for q in quantiles]
+
+        profile["quantiles"] = dict(
+            zip(
+                map(str, quantiles),
+                (
+                    np.quantile(values, quantiles).tolist()
+                    if len(values)
+                    else [None] * len(quantiles)
+                ),
+            )
+        )
+
+        if histogram_edges is not None:
+
+            counts, edges = np.histogram(values, bins=histogram_edges)
+
+            profile["histogram"] = {
+                "edges": edges.tolist(),
+                "counts": counts.tolist(),
+            }
+
+        return profile
+
+    counts = column.value_counts(dropna=True)
+
+    counts.index = counts.index.map(str)
+
+    # values with the same str are counted together
+    counts = counts.groupby(level=0, sort=False).sum().sort_values(ascending=False)
+
+    if categories is None:
+
+        counted = counts.iloc[:max_categories]
+
+    else:
+
+        counted = counts.reindex(
+            [category for category in categories if category != _OTHER_CATEGORIES],
+            fill_value=0,
+        )
+
+    frequencies = {str(value): int(count) for value, count in counted.items()}
+
+    frequencies[_OTHER_CATEGORIES] = int(counts.sum() - counted.sum())
+
+    profile["frequencies"] = frequencies
+
+    return profile
+
+
+def _moments(values):
+    """Min, max, mean, standard deviation, skewness and excess kurtosis of a 1d float
+    array without missing values.
+    """
+
+    if not len(values):
+
+        return dict.fromkeys(["min", "max", "mean", "std", "skew", "kurtosis"])
+
+    mean = values.mean()
+
+    deviations = values - mean
+    squared = deviations * deviations
+
+    variance = squared.mean()
+
+    if variance > 0:
+
+        skew = (squared * deviations).mean() / variance**1.5
+        kurtosis = (squared * squared).mean() / variance**2 - 3
+
+    else:
+
+        skew = kurtosis = 0.0
+
+    return {
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": float(mean),
+        "std": float(math.sqrt(variance)),
+        "skew": float(skew),
+        "kurtosis": float(kurtosis),
+    }
+
+
+def _flat_statistics(profile):
+    """(key in profile, name, value) of each statistic in a column profile, apart from
+    the dtype.
+    """
+
+    for key, value in profile.items():
+
+        if key == "dtype":
+
+            continue
+
+        if key == "quantiles":
+
+            for q, quantile in value.items():
+
+                yield key, f"quantile {q}", quantile
+
+        elif key == "frequencies":
+
+            for category, count in value.items():
+
+                yield key, f"frequency {category}", count
+
+        elif key == "histogram":
+
+            for i, count in enumerate(value["counts"]):
+
+                yield key, f"histogram bin {i}", count
+
+        else:
+
+            yield key, key, value
+
+
+def _fraction(count, n_rows):
+
+    return count / n_rows if n_rows else 0.0
+
+
+def _statistic_close(expected, actual, rtol, atol):
+    """Check if two statistics, which may be None, are close."""
+
+    if expected is None or actual is None:
+
+        return expected is None and actual is None
+
+    return math.isclose(actual, expected, rel_tol=rtol, abs_tol=atol)
+
+
+def _fraction_close(
+    expected_count, expected_rows, actual_count, actual_rows, atol, standard_errors
+):
+    """Check if the fractions of rows with counts of expected_rows and actual_rows differ
+    by no more than atol or standard_errors (binomial) standard errors.
+    """
+
+    expected_fraction = _fraction(expected_count, expected_rows)
+    actual_fraction = _fraction(actual_count, actual_rows)
+
+    difference = abs(actual_fraction - expected_fraction)
+
+    if difference <= atol:
+
+        return True
+
+    if standard_errors is None or not (expected_rows and actual_rows):
+
+        return False
+
+    return difference <= standard_errors * _fraction_standard_error(
+        expected_fraction, expected_rows, actual_rows, standard_errors
+    )
+
+
+def _fraction_standard_error(fraction, n_1, n_2, standard_errors):
+    """Standard error of the difference between the fractions of two samples of n_1 and
+    n_2 values with the same (true) fraction.
+
+    The fraction is kept at least standard_errors / n from 0 and 1, the counts of rare
+    values (e.g. below the min or above the max of the other sample) are too skewed for
+    the normal approximation to hold and it would give no tolerance at all at 0 and 1.
+    """
+
+    margin = min(max(standard_errors, 1) / min(n_1, n_2), 0.5)
+
+    fraction = min(max(fraction, margin), 1 - margin)
+
+    variance = fraction * (1 - fraction)
+
+    return math.sqrt(variance / n_1 + variance / n_2)
+
+
+def _within_standard_errors(
+    statistic,
+    expected,
+    actual,
+    expected_profile,
+    expected_rows,
+    actual_profile,
+    sorted_values,
+    standard_errors,
+):
+    """Check if a statistic of a numeric column differs by no more than standard_errors
+    standard errors of the difference between the statistic of two samples, see
+    assert_frame_profile_msg.
+    """
+
+    if expected is None or actual is None or sorted_values is None:
+
+        return False
+
+    n_expected = expected_rows - expected_profile["nulls"]
+    n_actual = len(sorted_values)
+
+    if not (n_expected and n_actual):
+
+        return False
+
+    if statistic in ["min", "max"] or statistic.startswith("quantile "):
+
+        if statistic in ["min", "max"]:
+
+            q = 0.0 if statistic == "min" else 1.0
+
+        else:
+
+            q = float(statistic.split(" ")[1])
+
+        # fractions of actual values below and at or below the expected value
+        below = np.searchsorted(sorted_values, expected, side="left") / n_actual
+        at_or_below = np.searchsorted(sorted_values, expected, side="right") / n_actual
+
+        tolerance = standard_errors * _fraction_standard_error(
+            q, n_expected, n_actual, standard_errors
+        )
+
+        return below - tolerance <= q <= at_or_below + tolerance
+
+    if statistic in ["mean", "std"]:
+
+        # variances of the mean and (approximately) standard deviation of each sample
+        variances = [
+            (
+                profile["std"] ** 2 / n
+                if statistic == "mean"
+                else profile["std"] ** 2 * (profile["kurtosis"] + 2) / (4 * n)
+            )
+            for profile, n in [
+                (expected_profile, n_expected),
+                (actual_profile, n_actual),
+            ]
+        ]
+
+        standard_error = math.sqrt(sum(variances))
+
+    elif statistic in ["skew", "kurtosis"]:
+
+        standard_error = math.sqrt(
+            _moment_variance(statistic, sorted_values, actual_profile)
+            * (1 / n_expected + 1 / n_actual)
+        )
+
+    else:
+
+        return False
+
+    return abs(actual - expected) <= standard_errors * standard_error
+
+
+def _moment_variance(statistic, values, profile):
+    """Variance (times the number of values) of the skewness or kurtosis of a sample,
+    estimated from the values by the delta method, i.e. the mean square of the influence
+    function of the statistic at each value. Unlike the normal theory variances (6 and
+    24) this holds for skewed and heavy tailed distributions.
+    """
+
+    if not profile["std"]:
+
+        return 0.0
+
+    z = (values - profile["mean"]) / profile["std"]
+    z_2 = z * z
+
+    # influence functions of the second, and third or fourth, central moments of the
+    # standardised values
+    influence_2 = z_2 - 1
+
+    if statistic == "skew":
+
+        skew = profile["skew"]
+
+        influence = z_2 * z - skew - 3 * z - 1.5 * skew * influence_2
+
+    else:
+
+        fourth = profile["kurtosis"] + 3
+
+        influence = (
+            z_2 * z_2 - fourth - 4 * profile["skew"] * z - 2 * fourth * influence_2
+        )
+
+    return float(np.mean(influence * influence))
+
+
+def _statistic_difference(statistic, expected, actual):
+
+    return f"{statistic} -\n    Expected: {expected}\n    Actual: {actual}"
+
+
+def _key_index(frame, keys):
+    """pd.Index (or pd.MultiIndex for more than one key) of the values in the key columns."""
+
+    if len(keys) == 1:
+
+        return pd.Index(frame[keys[0]])
+
+    return pd.MultiIndex.from_arrays([frame[key] for key in keys])
+
+
+def _take_values(column, positions):
+    """Values of a pd.Series at positions (all values if None), as a new pd.Series with
+    a RangeIndex.
+    """
+
+    if positions is None:
+
+        return pd.Series(column.array, copy=False)
+
+    if isinstance(column.dtype, np.dtype):
+
+        return pd.Series(column.to_numpy()[positions], copy=False)
+
+    return pd.Series(column.array.take(positions), copy=False)
+
+
+def _shown(values, max_shown):
+    """Comma separated values, only showing the first max_shown of them."""
+
+    shown = ", ".join(str(value) for value in values[:max_shown])
+
+    if len(values) > max_shown:
+
+        shown += f", ... and {len(values) - max_shown} more"
+
+    return shown
+
+
+def _columns_match(frame, columns, labels):
+    """Check if the columns of a pd.DataFrame equal columns (with labels columns.tolist()),
+    comparing them as lists first as that is much quicker than Index.equals for small
+    DataFrames.
+    """
+
+    return (
+        frame.columns is columns
+        or frame.columns.tolist() == labels
+        or frame.columns.equals(columns)
+    )
+
+
+def _column_arrays(frame):
+    """Values of each column of a pd.DataFrame, as numpy or pandas extension arrays.
+
+    Accessing the columns with DataFrame.items creates a pd.Series for each column, which
+    takes far longer than comparing the values of small DataFrames, so the values are
+    taken with the private DataFrame._get_column_array (pandas >= 1.3) if it exists.
+    Otherwise, e.g. if it is removed in a later version of pandas, the public
+    DataFrame.items is used.
+    """
+
+    get_column_array = getattr(frame, "_get_column_array", None)
+
+    if get_column_array is None:
+
+        return [
+            column.to_numpy() if isinstance(column.dtype, np.dtype) else column.array
+            for _, column in frame.items()
+        ]
+
+    return [get_column_array(j) for j in range(frame.shape[1])]
+
+
+def _concat_values(parts):
+    """Concatenate numpy arrays, or pandas extension arrays of the same dtype, into a
+    single pd.Series.
+    """
+
+    if all(isinstance(part, np.ndarray) for part in parts):
+
+        return pd.Series(np.concatenate(parts), copy=False)
+
+    # all parts have the same extension dtype as the dtypes of each pair are checked
+    return pd.Series(type(parts[0])._concat_same_type(parts), copy=False)
+
+
+def _dtypes_identical(dtypes_1, dtypes_2):
+    """Check two lists of dtypes are equal, checking identity first as comparing some
+    pandas extension dtypes is relatively slow.
+    """
+
+    return len(dtypes_1) == len(dtypes_2) and all(
+        dtype_1 is dtype_2 or dtype_1 == dtype_2
+        for dtype_1, dtype_2 in zip(dtypes_1, dtypes_2)
+    )
+
+
+def _values_equal(actual, expected, check_exact, rtol, atol):
+    """Elementwise equality of two pd.Series of the same length, as a numpy bool array.
+
+    Missing values in the same positions are equal and, unless check_exact is True, float
+    and complex values are compared with np.isclose.
+    """
+
+    both_missing = (actual.isna() & expected.isna()).to_numpy(dtype=bool)
+
+    if (
+        not check_exact
+        and isinstance(actual.dtype, np.dtype)
+        and actual.dtype.kind in "fc"
+        and actual.dtype == expected.dtype
+    ):
+
+        equal = np.isclose(actual.to_numpy(), expected.to_numpy(), rtol=rtol, atol=atol)
+
+    else:
+
+        try:
+
+            equal = (actual == expected).to_numpy(dtype=bool, na_value=False)
+
+        except TypeError:
+
+            equal = (actual.astype(object) == expected.astype(object)).to_numpy(
+                dtype=bool, na_value=False
+            )
+
+    return equal | both_missing
@@ -1,9 +1,13 @@
 """
 This module contains helper functions that simplify testing functions themselves
 e.g. testing a particular function has been called in a particular way.
+
+The package is loaded early by pytest as a plugin, PYTEST_DONT_REWRITE stops pytest
+rewriting the asserts in this module so the assert messages are not changed.
 """
 
 import inspect
+from test_aide import metrics
 from test_aide.equality import (
     assert_equal_msg,
     assert_list_tuple_equal_msg,
@@ -13,6 +17,7 @@ from contextlib import contextmanager
 import pytest_mock
 
 
+@metrics.recorded("functions.test_function_arguments")
 def test_function_arguments(func, expected_arguments, expected_default_values=None):
     """Test that a given function has expected arguments and default values.
 
@@ -138,9 +143,7 @@ def assert_function_call_count(mocker, target, attribute, expected_n_calls, **kw
 
     finally:
 
-        assert (
-            mocked_method.call_count == expected_n_calls
-        ), f"incorrect number of calls to {attribute}, expected {expected_n_calls} but got {mocked_method.call_count}"
+        _assert_call_count(mocked_method, attribute, expected_n_calls)
 
 
 @contextmanager
@@ -243,8 +246,6 @@ def assert_function_call(mocker, target, attribute, expected_calls_args, **kwarg
         if not type(call_n_expected_arguments["kwargs"]) is dict:
             raise TypeError("kwargs in expected_calls_args should be dicts")
 
-    max_expected_call = max(expected_calls_args.keys())
-
     mocked_method = mocker.patch.object(target, attribute, **kwargs)
 
     try:
@@ -253,27 +254,49 @@ def assert_function_call(mocker, target, attribute, expected_calls_args, **kwarg
 
     finally:
 
-        assert mocked_method.call_count >= (
-            max_expected_call + 1
-        ), f"not enough calls to {attribute}, expected at least {max_expected_call+1} but got {mocked_method.call_count}"
+        _assert_calls_args(mocked_method, attribute, expected_calls_args)
 
-        for call_number, call_n_expected_arguments in expected_calls_args.items():
 
-            call_n_arguments = mocked_method.call_args_list[call_number]
-            call_n_pos_args = call_n_arguments[0]
-            call_n_kwargs = call_n_arguments[1]
+@metrics.recorded("functions.assert_function_call_count")
+def _assert_call_count(mocked_method, attribute, expected_n_calls):
+    """Assert mocked_method has been called expected_n_calls times, on exit from
+    assert_function_call_count.
+    """
 
-            expected_call_n_pos_args = call_n_expected_arguments["args"]
-            expected_call_n_kwargs = call_n_expected_arguments["kwargs"]
+    assert (
+        mocked_method.call_count == expected_n_calls
+    ), f"incorrect number of calls to {attribute}, expected {expected_n_calls} but got {mocked_method.call_count}"
 
-            assert_list_tuple_equal_msg(
-                actual=call_n_pos_args,
-                expected=expected_call_n_pos_args,
-                msg_tag=f"positional args for call {call_number} not correct",
-            )
 
-            assert_dict_equal_msg(
-                actual=call_n_kwargs,
-                expected=expected_call_n_kwargs,
-                msg_tag=f"kwargs for call {call_number} not correct",
-            )
+@metrics.recorded("functions.assert_function_call")
+def _assert_calls_args(mocked_method, attribute, expected_calls_args):
+    """Assert mocked_method has been called with expected_calls_args, on exit from
+    assert_function_call.
+    """
+
+    max_expected_call = max(expected_calls_args.keys())
+
+    assert mocked_method.call_count >= (
+        max_expected_call + 1
+    ), f"not enough calls to {attribute}, expected at least {max_expected_call+1} but got {mocked_method.call_count}"
+
+    for call_number, call_n_expected_arguments in expected_calls_args.items():
+
+        call_n_arguments = mocked_method.call_args_list[call_number]
+        call_n_pos_args = call_n_arguments[0]
+        call_n_kwargs = call_n_arguments[1]
+
+        expected_call_n_pos_args = call_n_expected_arguments["args"]
+        expected_call_n_kwargs = call_n_expected_arguments["kwargs"]
+
+        assert_list_tuple_equal_msg(
+            actual=call_n_pos_args,
+            expected=expected_call_n_pos_args,
+            msg_tag=f"positional args for call {call_number} not correct",
+        )
+
+        assert_dict_equal_msg(
+            actual=call_n_kwargs,
+            expected=expected_call_n_kwargs,
+            msg_tag=f"kwargs for call {call_number} not correct",
+        )
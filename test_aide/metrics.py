@@ -0,0 +1,293 @@
+"""
+This module contains functions to record how much work the helpers in this package
+do, e.g. the number of calls to each assert_equal_dispatch handler, the time spent in
+them and the slowest comparisons by msg_tag.
+
+Recording is off by default and can be turned on and off at runtime. When it is off
+the only cost to the helpers is checking a module level flag.
+
+"""
+
+import functools
+import heapq
+import inspect
+import itertools
+import time
+from contextlib import contextmanager, nullcontext
+
+# checked by the helpers in other modules before recording anything
+_enabled = False
+
+# number of slowest comparisons to keep
+_n_slowest = 10
+
+_handlers = {}
+_helpers = {}
+_totals = {"nodes": 0, "bytes": 0, "seconds": 0.0}
+
+# number of recorded calls currently in progress, used to only add the time of the
+# outermost call to the total seconds
+_depth = 0
+
+# min heap of (seconds, sequence number, msg_tag, handler) for the slowest comparisons,
+# the sequence number stops ties being broken by comparing msg_tags
+_slowest = []
+_sequence = itertools.count()
+
+_null_context = nullcontext()
+
+
+def enable(n_slowest=10):
+    """Turn on recording of metrics.
+
+    Parameters
+    ----------
+    n_slowest : int, default = 10
+        Number of slowest comparisons (by msg_tag) to keep.
+
+    """
+
+    global _enabled, _n_slowest
+
+    if not type(n_slowest) is int:
+
+        raise TypeError(f"n_slowest should be an int but got {type(n_slowest)}")
+
+    if n_slowest < 0:
+
+        raise ValueError("n_slowest should be greater than or equal to 0")
+
+    _n_slowest = n_slowest
+
+    while len(_slowest) > _n_slowest:
+
+        heapq.heappop(_slowest)
+
+    _enabled = True
+
+
+def disable():
+    """Turn off recording of metrics. Metrics recorded so far are kept."""
+
+    global _enabled
+
+    _enabled = False
+
+
+def is_enabled():
+    """Return True if metrics are currently being recorded."""
+
+    return _enabled
+
+
+def reset():
+    """Clear all metrics recorded so far."""
+
+    global _sequence
+
+    _handlers.clear()
+    _helpers.clear()
+    _slowest.clear()
+
+    _totals["nodes"] = 0
+    _totals["bytes"] = 0
+    _totals["seconds"] = 0.0
+
+    _sequence = itertools.count()
+
+
+def get_metrics():
+    """Return a snapshot of the metrics recorded so far.
+
+    Returns
+    -------
+    dict
+        Dict with the following keys;
+        - handlers: dict of assert_equal_dispatch handler (e.g. frame, series, array, list,
+          dict, scalar) to a dict of calls and seconds
+        - helpers: dict of helper function name to a dict of calls and seconds
+        - nodes: total number of nodes visited by assert_equal_dispatch
+        - bytes: total number of bytes of pandas and numpy data compared
+        - seconds: total time spent in test-aide helpers and handlers, only counting
+          the outermost call when calls are nested
+        - slowest: list of dicts with msg_tag, handler and seconds for the slowest
+          comparisons, slowest first
+
+    Note, times for handlers that compare containers include the time spent comparing
+    their elements.
+
+    """
+
+    return {
+        "handlers": {name: dict(values) for name, values in _handlers.items()},
+        "helpers": {name: dict(values) for name, values in _helpers.items()},
+        "nodes": _totals["nodes"],
+        "bytes": _totals["bytes"],
+        "seconds": _totals["seconds"],
+        "slowest": [
+            {"msg_tag": msg_tag, "handler": handler, "seconds": seconds}
+            for seconds, _, msg_tag, handler in sorted(_slowest, reverse=True)
+        ],
+    }
+
+
+@contextmanager
+def recording(n_slowest=10):
+    """Context manager that records metrics within the context only, restoring the
+    previous on / off state on exit.
+
+    Examples
+    --------
+    >>> import test_aide as ta
+    >>>
+    >>> ta.metrics.reset()
+    >>> with ta.metrics.recording():
+    ...     ta.equality.assert_equal_dispatch([1, 2], [1, 2], "values")
+    >>> ta.metrics.get_metrics()["handlers"]["list"]["calls"]
+    1
+
+    """
+
+    global _n_slowest
+
+    previous_enabled = _enabled
+    previous_n_slowest = _n_slowest
+
+    enable(n_slowest)
+
+    try:
+
+        yield
+
+    finally:
+
+        _n_slowest = previous_n_slowest
+
+        if not previous_enabled:
+
+            disable()
+
+
+def record(helper):
+    """Return a context manager that records a call to, and the time spent in, the named
+    helper. If metrics are not enabled a shared no-op context manager is returned.
+
+    Parameters
+    ----------
+    helper : str
+        Name of the helper to record against e.g. "functions.test_function_arguments".
+
+    """
+
+    if not _enabled:
+
+        return _null_context
+
+    return _record_helper(helper)
+
+
+def recorded(helper):
+    """Return a decorator that records each call to the decorated function, with record,
+    against the named helper.
+
+    The decorated function keeps the signature of the original so inspect.getfullargspec
+    still reports its arguments.
+
+    Parameters
+    ----------
+    helper : str
+        Name of the helper to record against e.g. "functions.test_function_arguments".
+
+    """
+
+    def decorator(func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+
+            with record(helper):
+
+                return func(*args, **kwargs)
+
+        wrapper.__signature__ = inspect.signature(func)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def _record_helper(helper):
+
+    _enter()
+
+    start = time.perf_counter()
+
+    try:
+
+        yield
+
+    finally:
+
+        seconds = time.perf_counter() - start
+
+        _exit(seconds)
+
+        _add(_helpers, helper, seconds)
+
+
+def _enter():
+    """Mark the start of a recorded call, must be followed by _exit or _record_handler."""
+
+    global _depth
+
+    _depth += 1
+
+
+def _exit(seconds):
+    """Mark the end of a recorded call, adding seconds to the total if it is the outermost call."""
+
+    global _depth
+
+    _depth = max(_depth - 1, 0)
+
+    if _depth == 0:
+
+        _totals["seconds"] += seconds
+
+
+def _record_handler(handler, msg_tag, seconds, n_bytes):
+    """Record the end of a single call to an assert_equal_dispatch handler."""
+
+    _exit(seconds)
+
+    _add(_handlers, handler, seconds)
+
+    _totals["nodes"] += 1
+    _totals["bytes"] += n_bytes
+
+    if _n_slowest == 0:
+
+        return
+
+    item = (seconds, next(_sequence), msg_tag, handler)
+
+    if len(_slowest) < _n_slowest:
+
+        heapq.heappush(_slowest, item)
+
+    elif seconds > _slowest[0][0]:
+
+        heapq.heapreplace(_slowest, item)
+
+
+def _add(counters, name, seconds):
+
+    values = counters.get(name)
+
+    if values is None:
+
+        values = counters[name] = {"calls": 0, "seconds": 0.0}
+
+    values["calls"] += 1
+    values["seconds"] += seconds
@@ -30,6 +30,8 @@ except ModuleNotFoundError as err:
         "numpy must be installed to use functionality in pandas module"
     ) from err
 
+from test_aide.equality import _index_values_trivially_equal
+
 
 def _check_dfs_passed(df_1, df_2):
     """Function to check that two pd.DataFrames have equal indexes.
@@ -70,7 +72,10 @@ def _check_dfs_passed(df_1, df_2):
             f"expecting first positional arg and second positional arg to have equal number of rows but got\n  {df_1.shape[0]}\n  {df_2.shape[0]}"
         )
 
-    if not (df_1.index == df_2.index).all():
+    if not (
+        _index_values_trivially_equal(df_1.index, df_2.index)
+        or (df_1.index == df_2.index).all()
+    ):
         raise ValueError(
             f"expecting indexes for first positional arg and second positional arg to be the same but got\n  {df_1.index}\n  {df_2.index}"
         )
@@ -0,0 +1,221 @@
+"""
+This module contains a pytest plugin, registered through the pytest11 entry point, that
+reports the cost of test-aide assertions in each test.
+
+The plugin does nothing unless pytest is run with --test-aide-report. It then records
+metrics (see the metrics module) for each test, prints a table of the slowest assertions
+at the end of the session and writes all the results to a json file. With pytest-xdist
+the results from each worker are sent back to and merged on the controller.
+
+"""
+
+import heapq
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from test_aide import metrics
+
+
+def pytest_addoption(parser):
+
+    group = parser.getgroup("test-aide")
+
+    group.addoption(
+        "--test-aide-report",
+        action="store_true",
+        default=False,
+        help="record the cost of test-aide assertions in each test and report the slowest",
+    )
+
+    group.addoption(
+        "--test-aide-report-json",
+        default="test-aide-report.json",
+        help="file to write the test-aide assertion report to (default: %(default)s)",
+    )
+
+    group.addoption(
+        "--test-aide-slowest",
+        type=int,
+        default=10,
+        help="number of slowest assertions to show in the report (default: %(default)s)",
+    )
+
+    group.addoption(
+        "--test-aide-trace-memory",
+        action="store_true",
+        default=False,
+        help="also record the peak memory allocated by each test with tracemalloc",
+    )
+
+
+def pytest_configure(config):
+
+    if config.getoption("test_aide_report"):
+
+        config.pluginmanager.register(
+            AssertionReport(config), "test_aide_assertion_report"
+        )
+
+
+class AssertionReport:
+    """Plugin object collecting test-aide metrics for each test in the session."""
+
+    def __init__(self, config):
+
+        self.config = config
+        self.n_slowest = config.getoption("test_aide_slowest")
+        self.json_path = config.getoption("test_aide_report_json")
+        self.trace_memory = config.getoption("test_aide_trace_memory")
+        self.is_worker = hasattr(config, "workerinput")
+        self.tests = []
+
+    def pytest_sessionstart(self, session):
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+
+            tracemalloc.start()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+
+        metrics.reset()
+        metrics.enable(self.n_slowest)
+
+        if self.trace_memory:
+
+            _reset_peak_memory()
+
+        start = time.perf_counter()
+
+        try:
+
+            yield
+
+        finally:
+
+            test_seconds = time.perf_counter() - start
+
+            metrics.disable()
+
+            recorded = metrics.get_metrics()
+
+            metrics.reset()
+
+            if recorded["nodes"] or recorded["helpers"]:
+
+                self.tests.append(
+                    {
+                        "nodeid": item.nodeid,
+                        "test_seconds": test_seconds,
+                        "assertion_seconds": recorded["seconds"],
+                        "nodes": recorded["nodes"],
+                        "bytes": recorded["bytes"],
+                        "peak_memory": (
+                            tracemalloc.get_traced_memory()[1]
+                            if self.trace_memory
+                            else None
+                        ),
+                        "handlers": recorded["handlers"],
+                        "helpers": recorded["helpers"],
+                        "slowest": [
+                            dict(assertion, msg_tag=str(assertion["msg_tag"]))
+                            for assertion in recorded["slowest"]
+                        ],
+                    }
+                )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge the results sent back from a pytest-xdist worker."""
+
+        output = getattr(node, "workeroutput", {}).get("test_aide_report")
+
+        if output is not None:
+
+            self.tests.extend(json.loads(output))
+
+    def pytest_sessionfinish(self, session):
+
+        if self.is_worker:
+
+            self.config.workeroutput["test_aide_report"] = json.dumps(self.tests)
+
+            return
+
+        with open(self.json_path, "w") as f:
+
+            json.dump(self.report(), f, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+
+        if self.is_worker:
+
+            return
+
+        terminalreporter.write_sep("=", "test-aide slowest assertions")
+
+        slowest = self.slowest()
+
+        if not slowest:
+
+            terminalreporter.write_line("no test-aide assertions recorded")
+
+        else:
+
+            terminalreporter.write_line(
+                f"{'seconds':>10}  {'handler':<10}  {'msg_tag':<40}  test"
+            )
+
+            for assertion in slowest:
+
+                terminalreporter.write_line(
+                    f"{assertion['seconds']:>10.4f}  {assertion['handler']:<10}  "
+                    f"{_truncate(assertion['msg_tag'], 40):<40}  {assertion['nodeid']}"
+                )
+
+        terminalreporter.write_line(f"test-aide report written to {self.json_path}")
+
+    def slowest(self):
+        """Slowest assertions over all tests, slowest first."""
+
+        assertions = (
+            dict(assertion, nodeid=test["nodeid"])
+            for test in self.tests
+            for assertion in test["slowest"]
+        )
+
+        return heapq.nlargest(
+            self.n_slowest, assertions, key=lambda assertion: assertion["seconds"]
+        )
+
+    def report(self):
+        """Everything recorded in the session as a json serialisable dict."""
+
+        return {
+            "tests": sorted(
+                self.tests, key=lambda test: test["assertion_seconds"], reverse=True
+            ),
+            "slowest": self.slowest(),
+        }
+
+
+def _reset_peak_memory():
+    """Reset the peak memory traced by tracemalloc (reset_peak is only available in python 3.9+)."""
+
+    if hasattr(tracemalloc, "reset_peak"):
+
+        tracemalloc.reset_peak()
+
+    else:
+
+        tracemalloc.clear_traces()
+
+
+def _truncate(value, width):
+
+    value = str(value)
+
+    return value if len(value) <= width else value[: width - 3] + "..."
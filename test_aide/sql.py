@@ -0,0 +1,242 @@
+"""
+This module contains helper functions to compare the results of SQL queries run through
+any DB-API 2.0 (PEP 249) driver, e.g. sqlite3.
+
+Results are fetched and compared in batches so that large result sets can be compared
+without holding them in memory.
+
+"""
+
+from test_aide import metrics
+from test_aide.equality import assert_equal_dispatch
+
+
+def assert_query_results_equal_msg(
+    actual,
+    expected,
+    msg_tag,
+    query,
+    expected_query=None,
+    parameters=(),
+    expected_parameters=None,
+    batch_rows=10_000,
+):
+    """Runs a query on two database connections (or cursors) and asserts the results are
+    equal, row by row in order.
+
+    The results are fetched from both cursors in lockstep with fetchmany, batch_rows rows
+    at a time, so memory is bounded by a few batches rather than the size of the results.
+    Values are equal if they are equal by ==, so numbers of different types are equal if
+    their values are e.g. 2 and 2.0, as sqlite3 can return either for the same value
+    depending on the type affinity of a column. Each pair of batches is first compared
+    with ==, only the values that differ are compared with
+    equality.assert_equal_dispatch, e.g. so that NaN values are equal, if they are of the
+    same type. Values of different types that are not equal by == are always different.
+
+    Use ORDER BY in the queries if the order of the rows is not otherwise defined.
+
+    Parameters
+    ----------
+    actual : DB-API connection or cursor
+        Connection, or cursor, to run the query on for the actual results. If a connection
+        is passed a new cursor is created and closed after the comparison.
+
+    expected : DB-API connection or cursor
+        Connection, or cursor, to run the expected query on for the expected results.
+
+    msg_tag : string
+        A tag for the assert error message.
+
+    query : str
+        Query to run on actual.
+
+    expected_query : str or None, default = None
+        Query to run on expected, if None query is used.
+
+    parameters : sequence or mapping, default = ()
+        Parameters for query, passed to cursor.execute.
+
+    expected_parameters : sequence, mapping or None, default = None
+        Parameters for expected_query, if None parameters are used.
+
+    batch_rows : int, default = 10_000
+        Number of rows to fetch from each cursor at once.
+
+    Raises
+    ------
+    AssertionError
+        If the results do not have the same column names, the same number of rows or the
+        same values. The message gives the (0 based) number of the first row, and the column,
+        that differs.
+
+    """
+
+    with metrics.record("sql.assert_query_results_equal_msg"):
+
+        if not type(query) is str:
+
+            raise TypeError(f"query should be a str but got {type(query)}")
+
+        if expected_query is None:
+
+            expected_query = query
+
+        elif not type(expected_query) is str:
+
+            raise TypeError(
+                f"expected_query should be a str or None but got {type(expected_query)}"
+            )
+
+        if expected_parameters is None:
+
+            expected_parameters = parameters
+
+        if not (type(batch_rows) is int and batch_rows > 0):
+
+            raise ValueError("batch_rows should be a positive int")
+
+        actual_cursor, close_actual = _cursor(actual, "actual")
+
+        try:
+
+            expected_cursor, close_expected = _cursor(expected, "expected")
+
+            try:
+
+                actual_cursor.execute(query, parameters)
+                expected_cursor.execute(expected_query, expected_parameters)
+
+                _assert_results_equal(
+                    actual_cursor, expected_cursor, msg_tag, batch_rows
+                )
+
+            finally:
+
+                if close_expected:
+
+                    expected_cursor.close()
+
+        finally:
+
+            if close_actual:
+
+                actual_cursor.close()
+
+
+def _cursor(connection, name):
+    """Cursor for a DB-API connection or cursor, and whether it was created here (and so
+    should be closed after use).
+    """
+
+    if hasattr(connection, "fetchmany"):
+
+        return connection, False
+
+    if hasattr(connection, "cursor"):
+
+        return connection.cursor(), True
+
+    raise TypeError(
+        f"{name} should be a DB-API connection or cursor but got {type(connection)}"
+    )
+
+
+def _column_names(cursor):
+    """Names of the columns of the results of the last query executed on cursor."""
+
+    if cursor.description is None:
+
+        raise ValueError("query did not return any results")
+
+    return [column[0] for column in cursor.description]
+
+
+def _assert_results_equal(actual_cursor, expected_cursor, msg_tag, batch_rows):
+    """Compare the results of the queries executed on two cursors, fetching batch_rows
+    rows at a time from each.
+
+    The drivers may return fewer rows than requested by fetchmany before the end of the
+    results, rows left over from the longer of each pair of batches are compared with the
+    next batch from the other cursor.
+    """
+
+    columns = _column_names(expected_cursor)
+    actual_columns = _column_names(actual_cursor)
+
+    if actual_columns != columns:
+
+        raise AssertionError(
+            f"{msg_tag} - columns -\n  Expected: {columns}\n  Actual: {actual_columns}"
+        )
+
+    actual = expected = []
+    row = 0
+
+    while True:
+
+        if not actual:
+
+            actual = [tuple(values) for values in actual_cursor.fetchmany(batch_rows)]
+
+        if not expected:
+
+            expected = [
+                tuple(values) for values in expected_cursor.fetchmany(batch_rows)
+            ]
+
+        if not actual or not expected:
+
+            break
+
+        n_rows = min(len(actual), len(expected))
+
+        if actual[:n_rows] != expected[:n_rows]:
+
+            _assert_rows_equal(
+                actual[:n_rows], expected[:n_rows], columns, row, msg_tag
+            )
+
+        actual = actual[n_rows:]
+        expected = expected[n_rows:]
+        row += n_rows
+
+    for description, rows in [
+        ("missing from actual", expected),
+        ("not in expected", actual),
+    ]:
+
+        if rows:
+
+            raise AssertionError(
+                f"{msg_tag} - not equal at row {row}, row {description} -\n  {dict(zip(columns, rows[0]))}"
+            )
+
+
+def _assert_rows_equal(actual, expected, columns, row, msg_tag):
+    """Compare rows that are not equal by ==, value by value, where row is the number of
+    the first row.
+    """
+
+    for i, (actual_values, expected_values) in enumerate(zip(actual, expected)):
+
+        if actual_values == expected_values:
+
+            continue
+
+        for column, actual_value, expected_value in zip(
+            columns, actual_values, expected_values
+        ):
+
+            if actual_value == expected_value:
+
+                continue
+
+            location = f"{msg_tag} row {row + i} column {column}"
+
+            if type(actual_value) is not type(expected_value):
+
+                raise AssertionError(
+                    f"{location} -\n  Expected: {expected_value} ({type(expected_value).__name__})\n  Actual: {actual_value} ({type(actual_value).__name__})"
+                )
+
+            assert_equal_dispatch(expected_value, actual_value, location)
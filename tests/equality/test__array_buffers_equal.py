@@ -0,0 +1,99 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import numpy as np
+
+    has_numpy = True
+
+except ModuleNotFoundError:
+
+    has_numpy = False
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "array_1, array_2, expected",
+    [
+        # the None if not has_numpy below is to stop np being accessed before the test is skipped
+        (
+            None if not has_numpy else np.arange(10),
+            None if not has_numpy else np.arange(10),
+            True,
+        ),
+        (
+            None if not has_numpy else np.array([[1.5, np.nan], [3.0, 4.0]]),
+            None if not has_numpy else np.array([[1.5, np.nan], [3.0, 4.0]]),
+            True,
+        ),
+        (
+            None if not has_numpy else np.array([True, False, True]),
+            None if not has_numpy else np.array([True, False, True]),
+            True,
+        ),
+        (
+            None if not has_numpy else np.array([], dtype="float32"),
+            None if not has_numpy else np.array([], dtype="float32"),
+            True,
+        ),
+        (
+            None if not has_numpy else np.arange(10),
+            None if not has_numpy else np.arange(1, 11),
+            False,
+        ),
+        (
+            None if not has_numpy else np.arange(10, dtype="int64"),
+            None if not has_numpy else np.arange(10, dtype="int32"),
+            False,
+        ),
+        (
+            None if not has_numpy else np.arange(10),
+            None if not has_numpy else np.arange(10).reshape(2, 5),
+            False,
+        ),
+        (
+            None if not has_numpy else np.array([0.0]),
+            None if not has_numpy else np.array([-0.0]),
+            False,
+        ),
+        (
+            None if not has_numpy else np.array(["a", "b"], dtype=object),
+            None if not has_numpy else np.array(["a", "b"], dtype=object),
+            False,
+        ),
+        (
+            None if not has_numpy else np.arange(10)[::2],
+            None if not has_numpy else np.arange(10)[::2],
+            False,
+        ),
+    ],
+)
+def test_expected_output(array_1, array_2, expected):
+    """Test the output of _array_buffers_equal for different array pairs."""
+
+    actual = eh._array_buffers_equal(array_1, array_2)
+
+    assert (
+        actual is expected
+    ), f"Unexpected output from _array_buffers_equal -\n  Expected: {expected}\n  Actual: {actual}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_difference_after_first_chunk(mocker):
+    """Test that differences beyond the first chunk of the buffers are found."""
+
+    mocker.patch("test_aide.equality._BUFFER_COMPARE_CHUNK_BYTES", 16)
+
+    array_1 = np.arange(101, dtype="int8")
+    array_2 = array_1.copy()
+    array_2[-1] = 0
+
+    assert not eh._array_buffers_equal(
+        array_1, array_2
+    ), "difference in last chunk not found"
+
+    assert eh._array_buffers_equal(
+        array_1, array_1.copy()
+    ), "equal arrays compared in chunks not reported as equal"
@@ -0,0 +1,113 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import numpy as np
+
+    has_numpy = True
+
+except ModuleNotFoundError:
+
+    has_numpy = False
+
+try:
+
+    import pandas as pd
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+def _object_array(values):
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+
+    return array
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_no_nested_values_not_compared():
+    """Test False is returned, without comparing the values, if there are no nested values."""
+
+    result = eh._assert_object_values_equal(
+        _object_array([1, "a"]), _object_array([2, "b"]), str
+    )
+
+    assert (
+        result is False
+    ), f"Unexpected return value -\n  Expected: False\n  Actual: {result}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_missing_values():
+    """Test missing values are equal to missing values of the same type only."""
+
+    values = [[1], None, np.nan, pd.NA, pd.NaT]
+
+    result = eh._assert_object_values_equal(
+        _object_array(values), _object_array(values), str
+    )
+
+    assert (
+        result is True
+    ), f"Unexpected return value -\n  Expected: True\n  Actual: {result}"
+
+    with pytest.raises(AssertionError, match="^2 -"):
+
+        eh._assert_object_values_equal(
+            _object_array(values), _object_array([[1], None, None, pd.NA, pd.NaT]), str
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_any_missing_equal():
+    """Test missing values of any type are equal if any_missing_equal is True."""
+
+    result = eh._assert_object_values_equal(
+        _object_array([[1], None, np.nan, pd.NA, pd.NaT]),
+        _object_array([[1], np.nan, pd.NaT, None, pd.NA]),
+        str,
+        any_missing_equal=True,
+    )
+
+    assert (
+        result is True
+    ), f"Unexpected return value -\n  Expected: True\n  Actual: {result}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_first_difference_raised():
+    """Test the first difference in flat order is raised, whether it is a nested or scalar value."""
+
+    expected = _object_array([[1], "a", [2], "b"])
+
+    with pytest.raises(AssertionError, match="^1 -"):
+
+        eh._assert_object_values_equal(
+            expected, _object_array([[1], "x", [3], "y"]), str
+        )
+
+    with pytest.raises(AssertionError, match="^2 index 0"):
+
+        eh._assert_object_values_equal(
+            expected, _object_array([[1], "a", [3], "y"]), str
+        )
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_budget_charged():
+    """Test the scalar values compared in bulk are counted against comparison budgets."""
+
+    values = _object_array([[1]] + list(range(100)))
+
+    with pytest.raises(RuntimeError, match="comparison budget exceeded"):
+
+        with eh.comparison_budget(max_nodes=50):
+
+            eh._assert_object_values_equal(values, values.copy(), str)
@@ -0,0 +1,25 @@
+import pytest
+
+import test_aide.equality as eh
+
+
+@pytest.mark.parametrize(
+    "value_1, value_2, expected",
+    [
+        (b"", b"", None),
+        (b"abc", b"abc", None),
+        (b"abc", b"abd", 2),
+        (b"abc", b"xbc", 0),
+        (b"abc", b"ab", 2),
+        (b"", b"a", 0),
+        (bytes(1000) + b"a" + bytes(1000), bytes(1000) + b"b" + bytes(1000), 1000),
+    ],
+)
+def test_offset(value_1, value_2, expected):
+    """Test the offset of the first differing byte is returned."""
+
+    actual = eh._first_difference_offset(memoryview(value_1), memoryview(value_2))
+
+    assert (
+        actual == expected
+    ), f"Unexpected offset -\n  Expected: {expected}\n  Actual: {actual}"
@@ -0,0 +1,153 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import pandas as pd
+    import numpy as np
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+try:
+
+    import pyarrow  # noqa: F401
+
+    has_pyarrow = True
+
+except ModuleNotFoundError:
+
+    has_pyarrow = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "frame_1, frame_2, expected",
+    [
+        # the None if not has_pandas below is to stop pd being accessed before the test is skipped
+        (
+            None if not has_pandas else pd.DataFrame({"a": [1, 2], "b": [1.5, np.nan]}),
+            None if not has_pandas else pd.DataFrame({"a": [1, 2], "b": [1.5, np.nan]}),
+            True,
+        ),
+        (
+            (
+                None
+                if not has_pandas
+                else pd.DataFrame({"a": [1, 2]}, index=pd.Index(["x", "y"], name="i"))
+            ),
+            (
+                None
+                if not has_pandas
+                else pd.DataFrame({"a": [1, 2]}, index=pd.Index(["x", "y"], name="i"))
+            ),
+            True,
+        ),
+        (
+            None if not has_pandas else pd.DataFrame({"a": [1, 2]}),
+            None if not has_pandas else pd.DataFrame({"a": [1, 3]}),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.DataFrame({"a": [1, 2]}),
+            None if not has_pandas else pd.DataFrame({"b": [1, 2]}),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.DataFrame({"a": [1, 2]}),
+            None if not has_pandas else pd.DataFrame({"a": [1, 2]}, index=[1, 2]),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.DataFrame({"a": [1, 2]}),
+            None if not has_pandas else pd.DataFrame({"a": [1.0, 2.0]}),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.DataFrame({"a": ["x", "y"]}),
+            None if not has_pandas else pd.DataFrame({"a": ["x", "y"]}),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.DataFrame({"a": [1, 2]}),
+            None if not has_pandas else pd.Series([1, 2]),
+            False,
+        ),
+        (
+            (
+                None
+                if not has_pandas
+                else pd.DataFrame({"a": ["x", "y", None]}, dtype="category")
+            ),
+            (
+                None
+                if not has_pandas
+                else pd.DataFrame({"a": ["x", "y", None]}, dtype="category")
+            ),
+            True,
+        ),
+        (
+            (
+                None
+                if not has_pandas
+                else pd.DataFrame({"a": ["x", "y"]}, dtype="category")
+            ),
+            (
+                None
+                if not has_pandas
+                else pd.DataFrame(
+                    {"a": ["x", "x"]}, dtype=pd.CategoricalDtype(["x", "y"])
+                )
+            ),
+            False,
+        ),
+        # equal unordered dtypes, but the categories are in a different order
+        (
+            (
+                None
+                if not has_pandas
+                else pd.DataFrame(
+                    {"a": ["x", "y"]}, dtype=pd.CategoricalDtype(["x", "y"])
+                )
+            ),
+            (
+                None
+                if not has_pandas
+                else pd.DataFrame(
+                    {"a": ["x", "y"]}, dtype=pd.CategoricalDtype(["y", "x"])
+                )
+            ),
+            False,
+        ),
+    ],
+)
+def test_expected_output(frame_1, frame_2, expected):
+    """Test the output of _frame_buffers_equal for different DataFrame pairs."""
+
+    actual = eh._frame_buffers_equal(frame_1, frame_2)
+
+    assert (
+        actual is expected
+    ), f"Unexpected output from _frame_buffers_equal -\n  Expected: {expected}\n  Actual: {actual}"
+
+
+@pytest.mark.skipif(not has_pyarrow, reason="pyarrow not installed")
+@pytest.mark.parametrize(
+    "values_2, expected",
+    [(["x", None, "z"], True), (["x", None, "y"], False), (["x", "y", "z"], False)],
+)
+def test_arrow_strings(values_2, expected):
+    """Test string[pyarrow] columns are compared, with nulls in the same positions equal."""
+
+    frame_1 = pd.DataFrame({"a": ["x", None, "z"]}, dtype="string[pyarrow]")
+    frame_2 = pd.DataFrame({"a": values_2}, dtype="string[pyarrow]")
+
+    actual = eh._frame_buffers_equal(frame_1, frame_2)
+
+    assert (
+        actual is expected
+    ), f"Unexpected output from _frame_buffers_equal -\n  Expected: {expected}\n  Actual: {actual}"
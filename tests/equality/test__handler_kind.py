@@ -0,0 +1,110 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import pandas as pd
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+try:
+
+    import numpy as np
+
+    has_numpy = True
+
+except ModuleNotFoundError:
+
+    has_numpy = False
+
+try:
+
+    import scipy.sparse as sp
+
+    has_scipy = True
+
+except ModuleNotFoundError:
+
+    has_scipy = False
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ([1], "list"),
+        ((1,), "list"),
+        ({"a": 1}, "dict"),
+        (1, "scalar"),
+        ("a", "scalar"),
+        (None, "scalar"),
+        ({1}, "scalar"),
+        (b"a", "bytes"),
+        (bytearray(b"a"), "bytes"),
+        (memoryview(b"a"), "bytes"),
+    ],
+)
+def test_builtin_kinds(value, expected):
+    """Test the kind returned for builtin types."""
+
+    actual = eh._handler_kind(value)
+
+    assert (
+        actual == expected
+    ), f"Unexpected kind for {value} -\n  Expected: {expected}\n  Actual: {actual}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        # the None if not has_pandas below is to stop pd being accessed before the test is skipped
+        (None if not has_pandas else pd.DataFrame(), "frame"),
+        (None if not has_pandas else pd.Series(dtype=float), "series"),
+        (None if not has_pandas else pd.RangeIndex(2), "index"),
+        (None if not has_pandas else np.array([1]), "array"),
+        (None if not has_pandas else np.ma.array([1], mask=[True]), "array"),
+        (
+            (
+                None
+                if not has_pandas
+                else np.zeros(1, dtype=[("a", "i8")]).view(np.recarray)
+            ),
+            "array",
+        ),
+        (float("nan"), "nan"),
+    ],
+)
+def test_pandas_numpy_kinds(value, expected):
+    """Test the kind returned for pandas and numpy types."""
+
+    actual = eh._handler_kind(value)
+
+    assert (
+        actual == expected
+    ), f"Unexpected kind for {value} -\n  Expected: {expected}\n  Actual: {actual}"
+
+
+@pytest.mark.skipif(not has_scipy, reason="scipy not installed")
+def test_sparse_kind():
+    """Test the kind returned for scipy sparse matrices and arrays."""
+
+    for value in [sp.csr_matrix((1, 1)), sp.coo_array((1, 1))]:
+
+        actual = eh._handler_kind(value)
+
+        assert (
+            actual == "sparse"
+        ), f"Unexpected kind for {type(value)} -\n  Expected: sparse\n  Actual: {actual}"
+
+
+def test_handlers_exist():
+    """Test that every handler name in _HANDLERS is a function in the equality module."""
+
+    for kind, name in eh._HANDLERS.items():
+
+        assert callable(getattr(eh, name, None)), f"no function {name} for {kind}"
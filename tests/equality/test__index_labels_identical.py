@@ -0,0 +1,75 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import pandas as pd
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "index_1, index_2, expected",
+    [
+        # the None if not has_pandas below is to stop pd being accessed before the test is skipped
+        (
+            None if not has_pandas else pd.RangeIndex(3),
+            None if not has_pandas else pd.RangeIndex(3),
+            True,
+        ),
+        (
+            None if not has_pandas else pd.Index(["x", "y"], name="i"),
+            None if not has_pandas else pd.Index(["x", "y"], name="j"),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.Index([1, "a"], dtype=object),
+            None if not has_pandas else pd.Index([1, "a"], dtype=object),
+            True,
+        ),
+        # equal by Index.equals but with different inferred types
+        (
+            None if not has_pandas else pd.Index([1, "a"], dtype=object),
+            None if not has_pandas else pd.Index([1.0, "a"], dtype=object),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.CategoricalIndex(["a", "b"]),
+            None if not has_pandas else pd.CategoricalIndex(["a", "b"]),
+            True,
+        ),
+        # equal unordered dtypes, but the categories are in a different order
+        (
+            (
+                None
+                if not has_pandas
+                else pd.CategoricalIndex(["a", "b"], categories=["a", "b"])
+            ),
+            (
+                None
+                if not has_pandas
+                else pd.CategoricalIndex(["a", "b"], categories=["b", "a"])
+            ),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.CategoricalIndex([1.0, "a"]),
+            None if not has_pandas else pd.CategoricalIndex([1, "a"]),
+            False,
+        ),
+    ],
+)
+def test_expected_output(index_1, index_2, expected):
+    """Test the output of _index_labels_identical for different index pairs."""
+
+    actual = eh._index_labels_identical(index_1, index_2)
+
+    assert (
+        actual is expected
+    ), f"Unexpected output from _index_labels_identical -\n  Expected: {expected}\n  Actual: {actual}"
@@ -0,0 +1,75 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import pandas as pd
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "index_1, index_2, expected",
+    [
+        # the None if not has_pandas below is to stop pd being accessed before the test is skipped
+        (
+            None if not has_pandas else pd.RangeIndex(0, 5),
+            None if not has_pandas else pd.RangeIndex(0, 5),
+            True,
+        ),
+        (
+            None if not has_pandas else pd.RangeIndex(0, 1, 1),
+            None if not has_pandas else pd.RangeIndex(0, 1, 3),
+            True,
+        ),
+        (
+            None if not has_pandas else pd.RangeIndex(0, 0),
+            None if not has_pandas else pd.RangeIndex(7, 7),
+            True,
+        ),
+        (
+            None if not has_pandas else pd.RangeIndex(0, 5),
+            None if not has_pandas else pd.RangeIndex(1, 6),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.RangeIndex(0, 3),
+            None if not has_pandas else pd.Index([0, 1, 2]),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.Index([0, 1, 2]),
+            None if not has_pandas else pd.Index([0, 1, 2]),
+            False,
+        ),
+    ],
+)
+def test_expected_output(index_1, index_2, expected):
+    """Test the output of _index_values_trivially_equal for different index pairs."""
+
+    actual = eh._index_values_trivially_equal(index_1, index_2)
+
+    assert (
+        actual is expected
+    ), f"Unexpected output from _index_values_trivially_equal -\n  Expected: {expected}\n  Actual: {actual}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_views_equal():
+    """Test that an index and a view onto the same data are reported as equal."""
+
+    idx = pd.Index(["a", "b", "c"])
+
+    assert eh._index_values_trivially_equal(
+        idx, idx.view()
+    ), "index and view of the same data not reported as equal"
+
+    assert eh._index_values_trivially_equal(
+        idx, idx
+    ), "index and itself not reported as equal"
@@ -0,0 +1,96 @@
+import pytest
+
+import test_aide.equality as eh
+
+
+def _payload():
+
+    return {
+        "items": [
+            {
+                "id": i,
+                "name": f"n{i}",
+                "score": i / 2,
+                "ok": True,
+                "tags": ["a"],
+                "x": None,
+            }
+            for i in range(5)
+        ],
+        "count": 5,
+    }
+
+
+@pytest.mark.parametrize(
+    "expected, actual",
+    [
+        ([], []),
+        ([1, "a", 1.5, True, None], [1, "a", 1.5, True, None]),
+        (_payload(), _payload()),
+        # values are not compared
+        ([1, {"a": [2]}], [3, {"a": [4]}]),
+        # key order does not matter
+        ({"a": 1, "b": [2.0]}, {"b": [3.0], "a": 4}),
+    ],
+)
+def test_json_like(expected, actual):
+    """Test True is returned for JSON-like objects with the same types in every position."""
+
+    assert eh._json_like(
+        expected, actual, "test_msg"
+    ), f"_json_like not True for {expected} and {actual}"
+
+
+@pytest.mark.parametrize(
+    "expected, actual",
+    [
+        ((1, 2), (1, 2)),
+        ([1], (1,)),
+        ([1], [1.0]),
+        ([1], [True]),
+        ([[1]], [[1, 2]]),
+        ({"a": 1}, {"b": 1}),
+        ({1: "a"}, {1: "a"}),
+        ([(1, 2)], [(1, 2)]),
+        ([{1, 2}], [{1, 2}]),
+        ([b"a"], [b"a"]),
+        ({"a": {"b": [1]}}, {"a": {"b": [None]}}),
+    ],
+)
+def test_not_json_like(expected, actual):
+    """Test False is returned for objects that are not JSON-like or where the types,
+    lengths or keys differ.
+    """
+
+    assert not eh._json_like(
+        expected, actual, "test_msg"
+    ), f"_json_like not False for {expected} and {actual}"
+
+
+def test_budget_charged():
+    """Test the number of values checked is charged to active comparison budgets."""
+
+    payload = _payload()
+
+    with eh.comparison_budget() as budget:
+
+        eh._json_like(payload, _payload(), "test_msg")
+
+    # 2 top level values, 5 records, 6 values per record and 1 tag per record
+    expected_nodes = 2 + 5 + 5 * 6 + 5
+
+    assert (
+        budget.nodes == expected_nodes
+    ), f"Unexpected nodes charged -\n  Expected: {expected_nodes}\n  Actual: {budget.nodes}"
+
+
+def test_budget_exceeded():
+    """Test a RuntimeError is raised if a budget is exceeded."""
+
+    with pytest.raises(
+        RuntimeError, match="comparison budget exceeded \\(max_nodes=10\\) at test_msg"
+    ):
+
+        with eh.comparison_budget(max_nodes=10):
+
+            eh._json_like(_payload(), _payload(), "test_msg")
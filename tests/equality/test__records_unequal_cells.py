@@ -0,0 +1,143 @@
+import datetime
+
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import numpy  # noqa: F401
+
+    has_numpy = True
+
+except ModuleNotFoundError:
+
+    has_numpy = False
+
+try:
+
+    import pandas as pd
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+def _records(n=5):
+
+    return [
+        {"id": i, "day": datetime.date(2020, 1, i + 1), "value": i / 2}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize(
+    "expected, actual",
+    [
+        ([], []),
+        ([1, 2], [1, 2]),
+        ([{"a": 1}, {"a": 2}], [{"a": 1}, 2]),
+        ([{"a": 1}, {"b": 2}], [{"a": 1}, {"b": 2}]),
+        ([{"a": 1}, {"a": 2}], [{"a": 1}, {"b": 2}]),
+        ([{"a": [1]}], [{"a": [1]}]),
+        ([{"a": {"b": 1}}], [{"a": {"b": 1}}]),
+        (
+            None if not has_pandas else [{"a": pd.Series([1])}],
+            None if not has_pandas else [{"a": pd.Series([1])}],
+        ),
+    ],
+)
+def test_not_records(expected, actual):
+    """Test None is returned if expected and actual are not lists of records with the
+    same keys and scalar values.
+    """
+
+    if expected is None:
+
+        pytest.skip("pandas not installed")
+
+    result = eh._records_unequal_cells(expected, actual, "test_msg")
+
+    assert result is None, f"Unexpected result -\n  Expected: None\n  Actual: {result}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_equal_records():
+    """Test no cells are returned for equal records, including NaN values."""
+
+    expected = _records()
+    actual = _records()
+    expected[2]["value"] = float("nan")
+    actual[2]["value"] = float("nan")
+
+    result = eh._records_unequal_cells(expected, actual, "test_msg")
+
+    assert result == [], f"Unexpected result -\n  Expected: []\n  Actual: {result}"
+
+
+def test_nan_without_numpy(monkeypatch):
+    """Test NaN values are returned as unequal if numpy is not installed, as
+    assert_equal_dispatch compares them with == without numpy.
+    """
+
+    monkeypatch.setattr(eh, "has_numpy", False)
+
+    expected = _records()
+    actual = _records()
+    expected[2]["value"] = float("nan")
+    actual[2]["value"] = float("nan")
+
+    result = eh._records_unequal_cells(expected, actual, "test_msg")
+
+    assert result == [
+        (2, "value")
+    ], f"Unexpected result -\n  Expected: [(2, 'value')]\n  Actual: {result}"
+
+
+def test_unequal_cells_order():
+    """Test the cells with unequal values or types are returned in record order, then key
+    order of the actual records.
+    """
+
+    expected = _records()
+    actual = _records()
+    actual[4]["value"] = -1.0
+    actual[1] = {"value": 0.5, "day": datetime.date(2021, 1, 2), "id": 1.0}
+
+    result = eh._records_unequal_cells(expected, actual, "test_msg")
+
+    expected_result = [(1, "day"), (1, "id"), (4, "value")]
+
+    assert (
+        result == expected_result
+    ), f"Unexpected result -\n  Expected: {expected_result}\n  Actual: {result}"
+
+
+def test_comparison_error():
+    """Test None is returned if comparing values raises an exception."""
+
+    class Incomparable:
+        def __eq__(self, other):
+
+            raise ValueError("cannot compare")
+
+    expected = [{"a": Incomparable()}]
+    actual = [{"a": Incomparable()}]
+
+    result = eh._records_unequal_cells(expected, actual, "test_msg")
+
+    assert result is None, f"Unexpected result -\n  Expected: None\n  Actual: {result}"
+
+
+def test_budget_charged():
+    """Test the number of values compared is charged to active comparison budgets."""
+
+    with eh.comparison_budget() as budget:
+
+        eh._records_unequal_cells(_records(), _records(), "test_msg")
+
+    assert (
+        budget.nodes == 15
+    ), f"Unexpected nodes charged -\n  Expected: 15\n  Actual: {budget.nodes}"
@@ -0,0 +1,56 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import numpy as np
+
+    has_numpy = True
+
+except ModuleNotFoundError:
+
+    has_numpy = False
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "expected, actual, blocks",
+    [
+        ([], [], []),
+        ([1, 2, 3], [1, 2, 3], []),
+        ([1, 2, 3], [1, 9, 2, 3], [(1, 1, 1, 2)]),
+        ([1, 2, 3, 4], [1, 4], [(1, 3, 1, 1)]),
+        ([1, 2, 3, 4], [1, 9, 3, 4], [(1, 2, 1, 2)]),
+        ([1, 2, 3], [], [(0, 3, 0, 0)]),
+        # rows moved from the start to the end are a deletion and an insertion
+        ([1, 2, 3, 4, 5], [3, 4, 5, 1, 2], [(0, 2, 0, 0), (5, 5, 3, 5)]),
+        # repeated rows are matched within the gaps between unique rows
+        ([7, 7, 1, 7, 7, 2], [7, 1, 7, 7, 8, 2], [(1, 2, 1, 1), (5, 5, 4, 5)]),
+        ([1, 1, 1], [2, 2], [(0, 3, 0, 2)]),
+    ],
+)
+def test_expected_output(expected, actual, blocks):
+    """Test the unmatched blocks found for different sequences."""
+
+    result = eh._row_diff_blocks(
+        np.array(expected, dtype="u8"), np.array(actual, dtype="u8")
+    )
+
+    assert (
+        result == blocks
+    ), f"Unexpected output from _row_diff_blocks -\n  Expected: {blocks}\n  Actual: {result}"
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [([], []), ([3, 1, 2], [1, 2]), ([1, 5, 2, 3, 0, 4], [0, 2, 3, 5])],
+)
+def test_longest_increasing_subsequence(values, expected):
+    """Test the positions of a longest increasing subsequence are returned."""
+
+    result = eh._longest_increasing_subsequence(values)
+
+    assert (
+        result == expected
+    ), f"Unexpected output from _longest_increasing_subsequence -\n  Expected: {expected}\n  Actual: {result}"
@@ -0,0 +1,99 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import pandas as pd
+    import numpy as np
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+try:
+
+    import pyarrow  # noqa: F401
+
+    has_pyarrow = True
+
+except ModuleNotFoundError:
+
+    has_pyarrow = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "series_1, series_2, expected",
+    [
+        # the None if not has_pandas below is to stop pd being accessed before the test is skipped
+        (
+            None if not has_pandas else pd.Series([1.5, np.nan], name="a"),
+            None if not has_pandas else pd.Series([1.5, np.nan], name="a"),
+            True,
+        ),
+        (
+            None if not has_pandas else pd.Series([1.5, np.nan], name="a"),
+            None if not has_pandas else pd.Series([1.5, np.nan], name="b"),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.Series([1, 2]),
+            None if not has_pandas else pd.Series([1, 2], index=["x", "y"]),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.Series(["x", "y"], dtype="category"),
+            None if not has_pandas else pd.Series(["x", "y"], dtype="category"),
+            True,
+        ),
+        (
+            None if not has_pandas else pd.Series(["x", "y"], dtype="category"),
+            None if not has_pandas else pd.Series(["y", "x"], dtype="category"),
+            False,
+        ),
+        # categories equal by == but with different types
+        (
+            None if not has_pandas else pd.Series(pd.Categorical([1.0, "a"])),
+            None if not has_pandas else pd.Series(pd.Categorical([1, "a"])),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.Series(["x", "y"]),
+            None if not has_pandas else pd.Series(["x", "y"]),
+            False,
+        ),
+        (
+            None if not has_pandas else pd.Series([1, 2]),
+            None if not has_pandas else pd.DataFrame({"a": [1, 2]}),
+            False,
+        ),
+    ],
+)
+def test_expected_output(series_1, series_2, expected):
+    """Test the output of _series_buffers_equal for different Series pairs."""
+
+    actual = eh._series_buffers_equal(series_1, series_2)
+
+    assert (
+        actual is expected
+    ), f"Unexpected output from _series_buffers_equal -\n  Expected: {expected}\n  Actual: {actual}"
+
+
+@pytest.mark.skipif(not has_pyarrow, reason="pyarrow not installed")
+def test_arrow_strings():
+    """Test string[pyarrow] Series are compared."""
+
+    series_1 = pd.Series(["x", None, "z"], dtype="string[pyarrow]")
+
+    for values_2, expected in [(["x", None, "z"], True), (["x", "y", "z"], False)]:
+
+        series_2 = pd.Series(values_2, dtype="string[pyarrow]")
+
+        actual = eh._series_buffers_equal(series_1, series_2)
+
+        assert (
+            actual is expected
+        ), f"Unexpected output from _series_buffers_equal -\n  Expected: {expected}\n  Actual: {actual}"
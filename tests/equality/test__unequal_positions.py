@@ -0,0 +1,22 @@
+import pytest
+
+import test_aide.equality as eh
+
+
+@pytest.mark.parametrize(
+    "expected, actual, positions",
+    [
+        ([1, 2, 3], [1, 2, 3], []),
+        ([1, 2, 3], [1, 0, 0], [1, 2]),
+        ([[1], [2]], [[1], [3]], [1]),
+        ({"a": 1, "b": 2, "c": 3}, {"c": 0, "b": 2, "a": 0}, ["c", "a"]),
+    ],
+)
+def test_positions(expected, actual, positions):
+    """Test the indexes or keys (in the order of actual) of the values that are not == are returned."""
+
+    result = list(eh._unequal_positions(expected, actual))
+
+    assert (
+        result == positions
+    ), f"Unexpected positions -\n  Expected: {positions}\n  Actual: {result}"
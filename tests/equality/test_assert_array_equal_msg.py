@@ -159,3 +159,240 @@ def test_exception_print():
         )
 
     assert exc_info.value.args[0] == "a\n" + f"expected:\n{srs}\n" + f"actual:\n{srs2}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_equal_buffers_skip_numpy_assert(mocker):
+    """Test np.testing.assert_array_equal is not called if the array buffers are equal and no kwargs are passed."""
+
+    srs = np.array([1.0, np.nan, 3.0])
+    srs2 = np.array([1.0, np.nan, 3.0])
+
+    spy = mocker.spy(numpy.testing, "assert_array_equal")
+
+    eh.assert_array_equal_msg(expected=srs, actual=srs2, msg_tag="a")
+
+    assert (
+        spy.call_count == 0
+    ), f"Unexpected number of call to np.testing.assert_array_equal -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_different_buffers_numpy_assert_called(mocker):
+    """Test np.testing.assert_array_equal is called if the array buffers differ but values are equal."""
+
+    srs = np.array([0.0, 1.0])
+    srs2 = np.array([-0.0, 1.0])
+
+    spy = mocker.spy(numpy.testing, "assert_array_equal")
+
+    eh.assert_array_equal_msg(expected=srs, actual=srs2, msg_tag="a")
+
+    assert (
+        spy.call_count == 1
+    ), f"Unexpected number of call to np.testing.assert_array_equal -\n  Expected: 1\n  Actual: {spy.call_count}"
+
+
+def _structured_array():
+
+    dtype = [
+        ("id", "i8"),
+        ("score", "f8"),
+        ("vector", "f4", (2,)),
+        ("inner", [("name", "U3"), ("value", "f8")]),
+    ]
+
+    array = np.zeros(4, dtype=dtype)
+    array["id"] = np.arange(4)
+    array["score"][1] = np.nan
+    array["inner"]["name"] = "abc"
+
+    return array
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_structured_equal(mocker):
+    """Test equal structured and record arrays, including NaN values, pass without calling
+    np.testing.assert_array_equal.
+    """
+
+    spy = mocker.spy(numpy.testing, "assert_array_equal")
+
+    eh.assert_array_equal_msg(_structured_array(), _structured_array(), "a")
+
+    eh.assert_array_equal_msg(
+        _structured_array().view(np.recarray),
+        _structured_array().view(np.recarray),
+        "a",
+    )
+
+    assert (
+        spy.call_count == 0
+    ), f"Unexpected number of call to np.testing.assert_array_equal -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "field, index, value, message",
+    [
+        (
+            "id",
+            2,
+            5,
+            "a - 1 of 4 elements unequal in field id, first at index (2,)\n  Expected: 2\n  Actual: 5",
+        ),
+        (
+            "vector",
+            3,
+            [0, 1],
+            "a - 1 of 4 elements unequal in field vector, first at index (3,)\n  Expected: [0. 0.]\n  Actual: [0. 1.]",
+        ),
+        (
+            ("inner", "value"),
+            0,
+            1.5,
+            "a - 1 of 4 elements unequal in field inner.value, first at index (0,)\n  Expected: 0.0\n  Actual: 1.5",
+        ),
+    ],
+)
+def test_structured_field_difference(field, index, value, message):
+    """Test the field and index of the first difference in a structured array are reported."""
+
+    actual = _structured_array()
+
+    if type(field) is tuple:
+
+        actual[field[0]][field[1]][index] = value
+
+    else:
+
+        actual[field][index] = value
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        eh.assert_array_equal_msg(actual, _structured_array(), "a")
+
+    assert (
+        str(exc_info.value) == message
+    ), f"Unexpected error message -\n  Expected: {message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_structured_different_fields():
+    """Test an error is raised if the field names of structured arrays differ."""
+
+    expected = np.zeros(2, dtype=[("a", "i8"), ("b", "i8")])
+    actual = np.zeros(2, dtype=[("a", "i8"), ("c", "i8")])
+
+    with pytest.raises(
+        AssertionError,
+        match="a - unequal fields -\n  Expected: \\('a', 'b'\\)\n  Actual: \\('a', 'c'\\)",
+    ):
+
+        eh.assert_array_equal_msg(actual, expected, "a")
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_masked_values_ignored():
+    """Test values under the mask of masked arrays are not compared."""
+
+    expected = np.ma.array([1.0, 2.0, np.nan], mask=[False, True, False])
+    actual = np.ma.array([1.0, 99.0, np.nan], mask=[False, True, False])
+
+    eh.assert_array_equal_msg(actual, expected, "a")
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "actual, message",
+    [
+        (
+            None if not has_numpy else np.ma.array([1.0, 2.0, 4.0], mask=[0, 1, 0]),
+            "a - 1 of 3 elements unequal, first at index (2,)\n  Expected: 3.0\n  Actual: 4.0",
+        ),
+        (
+            None if not has_numpy else np.ma.array([1.0, 2.0, 3.0], mask=[0, 0, 0]),
+            "a - 1 of 3 elements unequal, first at index (1,)\n  Expected: masked\n  Actual: 2.0",
+        ),
+    ],
+)
+def test_masked_difference(actual, message):
+    """Test differences in unmasked values or masks are reported."""
+
+    expected = np.ma.array([1.0, 2.0, 3.0], mask=[0, 1, 0])
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        eh.assert_array_equal_msg(actual, expected, "a")
+
+    assert (
+        str(exc_info.value) == message
+    ), f"Unexpected error message -\n  Expected: {message}\n  Actual: {exc_info.value}"
+
+
+def _nested_array(last):
+
+    values = np.empty(4, dtype=object)
+    values[:] = [1, [1, 2], {"a": np.array([1.0, np.nan])}, last]
+
+    return values
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_object_nested_equal(mocker):
+    """Test object arrays holding nested values are compared without np.testing.assert_array_equal."""
+
+    spy = mocker.spy(numpy.testing, "assert_array_equal")
+
+    eh.assert_array_equal_msg(_nested_array("x"), _nested_array("x"), "a")
+
+    assert (
+        spy.call_count == 0
+    ), f"Unexpected number of call to np.testing.assert_array_equal -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "actual, cause",
+    [
+        (
+            None if not has_numpy else _nested_array("y"),
+            "a index 3 -\n  Expected: x\n  Actual: y",
+        ),
+        (
+            None if not has_numpy else _nested_array(np.nan),
+            "a index 3 -\n  Expected: x\n  Actual: nan",
+        ),
+    ],
+)
+def test_object_nested_scalar_difference(actual, cause):
+    """Test the index of the first unequal scalar value in an object array holding nested values is reported."""
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        eh.assert_array_equal_msg(actual, _nested_array("x"), "a")
+
+    assert (
+        str(exc_info.value.__cause__) == cause
+    ), f"Unexpected error message -\n  Expected: {cause}\n  Actual: {exc_info.value.__cause__}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_object_nested_difference():
+    """Test the index of the first unequal nested value in a 2d object array is reported."""
+
+    expected = np.empty((2, 2), dtype=object)
+    expected[:] = [[None, np.nan], [[1, 2], "x"]]
+
+    actual = expected.copy()
+    actual[1, 0] = [1, 3]
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        eh.assert_array_equal_msg(actual, expected, "a")
+
+    cause = "a index (1, 0) index 1 -\n  Expected: 2\n  Actual: 3"
+
+    assert (
+        str(exc_info.value.__cause__) == cause
+    ), f"Unexpected error message -\n  Expected: {cause}\n  Actual: {exc_info.value.__cause__}"
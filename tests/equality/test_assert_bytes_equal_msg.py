@@ -0,0 +1,119 @@
+import array
+import inspect
+
+import pytest
+
+import test_aide.equality as eh
+
+
+def test_arguments():
+    """Test arguments for arguments of test_aide.equality.assert_bytes_equal_msg."""
+
+    expected_arguments = ["actual", "expected", "msg_tag"]
+
+    arg_spec = inspect.getfullargspec(eh.assert_bytes_equal_msg)
+
+    arguments = arg_spec.args
+
+    assert len(expected_arguments) == len(
+        arguments
+    ), f"Incorrect number of arguments -\n  Expected: {len(expected_arguments)}\n  Actual: {len(arguments)}"
+
+    for i, (e, a) in enumerate(zip(expected_arguments, arguments)):
+
+        assert e == a, f"Incorrect arg at index {i} -\n  Expected: {e}\n  Actual: {a}"
+
+    assert arg_spec.defaults is None, "Unexpected default values for arguments"
+
+
+@pytest.mark.parametrize(
+    "expected, actual, message",
+    [
+        (
+            "a",
+            "a",
+            "expected should be of type bytes, bytearray or memoryview, but got <class 'str'>",
+        ),
+        (
+            b"a",
+            bytearray(b"a"),
+            "expected \\(<class 'bytes'>\\) and actual \\(<class 'bytearray'>\\) type mismatch",
+        ),
+    ],
+)
+def test_type_errors(expected, actual, message):
+    """Test a TypeError is raised if expected is not a bytes like type or the types differ."""
+
+    with pytest.raises(TypeError, match=message):
+
+        eh.assert_bytes_equal_msg(actual, expected, "test_msg")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        b"",
+        b"abc" * 1000,
+        bytearray(b"abc"),
+        memoryview(b"abc"),
+        memoryview(array.array("d", [1.0, 2.0])),
+    ],
+)
+def test_equal_no_error(value):
+    """Test no error is raised for equal objects."""
+
+    actual = value if type(value) is memoryview else type(value)(value)
+
+    eh.assert_bytes_equal_msg(actual, value, "test_msg")
+
+
+def test_first_difference_window():
+    """Test the error gives the offset of the first difference, the lengths and a window
+    of bytes either side of it rather than the whole objects.
+    """
+
+    expected = bytes(range(256)) * 100
+    actual = bytearray(expected)
+    actual[1000] = 0
+
+    expected_message = (
+        "test_msg -\n  First difference at byte 1000\n"
+        "  Expected length: 25600\n  Actual length: 25600\n"
+        f"  Expected [984:1017]: {' '.join(f'{b:02x}' for b in expected[984:1017])}\n"
+        f"  Actual [984:1017]: {' '.join(f'{b:02x}' for b in actual[984:1017])}"
+    )
+
+    with pytest.raises(AssertionError) as err:
+
+        eh.assert_bytes_equal_msg(bytes(actual), expected, "test_msg")
+
+    assert (
+        str(err.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {err.value}"
+
+
+def test_prefix():
+    """Test the offset is the length of the shorter object if it is a prefix of the other."""
+
+    with pytest.raises(
+        AssertionError,
+        match="test_msg -\n  First difference at byte 3\n  Expected length: 4\n  Actual length: 3\n"
+        "  Expected \\[0:4\\]: 61 62 63 64\n  Actual \\[0:3\\]: 61 62 63",
+    ):
+
+        eh.assert_bytes_equal_msg(b"abc", b"abcd", "test_msg")
+
+
+def test_memoryview_equal_bytes():
+    """Test memoryviews with equal bytes but unequal values (NaN) are reported."""
+
+    expected = memoryview(array.array("d", [float("nan")]))
+    actual = memoryview(array.array("d", [float("nan")]))
+
+    with pytest.raises(
+        AssertionError,
+        match="test_msg -\n  Equal bytes but unequal memoryviews\n"
+        "  Expected format, shape: d, \\(1,\\)\n  Actual format, shape: d, \\(1,\\)",
+    ):
+
+        eh.assert_bytes_equal_msg(actual, expected, "test_msg")
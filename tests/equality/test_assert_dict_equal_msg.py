@@ -122,3 +122,23 @@ def test_assert_equal_dispatch_calls():
                 assert (
                     e == a
                 ), f"Difference in positional args call {i} to test_aide.equality.assert_equal_dispatch (for key {k}) -\n Expected: {e}\n  Actual: {a}"
+
+
+def test_json_like_only_unequal_items_dispatched(mocker):
+    """Test that for large JSON-like dicts assert_equal_dispatch is only called on the
+    values that are not ==.
+    """
+
+    expected_value = {f"k{i}": [i] for i in range(100)}
+    actual_value = {f"k{i}": [i] for i in range(100)}
+    actual_value["k7"] = [-1]
+
+    mocked_method = mocker.patch("test_aide.equality.assert_equal_dispatch")
+
+    eh.assert_dict_equal_msg(actual_value, expected_value, "test_msg")
+
+    expected_calls = [mocker.call([7], [-1], "test_msg key k7")]
+
+    assert (
+        mocked_method.call_args_list == expected_calls
+    ), f"Unexpected calls to test_aide.equality.assert_equal_dispatch -\n  Expected: {expected_calls}\n  Actual: {mocked_method.call_args_list}"
@@ -24,6 +24,16 @@ except ModuleNotFoundError:
 
     has_numpy = False
 
+try:
+
+    import scipy.sparse as sp
+
+    has_scipy = True
+
+except ModuleNotFoundError:
+
+    has_scipy = False
+
 
 # potential functions that test_aide.equality.assert_equal_dispatch can call
 potential_assert_functions = [
@@ -35,6 +45,8 @@ potential_assert_functions = [
     "test_aide.equality.assert_equal_msg",
     "test_aide.equality.assert_np_nan_eqal_msg",
     "test_aide.equality.assert_array_equal_msg",
+    "test_aide.equality.assert_bytes_equal_msg",
+    "test_aide.equality.assert_sparse_equal_msg",
 ]
 
 
@@ -254,6 +266,9 @@ def test_np_array_correct_function_call(mocker, expected_value):
         ("test_aide.equality.assert_equal_msg", "a"),
         ("test_aide.equality.assert_equal_msg", False),
         ("test_aide.equality.assert_equal_msg", None),
+        ("test_aide.equality.assert_bytes_equal_msg", b"a"),
+        ("test_aide.equality.assert_bytes_equal_msg", bytearray(b"a")),
+        ("test_aide.equality.assert_bytes_equal_msg", memoryview(b"a")),
     ],
 )
 def test_non_dataframe_correct_function_call(
@@ -419,3 +434,51 @@ def test_other_type_equality_checked():
         eh.assert_equal_dispatch(
             expected=set(["a"]), actual=set(["a", "b"]), msg="test message"
         )
+
+
+@pytest.mark.skipif(not has_scipy, reason="scipy not installed")
+@pytest.mark.parametrize(
+    "expected_value",
+    # the None if not has_scipy below is to stop sp being accessed before the test is skipped
+    [
+        None if not has_scipy else sp.csr_matrix((2, 2)),
+        None if not has_scipy else sp.coo_matrix([[1, 0], [0, 2]]),
+        None if not has_scipy else sp.csc_array([[1, 0], [0, 2]]),
+    ],
+)
+def test_sparse_correct_function_call(mocker, expected_value):
+    """Test that assert_sparse_equal_msg is called when expected is a scipy sparse matrix
+    or array - and none of the other functions are called.
+    """
+
+    test_function_call = "test_aide.equality.assert_sparse_equal_msg"
+
+    for x in potential_assert_functions:
+
+        mocker.patch(x)
+
+    actual_value = expected_value.copy()
+
+    eh.assert_equal_dispatch(
+        expected=expected_value, actual=actual_value, msg="test_msg"
+    )
+
+    getter, attribute = _get_target(test_function_call)
+
+    mocked_function_call = getattr(getter(), attribute)
+
+    assert mocked_function_call.call_args_list == [
+        mocker.call(actual_value, expected_value, "test_msg")
+    ], f"Unexpected calls to {test_function_call} -\n  Expected: 1 call with (actual, expected, test_msg)\n  Actual: {mocked_function_call.call_args_list}"
+
+    for test_function_not_call in set(potential_assert_functions) - set(
+        [test_function_call]
+    ):
+
+        getter, attribute = _get_target(test_function_not_call)
+
+        mocked_function_not_call = getattr(getter(), attribute)
+
+        assert (
+            mocked_function_not_call.call_count == 0
+        ), f"Unexpected number of calls to {test_function_not_call} -\n  Expected:  0\n  Actual:  {mocked_function_not_call.call_count}"
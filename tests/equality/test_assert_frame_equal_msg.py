@@ -145,3 +145,108 @@ def test_exception_print():
         eh.assert_frame_equal_msg(
             expected=df, actual=df2, msg_tag="a", print_actual_and_expected=True
         )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_equal_buffers_skip_pandas_assert(mocker):
+    """Test pd.testing.assert_frame_equal is not called if the column buffers are equal and no kwargs are passed."""
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, None]})
+    df2 = pd.DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, None]})
+
+    spy = mocker.spy(pandas.testing, "assert_frame_equal")
+
+    eh.assert_frame_equal_msg(expected=df, actual=df2, msg_tag="a")
+
+    assert (
+        spy.call_count == 0
+    ), f"Unexpected number of call to pd.testing.assert_frame_equal -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_nested_column_difference():
+    """Test the row and column of the first unequal value in an object column holding nested values is reported."""
+
+    expected = pd.DataFrame(
+        {"a": [1, 2, 3], "b": [[1], {"c": [1, 2]}, None], "c": ["x", "y", "z"]},
+        index=["i", "j", "k"],
+    )
+    actual = expected.copy()
+    actual["b"] = [[1], {"c": [1, 3]}, None]
+
+    eh.assert_frame_equal_msg(expected.copy(), expected, "a")
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        eh.assert_frame_equal_msg(actual, expected, "a")
+
+    cause = "a row j column b key c index 1 -\n  Expected: 2\n  Actual: 3"
+
+    assert (
+        str(exc_info.value.__cause__) == cause
+    ), f"Unexpected error message -\n  Expected: {cause}\n  Actual: {exc_info.value.__cause__}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_nested_column_other_columns_compared():
+    """Test the columns without nested values are still compared when a frame has nested values."""
+
+    expected = pd.DataFrame({"a": [1, 2], "b": [[1], [2]]})
+    actual = pd.DataFrame({"a": [1, 3], "b": [[1], [2]]})
+
+    with pytest.raises(AssertionError, match="a"):
+
+        eh.assert_frame_equal_msg(actual, expected, "a")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "index_1, index_2",
+    [
+        (
+            (
+                None
+                if not has_pandas
+                else pd.CategoricalIndex(["a", "b"], categories=["a", "b"])
+            ),
+            (
+                None
+                if not has_pandas
+                else pd.CategoricalIndex(["a", "b"], categories=["b", "a"])
+            ),
+        ),
+        (
+            None if not has_pandas else pd.Index([1, "a"], dtype=object),
+            None if not has_pandas else pd.Index([1.0, "a"], dtype=object),
+        ),
+    ],
+)
+def test_index_differences_not_skipped(index_1, index_2):
+    """Test indexes that Index.equals treats as equal but pd.testing.assert_frame_equal
+    does not are not passed by the byte-wise comparison."""
+
+    with pytest.raises(AssertionError):
+
+        eh.assert_frame_equal_msg(
+            pd.DataFrame({"a": [1, 2]}, index=index_1),
+            pd.DataFrame({"a": [1, 2]}, index=index_2),
+            "a",
+        )
+
+    with pytest.raises(AssertionError):
+
+        eh.assert_series_equal_msg(
+            pd.Series([1, 2], index=index_1), pd.Series([1, 2], index=index_2), "a"
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_nested_column_missing_values():
+    """Test missing values of different types are equal in a column holding nested values,
+    as they are in pd.testing.assert_frame_equal."""
+
+    expected = pd.DataFrame({"a": [1, 2, 3], "b": [[1], None, pd.NA]})
+    actual = pd.DataFrame({"a": [1, 2, 3], "b": [[1], float("nan"), None]})
+
+    eh.assert_frame_equal_msg(actual, expected, "a")
+    eh.assert_series_equal_msg(actual["b"], expected["b"], "a")
@@ -137,3 +137,70 @@ def test_exception_print():
         )
 
     assert exc_info.value.args[0] == "a\n" + f"expected:\n{srs}\n" + f"actual:\n{srs2}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "expected, actual",
+    [
+        # the None if not has_pandas below is to stop pd being accessed before the test is skipped
+        (
+            None if not has_pandas else pd.RangeIndex(0, 10),
+            None if not has_pandas else pd.RangeIndex(0, 10),
+        ),
+        (
+            None if not has_pandas else pd.RangeIndex(5, -5, -2, name="a"),
+            None if not has_pandas else pd.RangeIndex(5, -5, -2, name="a"),
+        ),
+    ],
+)
+def test_range_index_fast_path(mocker, expected, actual):
+    """Test that pandas.testing.assert_index_equal is not called for equal RangeIndex objects."""
+
+    spy = mocker.spy(pandas.testing, "assert_index_equal")
+
+    eh.assert_index_equal_msg(expected=expected, actual=actual, msg_tag="a")
+
+    assert (
+        spy.call_count == 0
+    ), f"Unexpected number of call to pd.testing.assert_index_equal -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_shared_data_fast_path(mocker):
+    """Test that pandas.testing.assert_index_equal is not called for indexes viewing the same data."""
+
+    idx = pd.Index([1, 2, 3], name="a")
+
+    spy = mocker.spy(pandas.testing, "assert_index_equal")
+
+    eh.assert_index_equal_msg(expected=idx, actual=idx.view(), msg_tag="a")
+
+    assert (
+        spy.call_count == 0
+    ), f"Unexpected number of call to pd.testing.assert_index_equal -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "expected, actual",
+    [
+        (
+            None if not has_pandas else pd.RangeIndex(0, 10),
+            None if not has_pandas else pd.RangeIndex(1, 11),
+        ),
+        (
+            None if not has_pandas else pd.RangeIndex(0, 10, name="a"),
+            None if not has_pandas else pd.RangeIndex(0, 10, name="b"),
+        ),
+        (
+            None if not has_pandas else pd.Index([1, 2, 3], name="a"),
+            None if not has_pandas else pd.Index([1, 2, 3], name="a").set_names("b"),
+        ),
+    ],
+)
+def test_fast_path_mismatch_error(expected, actual):
+    """Test an assert error is still raised for indexes that differ in values or names."""
+
+    with pytest.raises(AssertionError, match="a"):
+        eh.assert_index_equal_msg(expected=expected, actual=actual, msg_tag="a")
@@ -3,6 +3,16 @@ import inspect
 import test_aide.equality as eh
 from unittest import mock
 
+try:
+
+    import numpy  # noqa: F401
+
+    has_numpy = True
+
+except ModuleNotFoundError:
+
+    has_numpy = False
+
 
 def test_arguments():
     """Test arguments for arguments of test_aide.equality.assert_list_tuple_equal_msg."""
@@ -110,3 +120,70 @@ def test_assert_equal_dispatch_calls():
                 assert (
                     e == a
                 ), f"Difference in positional args at index {j} in call {i} to test_aide.equality.assert_equal_dispatch -\n Expected: {e}\n  Actual: {a}"
+
+
+def test_json_like_only_unequal_items_dispatched(mocker):
+    """Test that for long JSON-like lists assert_equal_dispatch is only called on the items
+    that are not ==.
+    """
+
+    expected_value = [[i, {"a": i}] for i in range(100)]
+    actual_value = [[i, {"a": i}] for i in range(100)]
+    actual_value[3] = [3, {"a": -1}]
+    actual_value[50] = [-1, {"a": 50}]
+
+    mocked_method = mocker.patch("test_aide.equality.assert_equal_dispatch")
+
+    eh.assert_list_tuple_equal_msg(actual_value, expected_value, "test_msg")
+
+    expected_calls = [
+        mocker.call(expected_value[i], actual_value[i], f"test_msg index {i}")
+        for i in [3, 50]
+    ]
+
+    assert (
+        mocked_method.call_args_list == expected_calls
+    ), f"Unexpected calls to test_aide.equality.assert_equal_dispatch -\n  Expected: {expected_calls}\n  Actual: {mocked_method.call_args_list}"
+
+
+def test_json_like_type_mismatch():
+    """Test that a type mismatch in a long JSON-like list is still reported even though
+    the values are ==.
+    """
+
+    expected_value = [float(i) for i in range(100)]
+    actual_value = list(expected_value)
+    actual_value[70] = 70
+
+    with pytest.raises(
+        TypeError,
+        match="expected \\(<class 'float'>\\) and actual \\(<class 'int'>\\) type mismatch",
+    ):
+
+        eh.assert_list_tuple_equal_msg(actual_value, expected_value, "test_msg")
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_records_only_unequal_values_dispatched(mocker):
+    """Test that for long lists of records assert_equal_dispatch is only called on the
+    values that are not equal or have different types, in the order of the records.
+    """
+
+    expected_value = [{"a": i, "b": str(i), "c": float("nan")} for i in range(100)]
+    actual_value = [{"a": i, "b": str(i), "c": float("nan")} for i in range(100)]
+    actual_value[60] = {"c": float("nan"), "b": "x", "a": -1}
+    actual_value[20]["a"] = 20.0
+
+    mocked_method = mocker.patch("test_aide.equality.assert_equal_dispatch")
+
+    eh.assert_list_tuple_equal_msg(actual_value, expected_value, "test_msg")
+
+    expected_calls = [
+        mocker.call(20, 20.0, "test_msg index 20 key a"),
+        mocker.call("60", "x", "test_msg index 60 key b"),
+        mocker.call(60, -1, "test_msg index 60 key a"),
+    ]
+
+    assert (
+        mocked_method.call_args_list == expected_calls
+    ), f"Unexpected calls to test_aide.equality.assert_equal_dispatch -\n  Expected: {expected_calls}\n  Actual: {mocked_method.call_args_list}"
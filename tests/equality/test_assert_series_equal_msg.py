@@ -137,3 +137,67 @@ def test_exception_print():
         )
 
     assert exc_info.value.args[0] == "a\n" + f"expected:\n{srs}\n" + f"actual:\n{srs2}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_nested_values_difference():
+    """Test the index label of the first unequal value in a Series holding nested values is reported."""
+
+    expected = pd.Series([[1, 2], None, "x"], index=[10, 20, 30])
+    actual = pd.Series([[1, 2], None, "y"], index=[10, 20, 30])
+
+    eh.assert_series_equal_msg(expected.copy(), expected, "a")
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        eh.assert_series_equal_msg(actual, expected, "a")
+
+    cause = "a index 30 -\n  Expected: x\n  Actual: y"
+
+    assert (
+        str(exc_info.value.__cause__) == cause
+    ), f"Unexpected error message -\n  Expected: {cause}\n  Actual: {exc_info.value.__cause__}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_nested_values_index_compared():
+    """Test the index is still compared when a Series holds nested values."""
+
+    expected = pd.Series([[1, 2], "x"], index=[10, 20])
+    actual = pd.Series([[1, 2], "x"], index=[10, 21])
+
+    with pytest.raises(AssertionError, match="a"):
+
+        eh.assert_series_equal_msg(actual, expected, "a")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_equal_categoricals_skip_pandas_assert(mocker):
+    """Test pd.testing.assert_series_equal is not called for equal categorical Series."""
+
+    srs = pd.Series(["x", "y", None], dtype="category")
+
+    spy = mocker.spy(pandas.testing, "assert_series_equal")
+
+    eh.assert_series_equal_msg(srs.copy(), srs, "a")
+
+    assert (
+        spy.call_count == 0
+    ), f"Unexpected number of call to pd.testing.assert_series_equal -\n  Expected: 0\n  Actual: {spy.call_count}"
+
+    with pytest.raises(AssertionError, match="a"):
+
+        eh.assert_series_equal_msg(srs.cat.reorder_categories(["y", "x"]), srs, "a")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_categories_of_different_types():
+    """Test categoricals with categories equal by == but of different types are not equal."""
+
+    with pytest.raises(AssertionError, match="a"):
+
+        eh.assert_series_equal_msg(
+            pd.Series(pd.Categorical([1.0, "a"])),
+            pd.Series(pd.Categorical([1, "a"])),
+            "a",
+        )
@@ -0,0 +1,112 @@
+import inspect
+
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import numpy as np
+    import scipy.sparse as sp
+
+    has_scipy = True
+
+except ModuleNotFoundError:
+
+    has_scipy = False
+
+pytestmark = pytest.mark.skipif(not has_scipy, reason="scipy not installed")
+
+
+def test_arguments():
+    """Test arguments for arguments of test_aide.equality.assert_sparse_equal_msg."""
+
+    expected_arguments = ["actual", "expected", "msg_tag"]
+
+    arg_spec = inspect.getfullargspec(eh.assert_sparse_equal_msg)
+
+    assert (
+        arg_spec.args == expected_arguments
+    ), f"Incorrect arguments -\n  Expected: {expected_arguments}\n  Actual: {arg_spec.args}"
+
+    assert arg_spec.defaults is None, "Unexpected default values for arguments"
+
+
+def test_type_errors():
+    """Test a TypeError is raised if expected is not sparse or the types differ."""
+
+    with pytest.raises(
+        TypeError,
+        match="expected should be a scipy sparse matrix or array, but got <class 'numpy.ndarray'>",
+    ):
+
+        eh.assert_sparse_equal_msg(np.eye(2), np.eye(2), "test_msg")
+
+    with pytest.raises(TypeError, match="type mismatch"):
+
+        eh.assert_sparse_equal_msg(
+            sp.csc_matrix(np.eye(2)), sp.csr_matrix(np.eye(2)), "test_msg"
+        )
+
+
+def test_canonical_equal():
+    """Test matrices with the same values are equal, regardless of duplicate entries,
+    explicitly stored zeros and index order.
+    """
+
+    expected = sp.coo_matrix(
+        ([1.0, 2.0, 0.0, np.nan], ([0, 0, 1, 2], [1, 1, 2, 0])), shape=(3, 3)
+    )
+    actual = sp.coo_matrix(([np.nan, 3.0], ([2, 0], [0, 1])), shape=(3, 3))
+
+    eh.assert_sparse_equal_msg(actual, expected, "test_msg")
+
+
+def test_unequal_shapes():
+    """Test an AssertionError is raised if the shapes differ."""
+
+    with pytest.raises(
+        AssertionError,
+        match="test_msg - unequal shapes\n  Expected: \\(3, 3\\)\n  Actual: \\(2, 3\\)",
+    ):
+
+        eh.assert_sparse_equal_msg(
+            sp.csr_matrix((2, 3)), sp.csr_matrix((3, 3)), "test_msg"
+        )
+
+
+@pytest.mark.parametrize(
+    "actual_dense, message",
+    [
+        (
+            [[0, 1, 0], [0, 0, 5], [4, 0, 0]],
+            "test_msg - 1 unequal values, first at \\(1, 2\\)\n  Expected: 3\n  Actual: 5",
+        ),
+        (
+            [[0, 1, 0], [0, 0, 0], [0, 0, 7]],
+            "test_msg - 3 unequal values, first at \\(1, 2\\)\n  Expected: 3\n  Actual: 0",
+        ),
+    ],
+)
+def test_first_difference(actual_dense, message):
+    """Test the number of unequal values and the first of them are reported."""
+
+    expected = sp.csr_matrix([[0, 1, 0], [0, 0, 3], [4, 0, 0]])
+
+    with pytest.raises(AssertionError, match=message):
+
+        eh.assert_sparse_equal_msg(sp.csr_matrix(actual_dense), expected, "test_msg")
+
+
+def test_not_densified(mocker):
+    """Test the matrices are not converted to dense arrays."""
+
+    expected = sp.csr_matrix(np.eye(3))
+
+    spy = mocker.spy(sp.csr_matrix, "toarray")
+
+    with pytest.raises(AssertionError):
+
+        eh.assert_sparse_equal_msg(sp.csr_matrix(np.eye(3) * 2), expected, "test_msg")
+
+    assert spy.call_count == 0, "toarray unexpectedly called"
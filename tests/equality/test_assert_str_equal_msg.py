@@ -0,0 +1,199 @@
+import inspect
+
+import pytest
+
+import test_aide.equality as eh
+
+
+def _lines(n):
+
+    return [f"line {i}" for i in range(1, n + 1)]
+
+
+def test_arguments():
+    """Test arguments for arguments of test_aide.equality.assert_str_equal_msg."""
+
+    expected_arguments = ["actual", "expected", "msg_tag", "context", "max_diff_lines"]
+
+    arg_spec = inspect.getfullargspec(eh.assert_str_equal_msg)
+
+    arguments = arg_spec.args
+
+    assert (
+        arguments == expected_arguments
+    ), f"Incorrect arguments -\n  Expected: {expected_arguments}\n  Actual: {arguments}"
+
+    assert arg_spec.defaults == (
+        50,
+        50,
+    ), f"Unexpected default values -\n  Expected: (50, 50)\n  Actual: {arg_spec.defaults}"
+
+
+@pytest.mark.parametrize(
+    "actual, expected, kwargs, error, message",
+    [
+        (
+            "a",
+            1,
+            {},
+            TypeError,
+            "expected should be of type str, but got <class 'int'>",
+        ),
+        (1, "a", {}, TypeError, "actual should be of type str, but got <class 'int'>"),
+        (
+            "a",
+            "a",
+            {"context": 1.0},
+            TypeError,
+            "context should be an int but got <class 'float'>",
+        ),
+        (
+            "a",
+            "a",
+            {"max_diff_lines": -1},
+            ValueError,
+            "max_diff_lines should be greater than or equal to 0",
+        ),
+    ],
+)
+def test_argument_errors(actual, expected, kwargs, error, message):
+    """Test an exception is raised if arguments are not the correct types or values."""
+
+    with pytest.raises(error, match=message):
+
+        eh.assert_str_equal_msg(actual, expected, "test_msg", **kwargs)
+
+
+def test_equal_no_error():
+    """Test no error is raised for equal strings."""
+
+    value = "\n".join(_lines(1000))
+
+    eh.assert_str_equal_msg("".join(value), value, "test_msg")
+
+
+def test_first_difference_and_line_diff():
+    """Test the error gives the position of the first difference, a window around it and a
+    diff of only the lines that differ.
+    """
+
+    expected_lines = _lines(1000)
+    actual_lines = list(expected_lines)
+    actual_lines[499] = "line X"
+    actual_lines.insert(501, "extra")
+
+    with pytest.raises(AssertionError) as err:
+
+        eh.assert_str_equal_msg(
+            "\n".join(actual_lines), "\n".join(expected_lines), "test_msg", context=5
+        )
+
+    offset = len("\n".join(expected_lines[:499])) + 1 + len("line ")
+
+    expected_message = (
+        f"test_msg -\n  First difference at character {offset} (line 500, column 6)\n"
+        f"  Expected length: {len(chr(10).join(expected_lines))}\n"
+        f"  Actual length: {len(chr(10).join(actual_lines))}\n"
+        f"  Expected [{offset - 5}:{offset + 6}]: 'line 500\\nli'\n"
+        f"  Actual [{offset - 5}:{offset + 6}]: 'line X\\nline'\n"
+        "  Line diff:\n"
+        "  - 500: line 500\n"
+        "  + 500: line X\n"
+        "  + 502: extra"
+    )
+
+    assert (
+        str(err.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {err.value}"
+
+
+def test_line_diff_aligns_unique_lines():
+    """Test the line diff aligns lines that occur once in both strings, and the lines
+    common to the start and end of the lines between them.
+    """
+
+    expected = "\n".join(["a", "x", "b", "x", "x", "c"])
+    actual = "\n".join(["a", "y", "b", "x", "y", "c"])
+
+    with pytest.raises(AssertionError) as err:
+
+        eh.assert_str_equal_msg(actual, expected, "test_msg")
+
+    assert str(err.value).endswith(
+        "  Line diff:\n" "  - 2: x\n" "  + 2: y\n" "  - 5: x\n" "  + 5: y"
+    ), f"Unexpected end of error message: {err.value}"
+
+
+def test_max_diff_lines():
+    """Test the line diff is limited to max_diff_lines lines, or not shown if 0."""
+
+    expected = "\n".join(_lines(10))
+    actual = "\n".join(line.upper() for line in _lines(10))
+
+    with pytest.raises(AssertionError) as err:
+
+        eh.assert_str_equal_msg(actual, expected, "test_msg", max_diff_lines=3)
+
+    assert str(err.value).endswith(
+        "  Line diff:\n  - 1: line 1\n  - 2: line 2\n  - 3: line 3\n  ... and 17 more lines"
+    ), f"Unexpected end of error message: {err.value}"
+
+    with pytest.raises(AssertionError) as err:
+
+        eh.assert_str_equal_msg(actual, expected, "test_msg", max_diff_lines=0)
+
+    assert "Line diff" not in str(err.value), f"Unexpected line diff in: {err.value}"
+
+
+def test_line_diff_size_limit():
+    """Test the line diff is not run if too many lines differ."""
+
+    expected = "\n".join(_lines(1000))
+    actual = "\n".join(line.upper() for line in _lines(1000))
+
+    with pytest.raises(AssertionError) as err:
+
+        eh.assert_str_equal_msg(actual, expected, "test_msg")
+
+    assert str(err.value).endswith(
+        "  Line diff not shown, lines 1 to 1000 of expected and 1 to 1000 of actual differ"
+    ), f"Unexpected end of error message: {err.value}"
+
+
+def test_long_strings_from_assert_equal_msg():
+    """Test assert_equal_msg uses assert_str_equal_msg for long strings, so the whole
+    strings are not included in the error.
+    """
+
+    expected = "a" * 100000
+    actual = "a" * 50000 + "b" + "a" * 49999
+
+    with pytest.raises(AssertionError) as err:
+
+        eh.assert_equal_msg(actual, expected, "test_msg")
+
+    assert str(err.value).startswith(
+        "test_msg -\n  First difference at character 50000 (line 1, column 50001)"
+    ), f"Unexpected error message start: {str(err.value)[:100]}"
+
+    assert (
+        len(str(err.value)) < 1000
+    ), f"Error message unexpectedly long: {len(str(err.value))}"
+
+
+def test_line_diff_without_numpy(monkeypatch):
+    """Test the line diff falls back to difflib if numpy is not installed."""
+
+    monkeypatch.setattr(eh, "has_numpy", False)
+    monkeypatch.delattr(eh, "np", raising=False)
+
+    expected = "\n".join(["a", "x", "b", "x", "x", "c"])
+    actual = "\n".join(["a", "y", "b", "x", "y", "c"])
+
+    with pytest.raises(AssertionError) as err:
+
+        eh.assert_equal_msg(actual + "." * 1000, expected + "." * 1000, "test_msg")
+
+    assert str(err.value).endswith(
+        "  Line diff:\n  - 2: x\n  + 2: y\n  - 5: x\n  + 5: y"
+    ), f"Unexpected end of error message: {err.value}"
@@ -0,0 +1,198 @@
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import pandas as pd
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+try:
+
+    import numpy as np
+
+    has_numpy = True
+
+except ModuleNotFoundError:
+
+    has_numpy = False
+
+
+@pytest.mark.parametrize(
+    "expected, actual",
+    [
+        (1, 1),
+        ("a", "a"),
+        ([1, (2, 3)], [1, (2, 3)]),
+        ({"a": {"b": [1, None]}}, {"a": {"b": [1, None]}}),
+        ({1, 2}, {1, 2}),
+    ],
+)
+def test_equal_result(expected, actual):
+    """Test that an equal, truthy result is returned for equal objects."""
+
+    result = eh.compare(expected, actual, "test_msg")
+
+    assert result, "result not truthy for equal objects"
+
+    assert (
+        result.equal is True and result.path is None and result.reason is None
+    ), f"Unexpected result for equal objects: {result}"
+
+
+@pytest.mark.parametrize(
+    "expected, actual, msg, path, reason",
+    [
+        (1, 2, "m", "m", "Expected: 1\n  Actual: 2"),
+        (
+            {"a": [1, 2]},
+            {"a": [1, 3]},
+            "output",
+            "output key a index 1",
+            "Expected: 2\n  Actual: 3",
+        ),
+        (
+            [1, [2, 3]],
+            [1, [2]],
+            "",
+            "index 1",
+            "Unequal lengths -\n  Expected: 2\n  Actual: 1",
+        ),
+        (
+            {"a": 1},
+            {"a": 1, "b": 2},
+            "m",
+            "m",
+            "Unequal number of keys -\n  Expected: 1\n  Actual: 2",
+        ),
+        (
+            {"a": 1},
+            {"b": 1},
+            "m",
+            "m",
+            "Keys in expected not in actual: {'a'}\nKeys in actual not in expected: {'b'}",
+        ),
+        (
+            [1],
+            [1.0],
+            "m",
+            "m index 0",
+            "expected (<class 'int'>) and actual (<class 'float'>) type mismatch",
+        ),
+    ],
+)
+def test_not_equal_result(expected, actual, msg, path, reason):
+    """Test the path and reason of the first difference are returned for unequal objects."""
+
+    result = eh.compare(expected, actual, msg)
+
+    assert not result, "result truthy for unequal objects"
+
+    assert (
+        result.path == path
+    ), f"Unexpected path -\n  Expected: {path}\n  Actual: {result.path}"
+
+    assert (
+        result.reason == reason
+    ), f"Unexpected reason -\n  Expected: {reason}\n  Actual: {result.reason}"
+
+
+def test_no_exceptions_for_builtin_types(mocker):
+    """Test that the raising assert functions are not used for builtin types."""
+
+    for name in eh._HANDLERS.values():
+
+        mocker.patch(f"test_aide.equality.{name}", side_effect=AssertionError)
+
+    result = eh.compare({"a": [1, (2, "x")]}, {"a": [1, (2, "y")]}, "m")
+
+    assert (
+        result.path == "m key a index 1 index 1"
+    ), f"Unexpected path -\n  Expected: m key a index 1 index 1\n  Actual: {result.path}"
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_nan():
+    """Test that np.NaN values are compared as equal."""
+
+    assert eh.compare([np.nan], [np.nan]), "nan values not equal"
+
+    result = eh.compare([np.nan], [1.0])
+
+    assert (
+        result.reason
+        == "Both values are not equal to np.NaN -\n  Expected: nan\n  Actual: 1.0"
+    ), f"Unexpected reason: {result.reason}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_pandas_types():
+    """Test that pandas objects are compared with the pandas assert functions."""
+
+    df = pd.DataFrame({"a": [1, 2]})
+
+    assert eh.compare({"df": df}, {"df": df.copy()}), "equal DataFrames not equal"
+
+    result = eh.compare({"df": df}, {"df": df.assign(a=[1, 3])}, "m")
+
+    assert (
+        result.path == "m key df"
+    ), f"Unexpected path -\n  Expected: m key df\n  Actual: {result.path}"
+
+    assert (
+        "values are different" in result.reason
+    ), f"Unexpected reason: {result.reason}"
+
+
+def test_budget_applies():
+    """Test that comparison budgets apply to compare."""
+
+    with pytest.raises(RuntimeError, match="comparison budget exceeded"):
+
+        with eh.comparison_budget(max_nodes=2):
+
+            eh.compare([1, 2, 3], [1, 2, 3])
+
+
+def test_reason_formatted_lazily():
+    """Test that the reason is only formatted when accessed."""
+
+    class Value:
+        def __init__(self):
+            self.n_format = 0
+
+        def __eq__(self, other):
+            return False
+
+        def __format__(self, spec):
+            self.n_format += 1
+            return "value"
+
+    expected = Value()
+
+    result = eh.compare(expected, Value())
+
+    assert expected.n_format == 0, "reason formatted before being accessed"
+
+    assert (
+        result.reason == "Expected: value\n  Actual: value"
+    ), f"Unexpected reason: {result.reason}"
+
+
+def test_json_like_difference_path():
+    """Test the path to the difference is given for long JSON-like lists and dicts."""
+
+    expected = {f"k{i}": [{"a": j} for j in range(100)] for i in range(100)}
+    actual = {f"k{i}": [{"a": j} for j in range(100)] for i in range(100)}
+    actual["k60"][80]["a"] = -1
+
+    result = eh.compare(expected, actual, "m")
+
+    assert (
+        result.path == "m key k60 index 80 key a"
+    ), f"Unexpected path -\n  Expected: m key k60 index 80 key a\n  Actual: {result.path}"
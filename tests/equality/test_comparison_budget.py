@@ -0,0 +1,123 @@
+import itertools
+import pytest
+
+import test_aide.equality as eh
+
+try:
+
+    import numpy as np
+
+    has_numpy = True
+
+except ModuleNotFoundError:
+
+    has_numpy = False
+
+
+@pytest.mark.parametrize(
+    "kwargs, exception, match",
+    [
+        ({"max_nodes": 1.0}, TypeError, "max_nodes should be an int or None"),
+        ({"max_bytes": "1"}, TypeError, "max_bytes should be an int or None"),
+        ({"max_nodes": -1}, ValueError, "max_nodes should be greater than or equal"),
+        ({"max_bytes": -1}, ValueError, "max_bytes should be greater than or equal"),
+        ({"max_seconds": "1"}, TypeError, "max_seconds should be an int, float"),
+        ({"max_seconds": -0.5}, ValueError, "max_seconds should be greater than"),
+    ],
+)
+def test_argument_errors(kwargs, exception, match):
+    """Test that errors are raised if invalid budgets are passed."""
+
+    with pytest.raises(exception, match=match):
+
+        with eh.comparison_budget(**kwargs):
+
+            pass
+
+
+def test_within_budget_no_error():
+    """Test that no error is raised if a comparison stays within the budget."""
+
+    with eh.comparison_budget(max_nodes=4, max_seconds=60) as budget:
+
+        eh.assert_equal_dispatch([1, 2, 3], [1, 2, 3], "test_msg")
+
+    assert (
+        budget.nodes == 4
+    ), f"Unexpected number of nodes visited -\n  Expected: 4\n  Actual: {budget.nodes}"
+
+
+def test_max_nodes_error():
+    """Test that an error giving the location and progress is raised once max_nodes is exceeded."""
+
+    expected = {"a": [1, 2, 3], "b": [4, 5, 6]}
+
+    with pytest.raises(
+        RuntimeError,
+        match=r"comparison budget exceeded \(max_nodes=3\) at test_msg key a index 1 -\n  Nodes visited: 4\n  Bytes materialised: 0\n  Seconds elapsed: ",
+    ):
+
+        with eh.comparison_budget(max_nodes=3):
+
+            eh.assert_equal_dispatch(expected, expected.copy(), "test_msg")
+
+
+def test_max_seconds_error(mocker):
+    """Test that an error is raised once max_seconds is exceeded."""
+
+    mocker.patch(
+        "test_aide.equality.time.perf_counter", side_effect=itertools.count(0, 0.6)
+    )
+
+    with pytest.raises(
+        RuntimeError, match=r"comparison budget exceeded \(max_seconds=1\) at x index 0"
+    ):
+
+        with eh.comparison_budget(max_seconds=1):
+
+            eh.assert_equal_dispatch([1, 2], [1, 2], "x")
+
+
+@pytest.mark.skipif(not has_numpy, reason="numpy not installed")
+def test_max_bytes_error(mocker):
+    """Test that an error is raised before arrays exceeding max_bytes are compared."""
+
+    mocked = mocker.patch("test_aide.equality.assert_array_equal_msg")
+
+    array = np.zeros(100, dtype="int64")
+
+    with pytest.raises(
+        RuntimeError, match=r"comparison budget exceeded \(max_bytes=1000\) at arr"
+    ):
+
+        with eh.comparison_budget(max_bytes=1000):
+
+            eh.assert_equal_dispatch(array, array.copy(), "arr")
+
+    assert (
+        mocked.call_count == 0
+    ), f"Unexpected number of calls to assert_array_equal_msg -\n  Expected: 0\n  Actual: {mocked.call_count}"
+
+
+def test_nested_budgets_all_charged():
+    """Test that each active budget is charged and budgets are removed on exit."""
+
+    with eh.comparison_budget() as outer:
+
+        with eh.comparison_budget() as inner:
+
+            eh.assert_equal_dispatch([1], [1], "test_msg")
+
+        eh.assert_equal_dispatch(1, 1, "test_msg")
+
+    assert (
+        inner.nodes == 2
+    ), f"Unexpected number of nodes for inner budget -\n  Expected: 2\n  Actual: {inner.nodes}"
+
+    assert (
+        outer.nodes == 3
+    ), f"Unexpected number of nodes for outer budget -\n  Expected: 3\n  Actual: {outer.nodes}"
+
+    assert (
+        eh._budget_state.active == []
+    ), "budgets not removed after exiting comparison_budget"
@@ -0,0 +1,22 @@
+import pytest
+
+import test_aide.equality as eh
+
+
+@pytest.mark.parametrize(
+    "expected, actual, output",
+    [
+        ({"a": [1, 2]}, {"a": [1, 2]}, True),
+        ({"a": [1, 2]}, {"a": [1, 3]}, False),
+        ([1], (1,), False),
+        (1, 1.0, False),
+    ],
+)
+def test_output(expected, actual, output):
+    """Test is_equal returns a bool indicating if expected and actual are equal."""
+
+    result = eh.is_equal(expected, actual)
+
+    assert (
+        result is output
+    ), f"Unexpected output from is_equal -\n  Expected: {output}\n  Actual: {result}"
@@ -0,0 +1,54 @@
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.fixture
+def example_frame():
+    """Factory for a pd.DataFrame of n_rows rows with int, float and str columns."""
+
+    def make_frame(n_rows=50):
+
+        return pd.DataFrame(
+            {
+                "id": np.arange(n_rows),
+                "a": np.arange(n_rows) * 0.5,
+                "b": [f"x{i % 7}" for i in range(n_rows)],
+            }
+        )
+
+    return make_frame
+
+
+@pytest.fixture
+def write_frame():
+    """Function to write a pd.DataFrame to a Parquet, JSON lines or (optionally compressed)
+    CSV file, by the suffix of path, with row groups of 8 rows for Parquet files.
+    """
+
+    def write(frame, path):
+
+        if path.suffix == ".parquet":
+
+            frame.to_parquet(path, index=False, row_group_size=8)
+
+        elif path.suffix == ".jsonl":
+
+            frame.to_json(path, orient="records", lines=True)
+
+        else:
+
+            frame.to_csv(path, index=False)
+
+        return path
+
+    return write
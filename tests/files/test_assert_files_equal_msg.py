@@ -0,0 +1,291 @@
+import inspect
+import re
+
+import pytest
+
+try:
+
+    import numpy as np
+    import test_aide.files as fh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+try:
+
+    import pyarrow  # noqa: F401
+
+    has_pyarrow = True
+
+except ModuleNotFoundError:
+
+    has_pyarrow = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_arguments():
+    """Test arguments for arguments of function."""
+
+    expected_arguments = [
+        "actual_path",
+        "expected_path",
+        "msg_tag",
+        "batch_rows",
+        "parallel",
+        "check_exact",
+        "rtol",
+        "atol",
+    ]
+
+    expected_default_values = (100_000, True, False, 1e-5, 1e-8)
+
+    arg_spec = inspect.getfullargspec(fh.assert_files_equal_msg)
+
+    assert (
+        arg_spec.args == expected_arguments
+    ), f"Unexpected arguments -\n  Expected: {expected_arguments}\n  Actual: {arg_spec.args}"
+
+    assert (
+        arg_spec.defaults == expected_default_values
+    ), f"Unexpected default values -\n  Expected: {expected_default_values}\n  Actual: {arg_spec.defaults}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("parallel", [True, False])
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ".csv.gz"])
+def test_equal_files(tmp_path, suffix, parallel, example_frame, write_frame):
+    """Test no error is raised for equal files read over several batches."""
+
+    frame = example_frame()
+
+    expected_path = write_frame(frame, tmp_path / f"expected{suffix}")
+    actual_path = write_frame(frame, tmp_path / f"actual{suffix}")
+
+    fh.assert_files_equal_msg(
+        actual_path, expected_path, "files", batch_rows=7, parallel=parallel
+    )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_dtypes_inferred_per_batch(tmp_path, example_frame, write_frame):
+    """Test int values are equal to the same float values, whether they are read as int or
+    float in each batch."""
+
+    expected = example_frame(10)
+    expected["id"] = expected["id"].astype("float64")
+    expected.loc[7, "id"] = np.nan
+
+    actual = expected.astype({"id": "Int64"})
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(actual, tmp_path / "actual.csv")
+
+    fh.assert_files_equal_msg(actual_path, expected_path, "files", batch_rows=3)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "suffix",
+    [
+        ".csv",
+        pytest.param(
+            ".parquet",
+            marks=pytest.mark.skipif(not has_pyarrow, reason="pyarrow not installed"),
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "expected_id, actual_id",
+    [(1_000_000, 1_000_005), (2**53, 2**53 + 1)],
+)
+def test_large_int_ids_compared_exactly(
+    tmp_path, suffix, expected_id, actual_id, example_frame, write_frame
+):
+    """Test int values are compared exactly, not with the tolerance for floats."""
+
+    expected = example_frame(10)
+    expected.loc[6, "id"] = expected_id
+
+    actual = expected.copy()
+    actual.loc[6, "id"] = actual_id
+
+    expected_path = write_frame(expected, tmp_path / f"expected{suffix}")
+    actual_path = write_frame(actual, tmp_path / f"actual{suffix}")
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape(
+            f"files - not equal at row 6\n  column id -\n    Expected: {expected_id}\n    Actual: {actual_id}"
+        ),
+    ):
+
+        fh.assert_files_equal_msg(actual_path, expected_path, "files", batch_rows=4)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_int_and_float_batches_compared_exactly(tmp_path, example_frame, write_frame):
+    """Test an int column read as float in one file only is still compared exactly."""
+
+    expected = example_frame(10).astype({"id": "float64"})
+    expected.loc[2, "id"] = np.nan
+    expected.loc[6, "id"] = 2**53
+
+    actual = expected.astype({"id": "Int64"})
+    actual.loc[6, "id"] = 2**53 + 1
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(actual, tmp_path / "actual.csv")
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape(
+            f"files - not equal at row 6\n  column id -\n    Expected: {2.0**53}\n    Actual: {2**53 + 1}"
+        ),
+    ):
+
+        fh.assert_files_equal_msg(actual_path, expected_path, "files", batch_rows=4)
+
+
+@pytest.mark.skipif(not has_pyarrow, reason="pyarrow not installed")
+def test_different_batch_sizes(tmp_path, example_frame, write_frame):
+    """Test files read in batches of different sizes (Parquet row groups and CSV chunks)
+    are compared row by row."""
+
+    frame = example_frame()
+
+    expected_path = write_frame(frame, tmp_path / "expected.parquet")
+    actual_path = write_frame(frame, tmp_path / "actual.csv")
+
+    fh.assert_files_equal_msg(actual_path, expected_path, "files", batch_rows=5)
+
+    frame.loc[33, "b"] = "y"
+
+    write_frame(frame, actual_path)
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape(
+            "files - not equal at row 33\n  column b -\n    Expected: x5\n    Actual: y"
+        ),
+    ):
+
+        fh.assert_files_equal_msg(actual_path, expected_path, "files", batch_rows=5)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_first_differing_row(tmp_path, example_frame, write_frame):
+    """Test the error gives the first row that differs and all the values that differ in it."""
+
+    expected = example_frame(30)
+
+    actual = expected.copy()
+    actual.loc[25, "a"] = 100.0
+    actual.loc[17, "b"] = "z"
+    actual.loc[17, "a"] = 0.0
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(actual, tmp_path / "actual.csv")
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        fh.assert_files_equal_msg(actual_path, expected_path, "files", batch_rows=4)
+
+    expected_message = (
+        "files - not equal at row 17\n"
+        "  column a -\n    Expected: 8.5\n    Actual: 0.0\n"
+        "  column b -\n    Expected: x3\n    Actual: z"
+    )
+
+    assert (
+        str(exc_info.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_tolerance(tmp_path, example_frame, write_frame):
+    """Test float values are compared with rtol unless check_exact is True."""
+
+    expected = example_frame(10)
+
+    actual = expected.copy()
+    actual.loc[4, "a"] = 2.0000001
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(actual, tmp_path / "actual.csv")
+
+    fh.assert_files_equal_msg(actual_path, expected_path, "files")
+
+    with pytest.raises(AssertionError, match="files - not equal at row 4"):
+
+        fh.assert_files_equal_msg(actual_path, expected_path, "files", check_exact=True)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "actual_rows, expected_rows, message",
+    [
+        (8, 10, "files - not equal at row 8, row missing from actual -\n  {'id': 8"),
+        (10, 8, "files - not equal at row 8, row not in expected -\n  {'id': 8"),
+    ],
+)
+def test_number_of_rows(
+    tmp_path, actual_rows, expected_rows, message, example_frame, write_frame
+):
+    """Test the first row in only one of the files is reported."""
+
+    expected_path = write_frame(example_frame(expected_rows), tmp_path / "expected.csv")
+    actual_path = write_frame(example_frame(actual_rows), tmp_path / "actual.csv")
+
+    with pytest.raises(AssertionError, match=re.escape(message)):
+
+        fh.assert_files_equal_msg(actual_path, expected_path, "files", batch_rows=3)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_columns_differ(tmp_path, example_frame, write_frame):
+    """Test an error is raised if the files do not have the same columns."""
+
+    expected = example_frame(5)
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(expected[["id", "a"]], tmp_path / "actual.csv")
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape(
+            "files - columns -\n  Expected: ['id', 'a', 'b']\n  Actual: ['id', 'a']"
+        ),
+    ):
+
+        fh.assert_files_equal_msg(actual_path, expected_path, "files")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "kwargs, exception, message",
+    [
+        (
+            {"expected_path": 1},
+            TypeError,
+            "expected_path should be a str or os.PathLike",
+        ),
+        ({"batch_rows": -1}, ValueError, "batch_rows should be a positive int"),
+        ({"parallel": 1}, TypeError, "parallel should be a bool"),
+    ],
+)
+def test_invalid_arguments(
+    tmp_path, kwargs, exception, message, example_frame, write_frame
+):
+    """Test errors raised for invalid arguments."""
+
+    expected_path = write_frame(example_frame(5), tmp_path / "expected.csv")
+
+    arguments = {"actual_path": expected_path, "expected_path": expected_path}
+    arguments.update(kwargs)
+
+    with pytest.raises(exception, match=message):
+
+        fh.assert_files_equal_msg(msg_tag="files", **arguments)
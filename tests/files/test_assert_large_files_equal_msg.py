@@ -0,0 +1,317 @@
+import inspect
+import re
+
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+    import test_aide.files as fh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+try:
+
+    import pyarrow  # noqa: F401
+
+    has_pyarrow = True
+
+except ModuleNotFoundError:
+
+    has_pyarrow = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_arguments():
+    """Test arguments for arguments of function."""
+
+    expected_arguments = [
+        "actual_path",
+        "expected_path",
+        "msg_tag",
+        "keys",
+        "batch_rows",
+        "n_partitions",
+        "temp_dir",
+        "check_exact",
+        "rtol",
+        "atol",
+        "column_rules",
+        "max_rows_shown",
+    ]
+
+    expected_default_values = (None, 100_000, 64, None, False, 1e-5, 1e-8, None, 10)
+
+    arg_spec = inspect.getfullargspec(fh.assert_large_files_equal_msg)
+
+    assert (
+        arg_spec.args == expected_arguments
+    ), f"Unexpected arguments -\n  Expected: {expected_arguments}\n  Actual: {arg_spec.args}"
+
+    assert (
+        arg_spec.defaults == expected_default_values
+    ), f"Unexpected default values -\n  Expected: {expected_default_values}\n  Actual: {arg_spec.defaults}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("keys", [None, "id", ["id", "b"]])
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ".csv.gz"])
+def test_equal_files_in_any_order(tmp_path, keys, suffix, example_frame, write_frame):
+    """Test no error is raised for files with the same rows in a different order, read
+    over several batches and partitions."""
+
+    frame = example_frame()
+
+    expected_path = write_frame(frame, tmp_path / f"expected{suffix}")
+    actual_path = write_frame(
+        frame.sample(frac=1, random_state=0), tmp_path / f"actual{suffix}"
+    )
+
+    fh.assert_large_files_equal_msg(
+        actual_path, expected_path, "files", keys=keys, batch_rows=7, n_partitions=4
+    )
+
+
+@pytest.mark.skipif(not has_pyarrow, reason="pyarrow not installed")
+def test_equal_parquet_and_csv_files(tmp_path, example_frame, write_frame):
+    """Test a Parquet file can be compared to a CSV file, with ints read as floats."""
+
+    frame = example_frame()
+    frame.loc[3, "a"] = np.nan
+
+    expected_path = write_frame(frame, tmp_path / "expected.parquet")
+    actual_path = write_frame(frame, tmp_path / "actual.csv")
+
+    fh.assert_large_files_equal_msg(
+        actual_path, expected_path, "files", keys="id", batch_rows=10, n_partitions=3
+    )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_keyed_differences(tmp_path, example_frame, write_frame):
+    """Test the differences in each partition are reported when keys are given."""
+
+    expected = example_frame(6)
+
+    actual = expected.drop(index=[4]).copy()
+    actual.loc[1, "a"] = 9.0
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(actual, tmp_path / "actual.csv")
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        fh.assert_large_files_equal_msg(
+            actual_path, expected_path, "files", keys="id", n_partitions=1
+        )
+
+    expected_message = (
+        "files - not equal on keys ['id']\n"
+        "  partition 0 -\n"
+        "    1 rows missing from actual, keys: 4\n"
+        "    column a: 1 of 5 matched rows changed\n"
+        "        1: expected 0.5, actual 9.0"
+    )
+
+    assert (
+        str(exc_info.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_unordered_rows_differences(tmp_path, example_frame, write_frame):
+    """Test rows missing or extra are counted over all partitions when keys are not given."""
+
+    expected = example_frame(20)
+
+    actual = pd.concat([expected.iloc[2:], expected.iloc[[5]]])
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(actual, tmp_path / "actual.csv")
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        fh.assert_large_files_equal_msg(
+            actual_path,
+            expected_path,
+            "files",
+            batch_rows=3,
+            n_partitions=5,
+            max_rows_shown=1,
+        )
+
+    message = str(exc_info.value)
+
+    assert message.startswith(
+        "files - rows not equal\n  2 rows missing from actual, e.g.\n    {"
+    ), f"Unexpected start of error message: {message}"
+
+    assert re.search(
+        r"\n    \.\.\. and 1 more\n  1 rows not in expected, e\.g\.\n    \{'id': 5, 'a': 2\.5, 'b': 'x5'\}$",
+        message,
+    ), f"Unexpected end of error message: {message}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_columns_differ(tmp_path, example_frame, write_frame):
+    """Test an error is raised if the files do not have the same columns."""
+
+    expected = example_frame(5)
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(expected[["id", "b", "a"]], tmp_path / "actual.csv")
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape(
+            "files - columns -\n  Expected: ['id', 'a', 'b']\n  Actual: ['id', 'b', 'a']"
+        ),
+    ):
+
+        fh.assert_large_files_equal_msg(actual_path, expected_path, "files")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_temp_dir_removed(tmp_path, example_frame, write_frame):
+    """Test the spilled partitions are written to, and removed from, temp_dir."""
+
+    expected_path = write_frame(example_frame(), tmp_path / "expected.csv")
+
+    temp_dir = tmp_path / "spill"
+    temp_dir.mkdir()
+
+    fh.assert_large_files_equal_msg(
+        expected_path, expected_path, "files", temp_dir=temp_dir
+    )
+
+    assert list(temp_dir.iterdir()) == [], "spilled partitions not removed"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "kwargs, exception, message",
+    [
+        ({"actual_path": 1}, TypeError, "actual_path should be a str or os.PathLike"),
+        ({"batch_rows": 0}, ValueError, "batch_rows should be a positive int"),
+        ({"n_partitions": 1.5}, ValueError, "n_partitions should be a positive int"),
+        ({"keys": "z"}, ValueError, "keys ['z'] not in columns of"),
+        (
+            {"actual_path": "actual.txt"},
+            ValueError,
+            "unsupported file type for actual.txt",
+        ),
+    ],
+)
+def test_invalid_arguments(
+    tmp_path, kwargs, exception, message, example_frame, write_frame
+):
+    """Test errors raised for invalid arguments."""
+
+    expected_path = write_frame(example_frame(5), tmp_path / "expected.csv")
+
+    arguments = {"actual_path": expected_path, "expected_path": expected_path}
+    arguments.update(kwargs)
+
+    with pytest.raises(exception, match=re.escape(message)):
+
+        fh.assert_large_files_equal_msg(msg_tag="files", **arguments)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("keys", [None, "id"])
+def test_nested_json_values(tmp_path, keys, write_frame):
+    """Test JSON lines files with lists and dicts in columns are compared."""
+
+    expected = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "tags": [["a"], ["b", "c"], []],
+            "meta": [{"x": 1, "y": 2}, {"y": 2}, None],
+        }
+    )
+
+    actual = expected.copy()
+    actual.at[1, "tags"] = ["b", "d"]
+
+    expected_path = write_frame(expected, tmp_path / "expected.jsonl")
+    actual_path = write_frame(actual, tmp_path / "actual.jsonl")
+
+    fh.assert_large_files_equal_msg(expected_path, expected_path, "files", keys=keys)
+
+    with pytest.raises(AssertionError, match=re.escape("['b', 'c']")):
+
+        fh.assert_large_files_equal_msg(actual_path, expected_path, "files", keys=keys)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_unhashable_values_error():
+    """Test an error naming the column is raised for values that cannot be hashed."""
+
+    frame = pd.DataFrame({"id": [1, 2], "v": [{1, 2}, {3}]})
+
+    with pytest.raises(ValueError, match="values in column v cannot be hashed"):
+
+        fh._row_hashes(frame, None)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "suffix",
+    [
+        ".csv",
+        pytest.param(
+            ".parquet",
+            marks=pytest.mark.skipif(not has_pyarrow, reason="pyarrow not installed"),
+        ),
+    ],
+)
+def test_rows_compared_by_value(tmp_path, suffix, example_frame, write_frame):
+    """Test rows are compared exactly by value, not by a hash of their values as floats."""
+
+    expected = example_frame(10)
+    expected.loc[6, "id"] = 2**53
+
+    actual = expected.copy()
+    actual.loc[6, "id"] = 2**53 + 1
+
+    expected_path = write_frame(expected, tmp_path / f"expected{suffix}")
+    actual_path = write_frame(actual, tmp_path / f"actual{suffix}")
+
+    fh.assert_large_files_equal_msg(expected_path, expected_path, "files", batch_rows=3)
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        fh.assert_large_files_equal_msg(
+            actual_path, expected_path, "files", batch_rows=3, n_partitions=4
+        )
+
+    expected_message = (
+        "files - rows not equal\n"
+        f"  1 rows missing from actual, e.g.\n    {{'id': {2**53}, 'a': 3.0, 'b': 'x6'}}\n"
+        f"  1 rows not in expected, e.g.\n    {{'id': {2**53 + 1}, 'a': 3.0, 'b': 'x6'}}"
+    )
+
+    assert (
+        str(exc_info.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_int_and_float_rows_equal(tmp_path, example_frame, write_frame):
+    """Test int values are equal to the same float values, in a column read as float in one
+    file only."""
+
+    expected = example_frame(10).astype({"id": "float64"})
+    expected.loc[2, "id"] = np.nan
+
+    actual = expected.astype({"id": "Int64"})
+
+    expected_path = write_frame(expected, tmp_path / "expected.csv")
+    actual_path = write_frame(actual, tmp_path / "actual.csv")
+
+    fh.assert_large_files_equal_msg(actual_path, expected_path, "files", batch_rows=3)
@@ -0,0 +1,151 @@
+import inspect
+
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+    import test_aide.files as fh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+def _write_run(directory, array=(1, 2, 3)):
+    """Write a directory of pipeline output with nested partitions."""
+
+    (directory / "part=1").mkdir(parents=True)
+
+    pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]}).to_csv(
+        directory / "part=1" / "data.csv", index=False
+    )
+
+    np.save(directory / "array.npy", np.array(array))
+
+    (directory / "_SUCCESS").write_text("")
+
+    return directory
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_arguments():
+    """Test arguments for arguments of function."""
+
+    expected_arguments = ["actual_dir", "expected_dir", "processes"]
+
+    expected_default_values = (None,)
+
+    arg_spec = inspect.getfullargspec(fh.compare_directories)
+
+    assert (
+        arg_spec.args == expected_arguments
+    ), f"Unexpected arguments -\n  Expected: {expected_arguments}\n  Actual: {arg_spec.args}"
+
+    assert (
+        arg_spec.defaults == expected_default_values
+    ), f"Unexpected default values -\n  Expected: {expected_default_values}\n  Actual: {arg_spec.defaults}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("processes", [1, 2])
+def test_identical_directories(tmp_path, processes):
+    """Test all files are identical when the directories have the same content."""
+
+    actual_dir = _write_run(tmp_path / "actual")
+    expected_dir = _write_run(tmp_path / "expected")
+
+    results = sorted(fh.compare_directories(actual_dir, expected_dir, processes))
+
+    expected_results = [
+        ("_SUCCESS", "identical", None),
+        ("array.npy", "identical", None),
+        ("part=1/data.csv", "identical", None),
+    ]
+
+    assert (
+        results == expected_results
+    ), f"Unexpected results -\n  Expected: {expected_results}\n  Actual: {results}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("processes", [1, 2])
+def test_differences(tmp_path, processes):
+    """Test the status of files that are equal, different, missing or extra."""
+
+    actual_dir = _write_run(tmp_path / "actual", array=(1, 2, 4))
+    expected_dir = _write_run(tmp_path / "expected")
+
+    # same data written differently
+    (actual_dir / "part=1" / "data.csv").write_text("a,b\n1,1.00\n2,2.0\n")
+
+    (actual_dir / "_SUCCESS").unlink()
+    (actual_dir / "notes.txt").write_text("extra")
+
+    results = {
+        path: (status, message)
+        for path, status, message in fh.compare_directories(
+            actual_dir, expected_dir, processes
+        )
+    }
+
+    statuses = {path: status for path, (status, _) in results.items()}
+
+    expected_statuses = {
+        "_SUCCESS": "missing",
+        "notes.txt": "extra",
+        "array.npy": "different",
+        "part=1/data.csv": "equal",
+    }
+
+    assert (
+        statuses == expected_statuses
+    ), f"Unexpected statuses -\n  Expected: {expected_statuses}\n  Actual: {statuses}"
+
+    assert results["array.npy"][1].startswith(
+        "array.npy"
+    ), f"Unexpected message for array.npy: {results['array.npy'][1]}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_unreadable_file_error(tmp_path):
+    """Test files that cannot be read are given an error status."""
+
+    (tmp_path / "actual").mkdir()
+    (tmp_path / "expected").mkdir()
+
+    (tmp_path / "actual" / "data.npy").write_bytes(b"not an array")
+    (tmp_path / "expected" / "data.npy").write_bytes(b"not an array either")
+
+    [(path, status, message)] = fh.compare_directories(
+        tmp_path / "actual", tmp_path / "expected"
+    )
+
+    assert (path, status) == (
+        "data.npy",
+        "error",
+    ), f"Unexpected result: {(path, status, message)}"
+
+    assert message.startswith("ValueError"), f"Unexpected error message: {message}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"actual_dir": "not_a_dir"}, "actual_dir should be a directory"),
+        ({"processes": 0}, "processes should be a positive int or None"),
+    ],
+)
+def test_invalid_arguments(tmp_path, kwargs, message):
+    """Test errors raised for invalid arguments."""
+
+    arguments = {"actual_dir": tmp_path, "expected_dir": tmp_path}
+    arguments.update(kwargs)
+
+    with pytest.raises(ValueError, match=message):
+
+        list(fh.compare_directories(**arguments))
@@ -0,0 +1,95 @@
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.fixture
+def mixed_frame():
+    """Factory for a two row pd.DataFrame with float, str, int, Int64 and categorical
+    columns, with a missing value in each column that can hold one.
+    """
+
+    def make_frame():
+
+        return pd.DataFrame(
+            {
+                "a": [1.0, np.nan],
+                "b": ["x", None],
+                "c": [1, 2],
+                "d": pd.array([1, None], dtype="Int64"),
+                "e": pd.Categorical(["u", "v"]),
+            }
+        )
+
+    return make_frame
+
+
+@pytest.fixture
+def keyed_frame():
+    """Factory for a four row pd.DataFrame with key columns id and group and float, str
+    and Int64 value columns with missing values.
+    """
+
+    def make_frame():
+
+        return pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4],
+                "group": ["p", "p", "q", "q"],
+                "a": [1.0, 2.0, np.nan, 4.0],
+                "b": ["w", "x", None, "z"],
+                "c": pd.array([1, None, 3, 4], dtype="Int64"),
+            }
+        )
+
+    return make_frame
+
+
+@pytest.fixture
+def labelled_frame():
+    """Factory for a three row pd.DataFrame with int, float, datetime and str columns
+    and a str index.
+    """
+
+    def make_frame():
+
+        return pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "p": [0.25, 0.5, np.nan],
+                "when": pd.to_datetime(["2020-01-01", "2020-01-02", None]),
+                "note": ["x", "y", "z"],
+            },
+            index=["i", "j", "k"],
+        )
+
+    return make_frame
+
+
+@pytest.fixture
+def ranged_frame():
+    """Factory for a pd.DataFrame of n_rows rows with int, float and str columns and
+    index r0, r1, ...
+    """
+
+    def make_frame(n_rows=10):
+
+        return pd.DataFrame(
+            {
+                "a": range(n_rows),
+                "b": [float(i) for i in range(n_rows)],
+                "c": ["x"] * n_rows,
+            },
+            index=[f"r{i}" for i in range(n_rows)],
+        )
+
+    return make_frame
@@ -0,0 +1,54 @@
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+    import test_aide.frames as frh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("private_column_array", [True, False])
+def test_column_arrays(monkeypatch, private_column_array):
+    """Test the values of each column are returned as numpy arrays for numpy dtypes and
+    pandas extension arrays otherwise, whether or not pandas has the private
+    DataFrame._get_column_array.
+    """
+
+    if not private_column_array:
+
+        monkeypatch.delattr(pd.DataFrame, "_get_column_array", raising=False)
+
+    frame = pd.DataFrame(
+        {
+            "a": [1.0, np.nan],
+            "b": ["x", None],
+            "c": pd.array([1, None], dtype="Int64"),
+            "d": pd.Categorical(["u", "v"]),
+        }
+    )
+
+    arrays = frh._column_arrays(frame)
+
+    expected_types = [np.ndarray, np.ndarray, pd.arrays.IntegerArray, pd.Categorical]
+    actual_types = list(map(type, arrays))
+
+    assert (
+        actual_types == expected_types
+    ), f"Unexpected types -\n  Expected: {expected_types}\n  Actual: {actual_types}"
+
+    for (_, values), array in zip(frame.items(), arrays):
+
+        if isinstance(array, np.ndarray):
+
+            np.testing.assert_array_equal(array, values.to_numpy())
+
+        else:
+
+            pd.testing.assert_extension_array_equal(array, values.array)
@@ -0,0 +1,167 @@
+import inspect
+
+import pytest
+
+try:
+
+    import pandas as pd
+    import test_aide.frames as frh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_arguments():
+    """Test arguments for arguments of function."""
+
+    expected_arguments = [
+        "actual",
+        "expected",
+        "msg_tag",
+        "column_rules",
+        "check_exact",
+        "rtol",
+        "atol",
+        "max_rows_shown",
+    ]
+
+    expected_default_values = (False, 1e-5, 1e-8, 10)
+
+    arg_spec = inspect.getfullargspec(frh.assert_frame_equal_by_column_msg)
+
+    assert (
+        arg_spec.args == expected_arguments
+    ), f"Unexpected arguments -\n  Expected: {expected_arguments}\n  Actual: {arg_spec.args}"
+
+    assert (
+        arg_spec.defaults == expected_default_values
+    ), f"Unexpected default values -\n  Expected: {expected_default_values}\n  Actual: {arg_spec.defaults}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "column_rules, error, message",
+    [
+        ([], TypeError, "column_rules should be a dict or None but got <class 'list'>"),
+        (
+            {"x": {}},
+            ValueError,
+            "column_rules given for columns \\['x'\\] that are not compared",
+        ),
+        (
+            {"p": 1},
+            TypeError,
+            "rule for column p should be a dict but got <class 'int'>",
+        ),
+        (
+            {"p": {"tol": 1}},
+            ValueError,
+            "unexpected keys \\['tol'\\] in rule for column p",
+        ),
+        (
+            {"p": {"tolerance": "1s"}},
+            ValueError,
+            "tolerance in rule for column p can only be used with datetime or timedelta columns",
+        ),
+    ],
+)
+def test_column_rules_errors(column_rules, error, message, labelled_frame):
+    """Test an exception is raised if column_rules are not valid."""
+
+    with pytest.raises(error, match=message):
+
+        frh.assert_frame_equal_by_column_msg(
+            labelled_frame(), labelled_frame(), "a", column_rules
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_rules_applied(labelled_frame):
+    """Test each column is compared according to its rule."""
+
+    expected = labelled_frame()
+
+    actual = expected.assign(
+        p=expected["p"] + 0.001,
+        when=expected["when"] + pd.Timedelta("30s"),
+        note="changed",
+    )
+
+    column_rules = {
+        "id": {"exact": True},
+        "p": {"atol": 0.01},
+        "when": {"tolerance": "1min"},
+        "note": {"ignore": True},
+    }
+
+    frh.assert_frame_equal_by_column_msg(actual, expected, "a", column_rules)
+
+    message = (
+        "a - not equal\n"
+        "  column p: 2 of 3 rows changed\n"
+        "    i: expected 0.25, actual 0.251\n"
+        "    ... and 1 more\n"
+        "  column when: 2 of 3 rows changed\n"
+        "    i: expected 2020-01-01 00:00:00, actual 2020-01-01 00:00:30\n"
+        "    ... and 1 more"
+    )
+
+    column_rules["p"] = {"exact": True}
+    column_rules["when"] = {"tolerance": "10s"}
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        frh.assert_frame_equal_by_column_msg(
+            actual, expected, "a", column_rules, max_rows_shown=1
+        )
+
+    assert (
+        str(exc_info.value) == message
+    ), f"Unexpected error message -\n  Expected: {message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_structure_differences(labelled_frame):
+    """Test differences in index, columns and dtypes are reported."""
+
+    expected = labelled_frame()
+
+    actual = expected.drop(columns="note").assign(id=[1.0, 2.0, 3.0], extra=1)
+    actual.index = ["i", "x", "k"]
+
+    message = (
+        "a - not equal\n"
+        "  index: 1 of 3 labels changed\n"
+        "    position 1: expected j, actual x\n"
+        "  columns missing from actual: ['note']\n"
+        "  columns not in expected: ['extra']\n"
+        "  column id dtype -\n"
+        "    Expected: int64\n"
+        "    Actual: float64"
+    )
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        frh.assert_frame_equal_by_column_msg(actual, expected, "a", None)
+
+    assert (
+        str(exc_info.value) == message
+    ), f"Unexpected error message -\n  Expected: {message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_number_of_rows(labelled_frame):
+    """Test a difference in the number of rows is reported."""
+
+    expected = labelled_frame()
+
+    with pytest.raises(
+        AssertionError,
+        match="a - not equal\n  number of rows -\n    Expected: 3\n    Actual: 2",
+    ):
+
+        frh.assert_frame_equal_by_column_msg(expected.iloc[:2], expected, "a", {})
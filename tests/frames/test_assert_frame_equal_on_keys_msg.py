@@ -0,0 +1,185 @@
+import inspect
+
+import pytest
+
+try:
+
+    import pandas as pd
+    import test_aide.frames as frh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_arguments():
+    """Test arguments for arguments of function."""
+
+    expected_arguments = [
+        "actual",
+        "expected",
+        "msg_tag",
+        "keys",
+        "check_exact",
+        "rtol",
+        "atol",
+        "max_rows_shown",
+        "column_rules",
+    ]
+
+    expected_default_values = (False, 1e-5, 1e-8, 10, None)
+
+    arg_spec = inspect.getfullargspec(frh.assert_frame_equal_on_keys_msg)
+
+    assert (
+        arg_spec.args == expected_arguments
+    ), f"Unexpected arguments -\n  Expected: {expected_arguments}\n  Actual: {arg_spec.args}"
+
+    assert (
+        arg_spec.defaults == expected_default_values
+    ), f"Unexpected default values -\n  Expected: {expected_default_values}\n  Actual: {arg_spec.defaults}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "actual, keys, error, message",
+    [
+        (1, "id", TypeError, "actual should be of type pd.DataFrame"),
+        (None, 1, TypeError, "keys should be a str or list of str but got 1"),
+        (None, [], ValueError, "keys should contain at least one column"),
+        (None, ["id", "d"], ValueError, "keys \\['d'\\] not in expected columns"),
+        (None, "b", ValueError, "keys should uniquely identify the rows of expected"),
+    ],
+)
+def test_argument_errors(actual, keys, error, message, keyed_frame):
+    """Test an exception is raised for invalid arguments."""
+
+    expected = keyed_frame()
+
+    if keys == "b":
+
+        expected.loc[1, "b"] = "w"
+
+    with pytest.raises(error, match=message):
+
+        frh.assert_frame_equal_on_keys_msg(
+            keyed_frame() if actual is None else actual, expected, "a", keys
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("keys", ["id", ["id"], ["group", "id"]])
+def test_reordered_rows_equal(keys, keyed_frame):
+    """Test DataFrames with the same rows in different orders, and different indexes, are equal."""
+
+    expected = keyed_frame()
+    actual = expected.iloc[[2, 0, 3, 1]].reset_index(drop=True)
+
+    frh.assert_frame_equal_on_keys_msg(actual, expected, "a", keys)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_row_differences(keyed_frame):
+    """Test missing, extra and duplicated rows and changed values are reported."""
+
+    expected = keyed_frame()
+
+    actual = pd.concat(
+        [expected.iloc[[3, 2, 1]], expected.iloc[[1]].assign(id=7)],
+        ignore_index=True,
+    )
+    actual.loc[0, "a"] = 4.5
+    actual.loc[2, "b"] = "y"
+    actual = pd.concat([actual, actual.iloc[[3]]], ignore_index=True)
+
+    message = (
+        "a - not equal on keys ['id']\n"
+        "  1 rows missing from actual, keys: 1\n"
+        "  2 rows not in expected, keys: 7, 7\n"
+        "  1 duplicated keys in actual, keys: 7\n"
+        "  column a: 1 of 3 matched rows changed\n"
+        "    4: expected 4.0, actual 4.5\n"
+        "  column b: 1 of 3 matched rows changed\n"
+        "    2: expected x, actual y"
+    )
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        frh.assert_frame_equal_on_keys_msg(actual, expected, "a", "id")
+
+    assert (
+        str(exc_info.value) == message
+    ), f"Unexpected error message -\n  Expected: {message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_column_differences(keyed_frame):
+    """Test missing, extra and different dtype columns are reported, with multiple keys shown as tuples."""
+
+    expected = keyed_frame()
+
+    actual = expected.drop(columns="c").assign(d=1, b=expected["b"].astype("category"))
+    actual.loc[0, "a"] = 0.0
+
+    message = (
+        "a - not equal on keys ['group', 'id']\n"
+        "  columns missing from actual: ['c']\n"
+        "  columns not in expected: ['d']\n"
+        "  column a: 1 of 4 matched rows changed\n"
+        "    ('p', 1): expected 1.0, actual 0.0\n"
+        "  column b dtype -\n"
+        "    Expected: object\n"
+        "    Actual: category"
+    )
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        frh.assert_frame_equal_on_keys_msg(actual, expected, "a", ["group", "id"])
+
+    assert (
+        str(exc_info.value) == message
+    ), f"Unexpected error message -\n  Expected: {message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_tolerance_and_max_rows_shown():
+    """Test floats are compared with rtol and atol unless check_exact and the changed rows shown are limited."""
+
+    expected = pd.DataFrame({"id": range(5), "a": [1.0] * 5})
+    actual = pd.DataFrame({"id": range(5), "a": [1.0 + 1e-9] * 5})
+
+    frh.assert_frame_equal_on_keys_msg(actual, expected, "a", "id")
+
+    with pytest.raises(
+        AssertionError,
+        match="column a: 5 of 5 matched rows changed\n    0: expected 1.0, actual 1.000000001\n    ... and 4 more$",
+    ):
+
+        frh.assert_frame_equal_on_keys_msg(
+            actual, expected, "a", "id", check_exact=True, max_rows_shown=1
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_column_rules(keyed_frame):
+    """Test column_rules override check_exact, rtol and atol for particular columns."""
+
+    expected = keyed_frame()
+    actual = expected.iloc[::-1].assign(a=expected["a"] + 0.01, b="v")
+
+    frh.assert_frame_equal_on_keys_msg(
+        actual,
+        expected,
+        "a",
+        "id",
+        column_rules={"a": {"atol": 0.1}, "b": {"ignore": True}},
+    )
+
+    with pytest.raises(AssertionError, match="column a: 3 of 4 matched rows changed"):
+
+        frh.assert_frame_equal_on_keys_msg(
+            actual, expected, "a", "id", column_rules={"b": {"ignore": True}}
+        )
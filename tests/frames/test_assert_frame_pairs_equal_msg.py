@@ -0,0 +1,170 @@
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+    import test_aide.frames as frh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "pairs, error, message",
+    [
+        (None, TypeError, "pairs should be a list or tuple but got <class 'NoneType'>"),
+        ([], ValueError, "pairs should contain at least one pair"),
+        (
+            [(1, 2)],
+            TypeError,
+            "each item in pairs should be a (actual, expected) pair of pd.DataFrames but got <class 'tuple'> at index 0",
+        ),
+        (
+            None if not has_pandas else [pd.DataFrame()],
+            TypeError,
+            "each item in pairs should be a (actual, expected) pair of pd.DataFrames but got <class 'pandas.core.frame.DataFrame'> at index 0",
+        ),
+    ],
+)
+def test_pairs_errors(pairs, error, message):
+    """Test an exception is raised if pairs is not a non-empty list of pairs of DataFrames."""
+
+    with pytest.raises(error, match=message.replace("(", r"\(").replace(")", r"\)")):
+
+        frh.assert_frame_pairs_equal_msg(pairs, "test_msg")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_expected_schema_error(mixed_frame):
+    """Test a ValueError is raised if the expected DataFrames do not have the same dtypes."""
+
+    df = mixed_frame()
+
+    with pytest.raises(
+        ValueError,
+        match="expected DataFrames should all have the same columns and dtypes, but pair 1 differs from pair 0",
+    ):
+
+        frh.assert_frame_pairs_equal_msg(
+            [(df, df), (df, df.astype({"c": "float64"}))], "test_msg"
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_equal_pairs_pass(mixed_frame):
+    """Test no error is raised when all pairs are equal, including missing values and
+    float values within tolerance.
+    """
+
+    df = mixed_frame()
+
+    pairs = [(df.copy(), df.copy()) for _ in range(5)] + [
+        (df.assign(a=[1.0 + 1e-9, np.nan]), df.copy())
+    ]
+
+    frh.assert_frame_pairs_equal_msg(pairs, "test_msg")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_check_exact(mixed_frame):
+    """Test float values within tolerance are not equal when check_exact is True."""
+
+    df = mixed_frame()
+
+    with pytest.raises(
+        AssertionError, match="test_msg - 1 of 1 pairs not equal\n  pair 0: column a"
+    ):
+
+        frh.assert_frame_pairs_equal_msg(
+            [(df.assign(a=[1.0 + 1e-9, np.nan]), df)], "test_msg", check_exact=True
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("private_column_array", [True, False])
+def test_unequal_pairs_message(monkeypatch, private_column_array, mixed_frame):
+    """Test the error message reports the unequal pairs and what differs in each, whether
+    or not pandas has the private DataFrame._get_column_array.
+    """
+
+    if not private_column_array:
+
+        monkeypatch.delattr(pd.DataFrame, "_get_column_array", raising=False)
+
+    df = mixed_frame()
+
+    pairs = [(df.copy(), df.copy()) for _ in range(6)]
+
+    pairs[1] = (df.assign(a=[2.0, np.nan]), df)
+    pairs[2] = (df.assign(c=[1, 3], d=pd.array([1, 1], dtype="Int64")), df)
+    pairs[3] = (df.iloc[:1], df)
+    pairs[4] = (df.set_axis([0, 5]), df)
+    pairs[5] = (df.assign(c=[1.0, 2.0]), df)
+
+    with pytest.raises(AssertionError) as err:
+
+        frh.assert_frame_pairs_equal_msg(pairs, "test_msg")
+
+    expected_message = (
+        "test_msg - 5 of 6 pairs not equal"
+        "\n  pair 1: column a"
+        "\n  pair 2: column c, column d"
+        "\n  pair 3: number of rows -\n    Expected: 2\n    Actual: 1"
+        "\n  pair 4: index"
+        f"\n  pair 5: dtypes -\n    Expected: {list(df.dtypes)}\n    Actual: {list(df.assign(c=[1.0, 2.0]).dtypes)}"
+    )
+
+    assert (
+        str(err.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {err.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_max_pairs_shown(mixed_frame):
+    """Test only max_pairs_shown unequal pairs are described in the error message."""
+
+    df = mixed_frame()
+
+    pairs = [(df.assign(c=[0, 0]), df) for _ in range(4)]
+
+    with pytest.raises(AssertionError) as err:
+
+        frh.assert_frame_pairs_equal_msg(pairs, "test_msg", max_pairs_shown=2)
+
+    expected_message = (
+        "test_msg - 4 of 4 pairs not equal"
+        "\n  pair 0: column c"
+        "\n  pair 1: column c"
+        "\n  ... and 2 more"
+    )
+
+    assert (
+        str(err.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {err.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_index_dtype_compared(mixed_frame):
+    """Test pairs with equal index values of different dtypes are not equal."""
+
+    df = mixed_frame()
+
+    pairs = [(df.copy(), df), (df.set_axis([0.0, 1.0]), df)]
+
+    with pytest.raises(AssertionError) as err:
+
+        frh.assert_frame_pairs_equal_msg(pairs, "test_msg")
+
+    expected_message = (
+        "test_msg - 1 of 2 pairs not equal"
+        "\n  pair 1: index dtype -\n    Expected: int64\n    Actual: float64"
+    )
+
+    assert (
+        str(err.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {err.value}"
@@ -0,0 +1,135 @@
+import json
+
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+    import test_aide.frames as frh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+def _sample(seed, n=10_000):
+
+    rng = np.random.default_rng(seed)
+
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=n),
+            "s": rng.choice(["u", "v", "w"], size=n, p=[0.6, 0.3, 0.1]),
+        }
+    )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_argument_errors():
+    """Test an exception is raised for invalid arguments."""
+
+    with pytest.raises(TypeError, match="expected_profile should be a profile dict"):
+
+        frh.assert_frame_profile_msg(_sample(0), {}, "a")
+
+    with pytest.raises(ValueError, match="standard_errors should be None or a non"):
+
+        frh.assert_frame_profile_msg(
+            _sample(0), frh.frame_profile(_sample(0)), "a", standard_errors=-1
+        )
+
+    with pytest.raises(ValueError, match="unexpected statistics \\['median'\\]"):
+
+        frh.assert_frame_profile_msg(
+            _sample(0), frh.frame_profile(_sample(0)), "a", statistics=["median"]
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_equivalent_sample_passes():
+    """Test a different sample from the same distribution matches a stored profile."""
+
+    profile = json.loads(json.dumps(frh.frame_profile(_sample(0), histogram_bins=5)))
+
+    frh.assert_frame_profile_msg(_sample(1), profile, "a")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+def test_equivalent_skewed_samples_pass(seed):
+    """Test samples from the same skewed and discrete distributions match with the
+    default tolerances, where statistics near 0 (e.g. the mean of a symmetric
+    distribution) cannot be compared with a relative tolerance."""
+
+    def sample(seed):
+
+        rng = np.random.default_rng(seed)
+
+        return pd.DataFrame(
+            {
+                "x": rng.normal(size=10_000),
+                "e": rng.exponential(size=10_000),
+                "i": rng.poisson(3, size=10_000),
+            }
+        )
+
+    profile = frh.frame_profile(sample(0), histogram_bins=10)
+
+    frh.assert_frame_profile_msg(sample(seed), profile, "a")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_shifted_sample_fails():
+    """Test a sample from a shifted distribution does not match, and that only rtol and
+    atol are used if standard_errors is None."""
+
+    profile = frh.frame_profile(_sample(0)[["x"]], quantiles=(0.5,))
+
+    with pytest.raises(AssertionError, match="column x mean -"):
+
+        frh.assert_frame_profile_msg(
+            _sample(1)[["x"]].assign(x=lambda frame: frame["x"] + 0.1), profile, "a"
+        )
+
+    with pytest.raises(AssertionError, match="column x mean -"):
+
+        frh.assert_frame_profile_msg(
+            _sample(1)[["x"]], profile, "a", standard_errors=None
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_differences_reported():
+    """Test each statistic that differs is reported."""
+
+    expected = _sample(0)
+
+    profile = frh.frame_profile(expected, quantiles=(0.5,))
+
+    actual = expected.assign(x=expected["x"] + 1, s=expected["s"].replace("w", "u"))
+    actual = actual.rename(columns={"s": "z"}).assign(s=actual["s"])
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        frh.assert_frame_profile_msg(
+            actual, profile, "a", statistics=["mean", "frequencies"]
+        )
+
+    message = str(exc_info.value)
+
+    for expected_line in [
+        "a - profile not equal\n  columns -\n    Expected: ['x', 's']\n    Actual: ['x', 'z', 's']",
+        "  column x mean -",
+        "  column s frequency w -\n    Expected: ",
+    ]:
+
+        assert (
+            expected_line in message
+        ), f"Expected line not in error message -\n  Expected: {expected_line}\n  Actual: {message}"
+
+    assert (
+        "quantile" not in message
+    ), f"Unexpected statistic compared -\n  Actual: {message}"
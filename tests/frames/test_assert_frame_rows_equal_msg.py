@@ -0,0 +1,162 @@
+import inspect
+
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+    import test_aide.frames as frh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_arguments():
+    """Test arguments for arguments of function."""
+
+    expected_arguments = ["actual", "expected", "msg_tag", "max_ranges_shown"]
+
+    expected_default_values = (10,)
+
+    arg_spec = inspect.getfullargspec(frh.assert_frame_rows_equal_msg)
+
+    assert (
+        arg_spec.args == expected_arguments
+    ), f"Unexpected arguments -\n  Expected: {expected_arguments}\n  Actual: {arg_spec.args}"
+
+    assert (
+        arg_spec.defaults == expected_default_values
+    ), f"Unexpected default values -\n  Expected: {expected_default_values}\n  Actual: {arg_spec.defaults}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_equal_rows_different_index(ranged_frame):
+    """Test DataFrames with equal rows, including missing values, are equal whatever their index."""
+
+    expected = ranged_frame()
+    expected.loc["r3", "b"] = np.nan
+
+    frh.assert_frame_rows_equal_msg(expected.reset_index(drop=True), expected, "a")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_differences_reported(ranged_frame):
+    """Test inserted, deleted and modified rows are reported as ranges."""
+
+    expected = ranged_frame()
+
+    actual = pd.concat(
+        [
+            expected.iloc[:2],
+            pd.DataFrame({"a": [-1], "b": [-1.0], "c": ["new"]}, index=["n"]),
+            expected.iloc[2:6],
+            expected.iloc[8:],
+        ]
+    )
+    actual.loc["r9", "b"] = 90.0
+
+    message = (
+        "a - rows not equal, 3 differences\n"
+        "  inserted actual row 2 (index n)\n"
+        "  deleted expected rows 6 to 7 (index r6 to r7)\n"
+        "  modified expected row 9 (index r9) to actual row 8 (index r9), columns ['b']"
+    )
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        frh.assert_frame_rows_equal_msg(actual, expected, "a")
+
+    assert (
+        str(exc_info.value) == message
+    ), f"Unexpected error message -\n  Expected: {message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_equal_values_with_different_hashes(ranged_frame):
+    """Test rows equal by value are equal, whatever the hash of their values."""
+
+    expected = ranged_frame()
+    expected.loc["r2", "b"] = 0.0
+    expected["d"] = pd.Series([1] * 10, index=expected.index, dtype=object)
+
+    actual = expected.copy()
+    actual.loc["r2", "b"] = -0.0
+    actual["d"] = pd.Series([1.0] * 10, index=expected.index, dtype=object)
+
+    frh.assert_frame_rows_equal_msg(actual, expected, "a")
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_rows_with_equal_hashes_compared(mocker, ranged_frame):
+    """Test rows matched by the diff are compared by value, so a hash collision does not
+    hide a difference."""
+
+    mocker.patch.object(
+        pd.util,
+        "hash_pandas_object",
+        side_effect=lambda frame, index: pd.Series(
+            np.zeros(len(frame), dtype="uint64")
+        ),
+    )
+
+    expected = ranged_frame()
+
+    actual = expected.copy()
+    actual.loc[["r3", "r4"], "c"] = "y"
+    actual.loc["r7", "a"] = -1
+
+    message = (
+        "a - rows not equal, 2 differences\n"
+        "  modified expected rows 3 to 4 (index r3 to r4) to actual rows 3 to 4 (index r3 to r4), columns ['c']\n"
+        "  modified expected row 7 (index r7) to actual row 7 (index r7), columns ['a']"
+    )
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        frh.assert_frame_rows_equal_msg(actual, expected, "a")
+
+    assert (
+        str(exc_info.value) == message
+    ), f"Unexpected error message -\n  Expected: {message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_max_ranges_shown(ranged_frame):
+    """Test the number of ranges shown is limited by max_ranges_shown."""
+
+    expected = ranged_frame()
+    actual = expected.assign(b=[0.0, 1.0, 9.0, 3.0, 9.0, 5.0, 9.0, 7.0, 8.0, 9.0])
+
+    with pytest.raises(
+        AssertionError,
+        match="a - rows not equal, 3 differences\n  modified expected row 2 .*\n  ... and 2 more$",
+    ):
+
+        frh.assert_frame_rows_equal_msg(actual, expected, "a", max_ranges_shown=1)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "change, message",
+    [
+        (
+            lambda frame: frame.drop(columns="c"),
+            "a - columns -\n  Expected: \\['a', 'b', 'c'\\]\n  Actual: \\['a', 'b'\\]",
+        ),
+        (
+            lambda frame: frame.astype({"a": "float64"}),
+            "a - dtypes -",
+        ),
+    ],
+)
+def test_schema_differences(change, message, ranged_frame):
+    """Test an error is raised if the columns or dtypes differ."""
+
+    with pytest.raises(AssertionError, match=message):
+
+        frh.assert_frame_rows_equal_msg(change(ranged_frame()), ranged_frame(), "a")
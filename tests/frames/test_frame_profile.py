@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+try:
+
+    import pandas as pd
+    import numpy as np
+    import test_aide.frames as frh
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+def _example_frame():
+
+    return pd.DataFrame(
+        {
+            "x": [1.0, 2.0, 3.0, 4.0, np.nan],
+            "c": pd.Categorical(["a", "b", "a", None, "a"]),
+            "t": pd.to_datetime(["2020-01-01"] * 4 + [None]),
+        }
+    )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize(
+    "kwargs, error, message",
+    [
+        ({"frame": 1}, TypeError, "frame should be of type pd.DataFrame"),
+        (
+            {"quantiles": [1]},
+            ValueError,
+            "quantiles should be a list or tuple of floats between 0 and 1",
+        ),
+        (
+            {"histogram_bins": 0},
+            ValueError,
+            "histogram_bins should be None or a positive int",
+        ),
+        ({"max_categories": 0}, ValueError, "max_categories should be a positive int"),
+    ],
+)
+def test_argument_errors(kwargs, error, message):
+    """Test an exception is raised for invalid arguments."""
+
+    kwargs = {"frame": _example_frame(), **kwargs}
+
+    with pytest.raises(error, match=message):
+
+        frh.frame_profile(**kwargs)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_expected_output():
+    """Test the statistics in the profile of each kind of column."""
+
+    profile = frh.frame_profile(
+        _example_frame(), quantiles=(0.5,), histogram_bins=2, max_categories=1
+    )
+
+    expected = {
+        "n_rows": 5,
+        "columns": {
+            "x": {
+                "dtype": "float64",
+                "nulls": 1,
+                "min": 1.0,
+                "max": 4.0,
+                "mean": 2.5,
+                "std": 1.118033988749895,
+                "skew": 0.0,
+                "kurtosis": -1.36,
+                "quantiles": {"0.5": 2.5},
+                "histogram": {"edges": [1.0, 2.5, 4.0], "counts": [2, 2]},
+            },
+            "c": {
+                "dtype": "category",
+                "nulls": 1,
+                "frequencies": {"a": 3, "<other>": 1},
+            },
+            "t": {"dtype": "datetime64[ns]", "nulls": 1},
+        },
+    }
+
+    assert (
+        profile == expected
+    ), f"Unexpected profile -\n  Expected: {expected}\n  Actual: {profile}"
+
+    assert (
+        json.loads(json.dumps(profile)) == profile
+    ), "profile does not round trip through json"
@@ -0,0 +1,267 @@
+import inspect
+
+import pytest
+
+import test_aide.classes as ch
+import test_aide.equality as eh
+import test_aide.functions as fh
+import test_aide.metrics as mh
+
+try:
+
+    import pandas as pd
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    """Make sure each test starts and ends with metrics disabled and empty."""
+
+    mh.disable()
+    mh.reset()
+
+    yield
+
+    mh.disable()
+    mh.reset()
+
+
+def test_disabled_by_default_nothing_recorded():
+    """Test that nothing is recorded when metrics are not enabled."""
+
+    eh.assert_equal_dispatch([1, 2], [1, 2], "test_msg")
+
+    ch.assert_inheritance(1, int)
+
+    assert mh.get_metrics() == {
+        "handlers": {},
+        "helpers": {},
+        "nodes": 0,
+        "bytes": 0,
+        "seconds": 0.0,
+        "slowest": [],
+    }, "metrics recorded while disabled"
+
+
+def test_record_returns_shared_null_context_when_disabled():
+    """Test that record returns the same no-op context manager when metrics are disabled."""
+
+    assert mh.record("a") is mh.record("b"), "record did not return shared context"
+
+
+def test_handler_calls_recorded():
+    """Test that calls to each assert_equal_dispatch handler are recorded."""
+
+    mh.enable()
+
+    eh.assert_equal_dispatch({"a": [1, 2], "b": "x"}, {"a": [1, 2], "b": "x"}, "m")
+
+    metrics = mh.get_metrics()
+
+    calls = {name: values["calls"] for name, values in metrics["handlers"].items()}
+
+    assert calls == {
+        "dict": 1,
+        "list": 1,
+        "scalar": 3,
+    }, f"Unexpected handler calls -\n  Expected: {{'dict': 1, 'list': 1, 'scalar': 3}}\n  Actual: {calls}"
+
+    assert (
+        metrics["nodes"] == 5
+    ), f"Unexpected number of nodes -\n  Expected: 5\n  Actual: {metrics['nodes']}"
+
+
+def test_failing_comparison_recorded():
+    """Test that a call is recorded even if the comparison fails."""
+
+    mh.enable()
+
+    with pytest.raises(AssertionError):
+
+        eh.assert_equal_dispatch(1, 2, "m")
+
+    assert (
+        mh.get_metrics()["handlers"]["scalar"]["calls"] == 1
+    ), "failing comparison not recorded"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_bytes_recorded():
+    """Test the bytes of pandas data compared is recorded."""
+
+    mh.enable()
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    eh.assert_equal_dispatch(df, df.copy(), "m")
+
+    expected_bytes = 2 * int(df.memory_usage(index=True, deep=False).sum())
+
+    assert (
+        mh.get_metrics()["bytes"] == expected_bytes
+    ), f"Unexpected bytes -\n  Expected: {expected_bytes}\n  Actual: {mh.get_metrics()['bytes']}"
+
+
+def test_slowest_kept(mocker):
+    """Test that only the n slowest comparisons are kept, slowest first."""
+
+    mh.enable(n_slowest=2)
+
+    for seconds, msg_tag in [(1.0, "a"), (3.0, "b"), (2.0, "c"), (0.5, "d")]:
+
+        mh._enter()
+        mh._record_handler("scalar", msg_tag, seconds, 0)
+
+    slowest = [(x["msg_tag"], x["seconds"]) for x in mh.get_metrics()["slowest"]]
+
+    assert slowest == [
+        ("b", 3.0),
+        ("c", 2.0),
+    ], f"Unexpected slowest comparisons -\n  Expected: [('b', 3.0), ('c', 2.0)]\n  Actual: {slowest}"
+
+
+def test_helpers_recorded(mocker):
+    """Test that calls to classes and functions helpers are recorded."""
+
+    mh.enable()
+
+    ch.assert_inheritance(1, int)
+
+    fh.test_function_arguments(lambda a, b=1: None, ["a", "b"], (1,))
+
+    with fh.assert_function_call_count(mocker, eh, "assert_equal_msg", 0):
+
+        pass
+
+    calls = {
+        name: values["calls"] for name, values in mh.get_metrics()["helpers"].items()
+    }
+
+    expected = {
+        "classes.assert_inheritance": 1,
+        "classes.check_is_class": 1,
+        "functions.test_function_arguments": 1,
+        "functions.assert_function_call_count": 1,
+    }
+
+    assert (
+        calls == expected
+    ), f"Unexpected helper calls -\n  Expected: {expected}\n  Actual: {calls}"
+
+
+def test_recorded_keeps_arguments():
+    """Test that functions decorated with recorded keep their arguments and default values."""
+
+    @mh.recorded("a")
+    def func(a, b=1, *args, c=2, **kwargs):
+
+        return a
+
+    arg_spec = inspect.getfullargspec(func)
+
+    expected = inspect.FullArgSpec(
+        args=["a", "b"],
+        varargs="args",
+        varkw="kwargs",
+        defaults=(1,),
+        kwonlyargs=["c"],
+        kwonlydefaults={"c": 2},
+        annotations={},
+    )
+
+    assert (
+        arg_spec == expected
+    ), f"Unexpected argspec -\n  Expected: {expected}\n  Actual: {arg_spec}"
+
+    assert func.__name__ == "func", "name of decorated function not kept"
+
+
+def test_recorded_calls(mocker):
+    """Test that calls to functions decorated with recorded are recorded only when metrics
+    are enabled, including calls that raise.
+    """
+
+    @mh.recorded("a")
+    def func(a):
+
+        if a is None:
+
+            raise ValueError("a is None")
+
+        return a
+
+    assert func(1) == 1, "Unexpected return value from decorated function"
+
+    assert mh.get_metrics()["helpers"] == {}, "call recorded while disabled"
+
+    mh.enable()
+
+    func(1)
+
+    with pytest.raises(ValueError, match="a is None"):
+
+        func(None)
+
+    with fh.assert_function_call(
+        mocker, eh, "assert_equal_msg", {0: {"args": (1,), "kwargs": {}}}
+    ):
+
+        eh.assert_equal_msg(1)
+
+    calls = {
+        name: values["calls"] for name, values in mh.get_metrics()["helpers"].items()
+    }
+
+    expected = {"a": 2, "functions.assert_function_call": 1}
+
+    assert (
+        calls == expected
+    ), f"Unexpected helper calls -\n  Expected: {expected}\n  Actual: {calls}"
+
+
+def test_recording_restores_state():
+    """Test that recording turns metrics on within the context and restores the state on exit."""
+
+    with mh.recording():
+
+        assert mh.is_enabled(), "metrics not enabled within recording"
+
+        eh.assert_equal_dispatch(1, 1, "m")
+
+    assert not mh.is_enabled(), "metrics not disabled after recording"
+
+    assert mh.get_metrics()["nodes"] == 1, "metrics recorded within recording not kept"
+
+
+@pytest.mark.parametrize(
+    "n_slowest, exception", [(1.5, TypeError), ("1", TypeError), (-1, ValueError)]
+)
+def test_enable_errors(n_slowest, exception):
+    """Test that errors are raised for invalid n_slowest values."""
+
+    with pytest.raises(exception, match="n_slowest should be"):
+
+        mh.enable(n_slowest)
+
+
+def test_seconds_only_outermost_calls():
+    """Test that the total seconds only counts the time of the outermost calls."""
+
+    mh.enable()
+
+    mh._enter()
+    mh._enter()
+    mh._record_handler("scalar", "inner", 1.0, 0)
+    mh._record_handler("list", "outer", 1.5, 0)
+
+    mh._enter()
+    mh._record_handler("scalar", "other", 0.25, 0)
+
+    assert (
+        mh.get_metrics()["seconds"] == 1.75
+    ), f"Unexpected total seconds -\n  Expected: 1.75\n  Actual: {mh.get_metrics()['seconds']}"
@@ -0,0 +1,114 @@
+import subprocess
+import sys
+
+import pytest
+import test_aide
+
+try:
+
+    import pandas as pd  # noqa
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+def _run_python(code):
+    """Run code in a fresh python process and return the stripped stdout."""
+
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    return completed.stdout.strip()
+
+
+def test_import_does_not_load_libraries():
+    """Test that importing test_aide does not import the submodules or third party libraries."""
+
+    output = _run_python(
+        "import sys, test_aide\n"
+        "names = ['pandas', 'numpy', 'pytest_mock', 'test_aide.classes', 'test_aide.functions', 'test_aide.equality', 'test_aide.pandas']\n"
+        "print(sorted(name for name in names if name in sys.modules))"
+    )
+
+    assert (
+        output == "[]"
+    ), f"Unexpected modules imported with test_aide -\n  Expected: []\n  Actual: {output}"
+
+
+def test_equality_import_does_not_load_libraries():
+    """Test that using equality on builtin types does not import pandas or numpy."""
+
+    output = _run_python(
+        "import sys, test_aide\n"
+        "test_aide.equality.assert_equal_dispatch({'a': [1, 2.0, float('nan')]}, {'a': [1, 2.0, float('nan')]}, 'msg')\n"
+        "print(sorted(name for name in ['pandas', 'numpy'] if name in sys.modules))"
+    )
+
+    expected = "['numpy']" if test_aide.equality.has_numpy else "[]"
+
+    assert (
+        output == expected
+    ), f"Unexpected libraries imported by equality -\n  Expected: {expected}\n  Actual: {output}"
+
+
+@pytest.mark.parametrize("submodule", ["classes", "functions", "equality", "sql"])
+def test_submodules_loaded_on_access(submodule):
+    """Test that submodules are available as attributes of test_aide."""
+
+    assert submodule in dir(test_aide), f"{submodule} not in dir(test_aide)"
+
+    module = getattr(test_aide, submodule)
+
+    assert (
+        module.__name__ == f"test_aide.{submodule}"
+    ), f"Unexpected module for test_aide.{submodule} -\n  Expected: test_aide.{submodule}\n  Actual: {module.__name__}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("submodule", ["frames", "pandas", "files"])
+def test_pandas_submodule_loaded_on_access(submodule):
+    """Test that the submodules requiring pandas are available if pandas is installed."""
+
+    assert submodule in dir(test_aide), f"{submodule} not in dir(test_aide)"
+
+    assert (
+        getattr(test_aide, submodule).__name__ == f"test_aide.{submodule}"
+    ), f"Unexpected module for test_aide.{submodule}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+@pytest.mark.parametrize("name", test_aide.equality._FRAMES_FUNCTIONS)
+def test_frames_functions_available_from_equality(name):
+    """Test the functions of the frames module are also available from equality."""
+
+    assert name in dir(test_aide.equality), f"{name} not in dir(test_aide.equality)"
+
+    assert getattr(test_aide.equality, name) is getattr(
+        test_aide.frames, name
+    ), f"Unexpected object for test_aide.equality.{name}"
+
+
+def test_equality_import_does_not_load_frames():
+    """Test that importing equality does not import the frames module."""
+
+    output = _run_python(
+        "import sys, test_aide.equality\n" "print('test_aide.frames' in sys.modules)"
+    )
+
+    assert (
+        output == "False"
+    ), f"Unexpected frames module imported by equality -\n  Expected: False\n  Actual: {output}"
+
+
+def test_unknown_attribute_error():
+    """Test that an AttributeError is raised for attributes that do not exist."""
+
+    with pytest.raises(
+        AttributeError, match="module 'test_aide' has no attribute 'not_a_module'"
+    ):
+
+        test_aide.not_a_module
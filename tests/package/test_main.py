@@ -0,0 +1,112 @@
+import subprocess
+import sys
+
+import pytest
+
+from test_aide.__main__ import main
+
+try:
+
+    import pandas as pd
+
+    has_pandas = True
+
+except ModuleNotFoundError:
+
+    has_pandas = False
+
+
+def _write_csv(path, values):
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    pd.DataFrame({"a": values}).to_csv(path, index=False)
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_compare_equal_exit_status(tmp_path, capsys):
+    """Test compare returns 0 and prints a summary when all files are equal."""
+
+    _write_csv(tmp_path / "actual" / "x.csv", [1, 2])
+    _write_csv(tmp_path / "expected" / "x.csv", [1, 2])
+
+    status = main(["compare", str(tmp_path / "actual"), str(tmp_path / "expected")])
+
+    output = capsys.readouterr().out
+
+    expected_output = (
+        "identical  x.csv\n"
+        "compared 1 files: 1 identical, 0 equal, 0 different, 0 missing, 0 extra, 0 error\n"
+    )
+
+    assert status == 0, f"Unexpected exit status -\n  Expected: 0\n  Actual: {status}"
+
+    assert (
+        output == expected_output
+    ), f"Unexpected output -\n  Expected: {expected_output}\n  Actual: {output}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_compare_differences_exit_status(tmp_path, capsys):
+    """Test compare returns 1 and only prints differences with --quiet."""
+
+    _write_csv(tmp_path / "actual" / "x.csv", [1, 2])
+    _write_csv(tmp_path / "expected" / "x.csv", [1, 2])
+    _write_csv(tmp_path / "expected" / "y.csv", [1, 2])
+
+    status = main(
+        [
+            "compare",
+            str(tmp_path / "actual"),
+            str(tmp_path / "expected"),
+            "--quiet",
+            "--processes",
+            "1",
+        ]
+    )
+
+    output = capsys.readouterr().out
+
+    expected_output = (
+        "missing    y.csv\n"
+        "compared 2 files: 1 identical, 0 equal, 0 different, 1 missing, 0 extra, 0 error\n"
+    )
+
+    assert status == 1, f"Unexpected exit status -\n  Expected: 1\n  Actual: {status}"
+
+    assert (
+        output == expected_output
+    ), f"Unexpected output -\n  Expected: {expected_output}\n  Actual: {output}"
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_compare_not_a_directory(tmp_path, capsys):
+    """Test compare exits with status 2 if a directory does not exist."""
+
+    with pytest.raises(SystemExit) as exc_info:
+
+        main(["compare", str(tmp_path / "missing"), str(tmp_path)])
+
+    assert (
+        exc_info.value.code == 2
+    ), f"Unexpected exit status -\n  Expected: 2\n  Actual: {exc_info.value.code}"
+
+    assert "actual_dir should be a directory" in capsys.readouterr().err
+
+
+def test_run_as_module():
+    """Test the command line interface can be run with python -m test_aide."""
+
+    result = subprocess.run(
+        [sys.executable, "-m", "test_aide", "compare", "--help"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert (
+        result.returncode == 0
+    ), f"Unexpected exit status -\n  Expected: 0\n  Actual: {result.returncode}"
+
+    assert result.stdout.startswith(
+        "usage: python -m test_aide compare"
+    ), f"Unexpected help output: {result.stdout}"
@@ -69,3 +69,42 @@ def test_exceptions_raised():
         ph._check_dfs_passed(
             pd.DataFrame({"a": 1}, index=[0]), pd.DataFrame({"a": 1}, index=[1])
         )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_range_index_mismatch_error():
+    """Test that a ValueError is raised if RangeIndexes of the same length describe different ranges."""
+
+    with pytest.raises(
+        ValueError,
+        match=r"expecting indexes for first positional arg and second positional arg to be the same",
+    ):
+
+        ph._check_dfs_passed(
+            pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 2]}, index=[1, 2])
+        )
+
+    with pytest.raises(
+        ValueError,
+        match=r"expecting indexes for first positional arg and second positional arg to be the same",
+    ):
+
+        ph._check_dfs_passed(
+            pd.DataFrame({"a": [1, 2]}, index=pd.RangeIndex(0, 2)),
+            pd.DataFrame({"a": [1, 2]}, index=pd.RangeIndex(0, 4, 2)),
+        )
+
+
+@pytest.mark.skipif(not has_pandas, reason="pandas not installed")
+def test_trivially_equal_indexes_not_compared(mocker):
+    """Test that indexes known to be equal from their structure are not compared element-wise."""
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    spy = mocker.spy(pd.RangeIndex, "__eq__")
+
+    ph._check_dfs_passed(df, df.copy())
+
+    assert (
+        spy.call_count == 0
+    ), f"Unexpected number of element-wise index comparisons -\n  Expected: 0\n  Actual: {spy.call_count}"
@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+TEST_FILE = """
+import test_aide.classes as ch
+import test_aide.equality as eh
+
+
+def test_slow():
+    eh.assert_equal_dispatch(tuple(range(2000)), tuple(range(2000)), "slow_values")
+
+
+def test_fast():
+    eh.assert_equal_dispatch({"a": 1}, {"a": 1}, "fast_values")
+    ch.assert_inheritance(1, int)
+
+
+def test_no_assertions():
+    assert True
+"""
+
+
+@pytest.fixture
+def plugin_pytester(pytester, monkeypatch):
+    """pytester with plugin autoloading disabled, so only the test-aide plugin is loaded
+    (with -p) whether or not the package is installed with its entry points.
+    """
+
+    monkeypatch.setenv("PYTEST_DISABLE_PLUGIN_AUTOLOAD", "1")
+
+    pytester.makepyfile(test_example=TEST_FILE)
+
+    return pytester
+
+
+def test_disabled_by_default(plugin_pytester):
+    """Test that nothing is reported without --test-aide-report."""
+
+    result = plugin_pytester.runpytest("-p", "test_aide.plugin")
+
+    result.assert_outcomes(passed=3)
+
+    assert "test-aide slowest assertions" not in result.stdout.str()
+
+    assert not (plugin_pytester.path / "test-aide-report.json").exists()
+
+
+def test_report_table_and_json(plugin_pytester):
+    """Test the slowest assertions table is printed and the json report is written."""
+
+    result = plugin_pytester.runpytest(
+        "-p", "test_aide.plugin", "--test-aide-report", "--test-aide-slowest=3"
+    )
+
+    result.assert_outcomes(passed=3)
+
+    result.stdout.fnmatch_lines(
+        [
+            "*test-aide slowest assertions*",
+            "*seconds*handler*msg_tag*test",
+            "*list*slow_values*test_example.py::test_slow",
+            "test-aide report written to test-aide-report.json",
+        ]
+    )
+
+    with open(plugin_pytester.path / "test-aide-report.json") as f:
+
+        report = json.load(f)
+
+    nodeids = sorted(test["nodeid"] for test in report["tests"])
+
+    assert nodeids == [
+        "test_example.py::test_fast",
+        "test_example.py::test_slow",
+    ], f"Unexpected tests in report -\n  Expected: test_fast, test_slow\n  Actual: {nodeids}"
+
+    assert (
+        len(report["slowest"]) == 3
+    ), f"Unexpected number of slowest assertions -\n  Expected: 3\n  Actual: {len(report['slowest'])}"
+
+    slow = next(test for test in report["tests"] if test["nodeid"].endswith("slow"))
+
+    assert (
+        slow["nodes"] == 2001
+    ), f"Unexpected number of nodes -\n  Expected: 2001\n  Actual: {slow['nodes']}"
+
+    fast = next(test for test in report["tests"] if test["nodeid"].endswith("fast"))
+
+    assert set(fast["helpers"]) == {
+        "classes.assert_inheritance",
+        "classes.check_is_class",
+    }, f"Unexpected helpers recorded -\n  Actual: {set(fast['helpers'])}"
+
+
+def test_report_json_path_and_memory(plugin_pytester):
+    """Test the json report is written to the given path and includes peak memory."""
+
+    result = plugin_pytester.runpytest(
+        "-p",
+        "test_aide.plugin",
+        "--test-aide-report",
+        "--test-aide-report-json=out.json",
+        "--test-aide-trace-memory",
+    )
+
+    result.assert_outcomes(passed=3)
+
+    with open(plugin_pytester.path / "out.json") as f:
+
+        report = json.load(f)
+
+    for test in report["tests"]:
+
+        assert (
+            type(test["peak_memory"]) is int and test["peak_memory"] > 0
+        ), f"Unexpected peak memory for {test['nodeid']}: {test['peak_memory']}"
+
+
+def test_xdist_results_merged(plugin_pytester):
+    """Test that results from pytest-xdist workers are merged on the controller."""
+
+    pytest.importorskip("xdist")
+
+    result = plugin_pytester.runpytest_subprocess(
+        "-p", "test_aide.plugin", "-p", "xdist", "-n", "2", "--test-aide-report"
+    )
+
+    result.assert_outcomes(passed=3)
+
+    result.stdout.fnmatch_lines(["*list*slow_values*test_example.py::test_slow"])
+
+    with open(plugin_pytester.path / "test-aide-report.json") as f:
+
+        report = json.load(f)
+
+    nodeids = sorted(test["nodeid"] for test in report["tests"])
+
+    assert nodeids == [
+        "test_example.py::test_fast",
+        "test_example.py::test_slow",
+    ], f"Unexpected tests in report -\n  Expected: test_fast, test_slow\n  Actual: {nodeids}"
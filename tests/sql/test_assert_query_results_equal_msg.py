@@ -0,0 +1,302 @@
+import inspect
+import re
+import sqlite3
+
+import pytest
+
+import test_aide.sql as sh
+
+
+def _connection(rows):
+    """In memory sqlite3 database with a table of the given (id, name, value) rows."""
+
+    connection = sqlite3.connect(":memory:")
+
+    connection.execute("CREATE TABLE t (id INTEGER, name TEXT, value REAL)")
+    connection.executemany("INSERT INTO t VALUES (?, ?, ?)", rows)
+
+    return connection
+
+
+def _rows(n_rows=25):
+
+    return [(i, f"n{i % 4}", i * 0.5) for i in range(n_rows)]
+
+
+def test_arguments():
+    """Test arguments for arguments of function."""
+
+    expected_arguments = [
+        "actual",
+        "expected",
+        "msg_tag",
+        "query",
+        "expected_query",
+        "parameters",
+        "expected_parameters",
+        "batch_rows",
+    ]
+
+    expected_default_values = (None, (), None, 10_000)
+
+    arg_spec = inspect.getfullargspec(sh.assert_query_results_equal_msg)
+
+    assert (
+        arg_spec.args == expected_arguments
+    ), f"Unexpected arguments -\n  Expected: {expected_arguments}\n  Actual: {arg_spec.args}"
+
+    assert (
+        arg_spec.defaults == expected_default_values
+    ), f"Unexpected default values -\n  Expected: {expected_default_values}\n  Actual: {arg_spec.defaults}"
+
+
+@pytest.mark.parametrize("batch_rows", [1, 4, 10_000])
+def test_equal_results(batch_rows):
+    """Test no error is raised for equal results, from connections or cursors."""
+
+    actual = _connection(_rows())
+    expected = _connection(list(reversed(_rows())))
+
+    query = "SELECT * FROM t ORDER BY id"
+
+    sh.assert_query_results_equal_msg(
+        actual, expected, "t", query, batch_rows=batch_rows
+    )
+
+    sh.assert_query_results_equal_msg(
+        actual.cursor(), expected.cursor(), "t", query, batch_rows=batch_rows
+    )
+
+
+def test_different_queries_and_parameters():
+    """Test expected_query and expected_parameters are used for expected."""
+
+    actual = _connection(_rows())
+    expected = _connection([(i, name, value * 2) for i, name, value in _rows()])
+
+    sh.assert_query_results_equal_msg(
+        actual,
+        expected,
+        "t",
+        "SELECT id, value FROM t WHERE id < ? ORDER BY id",
+        expected_query="SELECT id, value / 2 AS value FROM t WHERE id < ? ORDER BY id",
+        parameters=(10,),
+    )
+
+    with pytest.raises(AssertionError, match="not equal at row 5, row not in expected"):
+
+        sh.assert_query_results_equal_msg(
+            actual,
+            actual,
+            "t",
+            "SELECT id FROM t WHERE id < ? ORDER BY id",
+            parameters=(10,),
+            expected_parameters=(5,),
+        )
+
+
+def test_nan_values_equal():
+    """Test rows that are not equal by == are compared with assert_equal_dispatch."""
+
+    actual = sqlite3.connect(":memory:")
+    expected = sqlite3.connect(":memory:")
+
+    query = "SELECT 1 AS id, ? AS value"
+
+    for connection in [actual, expected]:
+
+        connection.create_function("nan", 0, lambda: float("nan"))
+
+    sh.assert_query_results_equal_msg(
+        actual, expected, "t", "SELECT 1 AS id, nan() AS value"
+    )
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape("t row 0 column value -\n  Expected: 2\n  Actual: 1"),
+    ):
+
+        sh.assert_query_results_equal_msg(
+            actual, expected, "t", query, parameters=(1,), expected_parameters=(2,)
+        )
+
+
+def test_first_differing_row_and_column():
+    """Test the error gives the row and column of the first difference."""
+
+    rows = _rows()
+    rows[17] = (17, "changed", 8.5)
+    rows[21] = (21, "n1", 0.0)
+
+    actual = _connection(rows)
+    expected = _connection(_rows())
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        sh.assert_query_results_equal_msg(
+            actual, expected, "t", "SELECT * FROM t ORDER BY id", batch_rows=4
+        )
+
+    expected_message = "t row 17 column name -\n  Expected: n1\n  Actual: changed"
+
+    assert (
+        str(exc_info.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {exc_info.value}"
+
+
+@pytest.mark.parametrize(
+    "actual_rows, expected_rows, message",
+    [
+        (
+            8,
+            10,
+            "t - not equal at row 8, row missing from actual -\n  {'id': 8, 'name': 'n0', 'value': 4.0}",
+        ),
+        (
+            10,
+            8,
+            "t - not equal at row 8, row not in expected -\n  {'id': 8, 'name': 'n0', 'value': 4.0}",
+        ),
+    ],
+)
+def test_number_of_rows(actual_rows, expected_rows, message):
+    """Test the first row in only one of the results is reported."""
+
+    with pytest.raises(AssertionError, match=re.escape(message)):
+
+        sh.assert_query_results_equal_msg(
+            _connection(_rows(actual_rows)),
+            _connection(_rows(expected_rows)),
+            "t",
+            "SELECT * FROM t ORDER BY id",
+            batch_rows=3,
+        )
+
+
+def test_columns_differ():
+    """Test an error is raised if the results do not have the same column names."""
+
+    connection = _connection(_rows())
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape("t - columns -\n  Expected: ['id', 'name']\n  Actual: ['id']"),
+    ):
+
+        sh.assert_query_results_equal_msg(
+            connection,
+            connection,
+            "t",
+            "SELECT id FROM t",
+            expected_query="SELECT id, name FROM t",
+        )
+
+
+def test_created_cursors_closed(mocker):
+    """Test cursors created from connections are closed, even if the results differ."""
+
+    actual = _connection(_rows(3))
+    expected = _connection(_rows(4))
+
+    cursors = []
+
+    for connection in [actual, expected]:
+
+        cursor = connection.cursor()
+
+        cursors.append(mocker.Mock(wraps=cursor, description=None))
+
+    class Connection:
+        def __init__(self, cursor):
+
+            self._cursor = cursor
+
+        def cursor(self):
+
+            return self._cursor
+
+    with pytest.raises(ValueError, match="query did not return any results"):
+
+        sh.assert_query_results_equal_msg(
+            Connection(cursors[0]), Connection(cursors[1]), "t", "SELECT * FROM t"
+        )
+
+    for cursor in cursors:
+
+        cursor.close.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    "kwargs, exception, message",
+    [
+        ({"actual": 1}, TypeError, "actual should be a DB-API connection or cursor"),
+        ({"query": 1}, TypeError, "query should be a str"),
+        ({"expected_query": b"q"}, TypeError, "expected_query should be a str or None"),
+        ({"batch_rows": 0}, ValueError, "batch_rows should be a positive int"),
+    ],
+)
+def test_invalid_arguments(kwargs, exception, message):
+    """Test errors raised for invalid arguments."""
+
+    connection = _connection(_rows())
+
+    arguments = {
+        "actual": connection,
+        "expected": connection,
+        "query": "SELECT * FROM t",
+    }
+    arguments.update(kwargs)
+
+    with pytest.raises(exception, match=message):
+
+        sh.assert_query_results_equal_msg(msg_tag="t", **arguments)
+
+
+def test_int_and_float_values():
+    """Test int and float values are equal if their values are, and a later column that
+    differs is reported with its row and column."""
+
+    actual = sqlite3.connect(":memory:")
+    expected = sqlite3.connect(":memory:")
+
+    actual.execute("CREATE TABLE t (x INTEGER, y REAL)")
+    expected.execute("CREATE TABLE t (x REAL, y REAL)")
+
+    actual.executemany("INSERT INTO t VALUES (?, ?)", [(1, 1.5), (2, 3.5)])
+    expected.executemany("INSERT INTO t VALUES (?, ?)", [(1, 1.5), (2, 3.0)])
+
+    with pytest.raises(AssertionError) as exc_info:
+
+        sh.assert_query_results_equal_msg(
+            actual, expected, "t", "SELECT x, y FROM t ORDER BY x"
+        )
+
+    expected_message = "t row 1 column y -\n  Expected: 3.0\n  Actual: 3.5"
+
+    assert (
+        str(exc_info.value) == expected_message
+    ), f"Unexpected error message -\n  Expected: {expected_message}\n  Actual: {exc_info.value}"
+
+    sh.assert_query_results_equal_msg(
+        actual, expected, "t", "SELECT x FROM t ORDER BY x"
+    )
+
+
+def test_values_of_different_types():
+    """Test values of different types that are not equal are reported with their row,
+    column and types."""
+
+    connection = sqlite3.connect(":memory:")
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape("t row 0 column x -\n  Expected: 2 (str)\n  Actual: 2 (int)"),
+    ):
+
+        sh.assert_query_results_equal_msg(
+            connection,
+            connection,
+            "t",
+            "SELECT 2 AS x",
+            expected_query="SELECT '2' AS x",
+        )